@@ -30,6 +30,16 @@ def _import_version( ):
     return module.__version__
 
 
+def _prepare_package( app ):
+    from importlib import import_module
+    module = import_module( 'classcore' )
+    # Package imports some modules on first use; documentation covers all.
+    for name in ( 'conversions', 'prewarming', 'records', 'registries' ):
+        import_module( f"classcore.standard.{name}" )
+    # Package defers assignment of its docstrings to reduce import cost.
+    module.standard.assign_deferred_module_docstrings( )
+
+
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -175,3 +185,11 @@ myst_enable_extensions = [
 # https://www.sphinx-doc.org/en/master/usage/extensions/todo.html#configuration
 
 todo_include_todos = True
+
+# -- Application setup -------------------------------------------------------
+# https://www.sphinx-doc.org/en/master/extdev/appapi.html#sphinx-core-events
+
+
+def setup( app ):
+    ''' Prepares package for documentation once builder is initialized. '''
+    app.connect( 'builder-inited', _prepare_package )
@@ -28,6 +28,35 @@ from .nomina import *
 
 T = typx.TypeVar( 'T', bound = type )
 U = typx.TypeVar( 'U' )
+F = typx.TypeVar( 'F', bound = cabc.Callable[ ..., typx.Any ] )
 
 
 dictproxy_empty: cabc.Mapping[ str, str ] = types.MappingProxyType( { } )
+
+
+def produce_deprecation_decorator(
+    message: str
+) -> cabc.Callable[ [ F ], F ]:
+    ''' Produces decorator which marks functions as deprecated.
+
+        Unlike the backport from 'typing_extensions', does not import
+        'asyncio' to check for coroutine functions on older Pythons.
+    '''
+    def decorate( function: F ) -> F:
+        @funct.wraps( function )
+        def warn_and_call(
+            *posargs: typx.Any, **nomargs: typx.Any
+        ) -> typx.Any:
+            warnings.warn(
+                message, category = DeprecationWarning, stacklevel = 2 )
+            return function( *posargs, **nomargs )
+
+        setattr( warn_and_call, '__deprecated__', message )
+        return typx.cast( F, warn_and_call )
+
+    return decorate
+
+
+if typx.TYPE_CHECKING: # pragma: no cover
+    deprecated = typx.deprecated
+else: deprecated = produce_deprecation_decorator
@@ -44,8 +44,15 @@ fragments: _FragmentsTable = __.types.MappingProxyType( {
     'cfc produce dataclass':
     ''' Produces inheritable dataclasses with keyword-only instantiation. ''',
 
+    'cfc produce enumeration':
+    ''' Produces enumerations with fast lookup of members by value. ''',
+
     'cfc produce protocol class':
-    ''' Produces :pep:`544` protocol classes. ''',
+    ''' Produces :pep:`544` protocol classes with cached runtime checks. ''',
+
+    'cfc produce tupleclass':
+    ''' Produces inheritable tuple-backed records with keyword-only
+        instantiation. Instances are immutable by their layout. ''',
 
     'class concealment':
     ''' By default, non-public class attributes are invisible. ''',
@@ -65,6 +72,10 @@ fragments: _FragmentsTable = __.types.MappingProxyType( {
     'protocol class':
     ''' Protocol class (:pep:`544`). Nominal and structural subtyping. ''',
 
+    'tupleclass':
+    ''' Inheritable tuple-backed record with keyword-only instantiation.
+        Instances are immutable by their layout. ''',
+
     'class dynadoc': ''' Is decorated by Dynadoc. ''',
 
 } )
@@ -0,0 +1,160 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Exceptions from rarely used features of package.
+
+    Provided lazily via :py:mod:`classcore.exceptions`, which is reported as
+    the module of each class, so that references to these classes resolve
+    through it.
+'''
+
+
+from .. import exceptions as _exceptions
+
+
+class ClassRegistrationAbsence( _exceptions.Omnierror, LookupError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, fingerprint: str ):
+        super( ).__init__(
+            f"No class registered with fingerprint {fingerprint!r}." )
+
+
+class ClassRecipeInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, reason: str ):
+        super( ).__init__(
+            f"Could not fingerprint class recipe. Reason: {reason}" )
+
+
+class ConversionInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not convert instance of {target}. Reason: {reason}" )
+
+
+class HashCacheInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not cache hashes of instances of {target}. "
+            f"Reason: {reason}" )
+
+
+class InstancesOptionsInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not apply options to instances of {target}. "
+            f"Reason: {reason}" )
+
+
+class InstanceStateInvalidity( _exceptions.Omnierror, ValueError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not restore state of instance of {target}. "
+            f"Reason: {reason}" )
+
+
+class InterningInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not intern instances of {target}. Reason: {reason}" )
+
+
+class PackingInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not pack fields of {target}. Reason: {reason}" )
+
+
+class PackingValueInvalidity( _exceptions.Omnierror, ValueError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, name: str, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not pack value of field {name!r} of {target}. "
+            f"Reason: {reason}" )
+
+
+class RecordAbsence( _exceptions.Omnierror, IndexError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, index: int, count: int ):
+        super( ).__init__(
+            f"No record at index {index} among {count} records." )
+
+
+class RecordFieldAbsence( _exceptions.Omnierror, LookupError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, name: str, target: str ):
+        super( ).__init__( f"No field {name!r} in records of {target}." )
+
+
+class RecordSchemaInvalidity( _exceptions.Omnierror, TypeError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not use {target} as record class. Reason: {reason}" )
+
+
+class RecordValueInvalidity( _exceptions.Omnierror, ValueError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, name: str, target: str, reason: str ):
+        super( ).__init__(
+            f"Could not encode value of field {name!r} of {target}. "
+            f"Reason: {reason}" )
+
+
+class RecordStoreInvalidity( _exceptions.Omnierror, ValueError ):
+
+    __module__ = _exceptions.__name__
+
+    def __init__( self, location: str, reason: str ):
+        super( ).__init__(
+            f"Could not open record store at {location!r}. "
+            f"Reason: {reason}" )
@@ -23,15 +23,22 @@
 # ruff: noqa: F401
 
 
+import                      abc
 import collections.abc as   cabc
+import                      contextvars
+import                      enum
 import dataclasses as       dcls
 import functools as         funct
 import                      hashlib
 import                      inspect
-import                      platform
+import                      io
+import                      operator
 import                      re
 import                      sys
+import                      threading
 import                      types
+import                      warnings
+import                      weakref
 
 import dynadoc as           ddoc
 import typing_extensions as typx
@@ -66,4 +66,5 @@ __version__ = '1.12a0'
 
 
 standard.finalize_module(
-    __name__, dynadoc_table = __.fragments, recursive = True )
+    __name__,
+    dynadoc_defer = True, dynadoc_table = __.fragments, recursive = True )
@@ -25,12 +25,49 @@ from . import __
 from . import nomina as _nomina
 from . import standard as _standard
 
+if __.typx.TYPE_CHECKING: # pragma: no cover
+    from .__.exceptions import ( # noqa: F401
+        ClassRecipeInvalidity,
+        ClassRegistrationAbsence,
+        ConversionInvalidity,
+        HashCacheInvalidity,
+        InstanceStateInvalidity,
+        InstancesOptionsInvalidity,
+        InterningInvalidity,
+        PackingInvalidity,
+        PackingValueInvalidity,
+        RecordAbsence,
+        RecordFieldAbsence,
+        RecordSchemaInvalidity,
+        RecordStoreInvalidity,
+        RecordValueInvalidity,
+    )
+
 
 exception_mutables_default = (
     '__cause__', '__context__', '__suppress_context__', '__traceback__' )
 exception_visibles_default = (
     *exception_mutables_default, _nomina.is_public_identifier )
 
+# Errors from rarely used features are defined on first access to reduce
+# import cost.
+_lazy_names = frozenset( (
+    'ClassRecipeInvalidity',
+    'ClassRegistrationAbsence',
+    'ConversionInvalidity',
+    'HashCacheInvalidity',
+    'InstanceStateInvalidity',
+    'InstancesOptionsInvalidity',
+    'InterningInvalidity',
+    'PackingInvalidity',
+    'PackingValueInvalidity',
+    'RecordAbsence',
+    'RecordFieldAbsence',
+    'RecordSchemaInvalidity',
+    'RecordStoreInvalidity',
+    'RecordValueInvalidity',
+) )
+
 
 class Omniexception(
     _standard.Object, BaseException,
@@ -63,3 +100,17 @@ class ErrorProvideFailure( Omnierror, RuntimeError ):
     def __init__( self, name: str, reason: str ):
         super( ).__init__(
             f"Could not provide error class {name!r}. Reason: {reason}" )
+
+
+def __getattr__( name: str ) -> __.typx.Any:
+    ''' Provides exception classes which are defined lazily. '''
+    if name not in _lazy_names:
+        raise AttributeError( # noqa: TRY003
+            f"module {__name__!r} has no attribute {name!r}" )
+    from .__ import exceptions
+    return getattr( exceptions, name )
+
+
+def __dir__( ) -> list[ str ]:
+    ''' Lists attributes of module, including lazily defined ones. '''
+    return [ *globals( ), *_lazy_names ]
@@ -24,15 +24,55 @@
 from . import __
 from . import decorators as _decorators
 from . import nomina as _nomina
-from . import utilities as _utilities
+
+
+class _ClassConstruction( __.typx.NamedTuple ):
+    ''' Bookkeeping for class under construction. '''
+
+    classes: list[ type ]
+    state: dict[ str, __.typx.Any ]
+
+
+# Bookkeeping is never stored on the classes under construction, so that
+# threads and tasks can construct classes concurrently.
+_constructions_active: __.contextvars.ContextVar[
+    tuple[ _ClassConstruction, ... ]
+] = __.contextvars.ContextVar(
+    'classcore_constructions_active', default = ( ) )
+_constructions_complete: __.weakref.WeakKeyDictionary[
+    type, _ClassConstruction
+] = __.weakref.WeakKeyDictionary( )
+
+
+def access_class_construction_state(
+    cls: __.typx.Optional[ type ] = None
+) -> __.typx.Optional[ dict[ str, __.typx.Any ] ]:
+    ''' Returns bookkeeping state for construction of class.
+
+        State is available from start of class construction until end of
+        class initialization. If no class is given, then returns state for
+        innermost class construction in current context.
+    '''
+    constructions = _constructions_active.get( )
+    if cls is None:
+        return constructions[ -1 ].state if constructions else None
+    for construction in reversed( constructions ):
+        if cls in construction.classes: return construction.state
+    construction = _constructions_complete.get( cls )
+    return None if construction is None else construction.state
 
 
 def produce_class_constructor(
-    attributes_namer: _nomina.AttributesNamer,
+    attributes_namer: __.typx.Optional[ _nomina.AttributesNamer ] = None,
     preprocessors: _nomina.ClassConstructionPreprocessors[ __.T ] = ( ),
     postprocessors: _nomina.ClassConstructionPostprocessors[ __.T ] = ( ),
 ) -> _nomina.ClassConstructor[ __.T ]:
-    ''' Produces constructors for classes. '''
+    ''' Produces constructors for classes.
+
+        Attributes namer is unused, since bookkeeping is not stored on
+        classes, and is deprecated.
+    '''
+    if attributes_namer is not None: _warn_attributes_namer_deprecation( )
 
     def construct( # noqa: PLR0913, PLR0917
         clscls: type[ __.T ],
@@ -47,30 +87,44 @@ def produce_class_constructor(
         bases_ = list( bases )
         arguments_ = dict( arguments )
         decorators_ = list( decorators )
-        for preprocessor in preprocessors:
-            preprocessor(
-                clscls, name, bases_, namespace, arguments_, decorators_ )
-        cls = superf( clscls, name, tuple( bases_ ), namespace, **arguments_ )
-        # Some decorators create new classes, which invokes this method again.
-        # Short-circuit to prevent recursive decoration and other tangles.
-        progress_name = attributes_namer( 'class', 'in_progress' )
-        progress_name_m = _utilities.mangle_name( cls, progress_name )
-        in_progress = getattr( cls, progress_name_m, False )
-        if in_progress: return cls
-        setattr( cls, progress_name_m, True )
-        for postprocessor in postprocessors: postprocessor( cls, decorators_ )
-        cls = _decorators.apply_decorators( cls, decorators_ )
-        setattr( cls, progress_name_m, False )
+        constructions = _constructions_active.get( )
+        construction = _ClassConstruction( classes = [ ], state = { } )
+        token = _constructions_active.set( ( *constructions, construction ) )
+        try:
+            for preprocessor in preprocessors:
+                preprocessor(
+                    clscls, name, bases_, namespace, arguments_, decorators_ )
+            cls = superf(
+                clscls, name, tuple( bases_ ), namespace, **arguments_ )
+            # Some decorators create new classes, which invokes this method
+            # again. Short-circuit to prevent recursive decoration and other
+            # tangles.
+            if constructions and _is_class_reproduction(
+                constructions[ -1 ], cls, namespace
+            ):
+                constructions[ -1 ].classes.append( cls )
+                return cls
+            construction.classes.append( cls )
+            for postprocessor in postprocessors:
+                postprocessor( cls, decorators_ )
+            cls = _decorators.apply_decorators( cls, decorators_ )
+        finally: _constructions_active.reset( token )
+        _constructions_complete[ cls ] = construction
         return cls
 
     return construct
 
 
 def produce_class_initializer(
-    attributes_namer: _nomina.AttributesNamer,
+    attributes_namer: __.typx.Optional[ _nomina.AttributesNamer ] = None,
     completers: _nomina.ClassInitializationCompleters = ( ),
 ) -> _nomina.ClassInitializer:
-    ''' Produces initializers for classes. '''
+    ''' Produces initializers for classes.
+
+        Attributes namer is unused, since bookkeeping is not stored on
+        classes, and is deprecated.
+    '''
+    if attributes_namer is not None: _warn_attributes_namer_deprecation( )
 
     def initialize(
         cls: type,
@@ -80,11 +134,46 @@ def produce_class_initializer(
     ) -> None:
         ''' Initializes class, applying hooks. '''
         superf( *posargs, **nomargs )
-        progress_name = attributes_namer( 'class', 'in_progress' )
-        progress_name_m = _utilities.mangle_name( cls, progress_name )
-        in_progress = getattr( cls, progress_name_m, False )
-        if in_progress: return # If non-empty, then not top-level.
-        delattr( cls, progress_name_m )
+        # Reproductions are initialized while their originals are still
+        # under construction. Only complete top-level classes.
+        constructions = _constructions_active.get( )
+        if constructions and cls in constructions[ -1 ].classes: return
         for completer in completers: completer( cls )
+        _constructions_complete.pop( cls, None )
 
     return initialize
+
+
+def _is_class_reproduction(
+    construction: _ClassConstruction,
+    cls: type,
+    namespace: __.cabc.Mapping[ str, __.typx.Any ],
+) -> bool:
+    if not construction.classes: return False
+    original = construction.classes[ -1 ]
+    if (    type( cls ) is not type( original )
+        or  cls.__bases__ != original.__bases__
+    ): return False
+    # Reproductions are produced from copies of dictionaries of their
+    # originals, with new slots, which replace instance attributes and
+    # dataclass fields. Class statements always supply qualified names,
+    # which class dictionaries lack.
+    dictionary = original.__dict__
+    if not all(
+        name == '__slots__'
+        or ( name in dictionary and dictionary[ name ] is value )
+        for name, value in namespace.items( )
+    ): return False
+    slots: __.cabc.Iterable[ str ] = namespace.get( '__slots__', ( ) )
+    if isinstance( slots, str ): slots = ( slots, )
+    removables: set[ str ] = {
+        '__dict__', '__slots__', '__weakref__', *slots,
+        *getattr( original, '__dataclass_fields__', ( ) ) }
+    return all(
+        name in namespace or name in removables for name in dictionary )
+
+
+def _warn_attributes_namer_deprecation( ) -> None:
+    __.warnings.warn(
+        "Argument 'attributes_namer' is unused and deprecated.",
+        category = DeprecationWarning, stacklevel = 3 )
@@ -20,13 +20,17 @@
 
 ''' Common constants, imports, and utilities. '''
 
-# ruff: noqa: F403
+# ruff: noqa: F403, F405
 
 
 from ..__ import *
 from ..nomina import is_public_identifier
 
 
+_classvar_regex = re.compile( r'''^(?:[\w.]+\.)?ClassVar\b''' )
+_prewarmers: dict[ str, cabc.Callable[ [ type ], bool ] ] = { }
+
+
 def provide_error_class( name: str ) -> type[ Exception ]:
     ''' Produces error class for this package. '''
     match name:
@@ -38,5 +42,42 @@ def provide_error_class( name: str ) -> type[ Exception ]:
     return error
 
 
+def is_class_variable( annotation: typx.Any ) -> bool:
+    ''' Is annotation of class variable rather than of instance attribute? '''
+    if isinstance( annotation, typx.ForwardRef ):
+        annotation = annotation.__forward_arg__
+    if isinstance( annotation, str ):
+        return _classvar_regex.match( annotation ) is not None
+    return typx.get_origin( annotation ) is typx.ClassVar or (
+        annotation is typx.ClassVar )
+
+
+def is_hashable( objct: object ) -> bool:
+    ''' Can object be hashed? '''
+    try: hash( objct )
+    except TypeError: return False
+    return True
+
+
+def register_prewarmer(
+    name: str, prewarmer: cabc.Callable[ [ type ], bool ]
+) -> None:
+    ''' Registers function which materializes cache entries for class.
+
+        Prewarming calls each registered function with each visited class
+        and counts, by name, the classes for which it returns true. Modules
+        register functions for their caches when they are imported, so that
+        caches of modules, which are not imported, are not materialized.
+    '''
+    _prewarmers[ name ] = prewarmer
+
+
+def survey_prewarmers( ) -> cabc.Mapping[
+    str, cabc.Callable[ [ type ], bool ]
+]:
+    ''' Returns registered functions which materialize cache entries. '''
+    return types.MappingProxyType( _prewarmers )
+
+
 mutables_default = ( )
 visibles_default = ( is_public_identifier, )
@@ -44,9 +44,53 @@
 '''
 
 
+from . import __
 from . import dynadoc
 from . import nomina
 
 from .classes import *
 from .decorators import *
 from .modules import *
+
+if __.typx.TYPE_CHECKING: # pragma: no cover
+    from .conversions import *
+    from .prewarming import *
+    from .records import *
+    from .registries import *
+
+
+# Rarely used submodules are imported on first access to their members.
+_lazy_attributes: __.cabc.Mapping[ str, str ] = __.types.MappingProxyType( {
+    'PrewarmReport': 'prewarming',
+    'RecordBatch': 'records',
+    'RecordCodec': 'records',
+    'RecordStore': 'records',
+    'SharedRecordStore': 'records',
+    'access_class_fingerprint': 'registries',
+    'asdict': 'conversions',
+    'astuple': 'conversions',
+    'calculate_class_fingerprint': 'registries',
+    'open_record_store': 'records',
+    'prewarm': 'prewarming',
+    'produce_class': 'registries',
+    'produce_record_codec': 'records',
+    'restore_class': 'registries',
+    'share_records': 'records',
+    'write_record_store': 'records',
+} )
+
+
+def __getattr__( name: str ) -> __.typx.Any:
+    ''' Provides members of lazily imported submodules. '''
+    try: module_name = _lazy_attributes[ name ]
+    except KeyError:
+        raise AttributeError( # noqa: TRY003
+            f"module {__name__!r} has no attribute {name!r}" ) from None
+    from importlib import import_module
+    module = import_module( f"{__name__}.{module_name}" )
+    return getattr( module, name )
+
+
+def __dir__( ) -> list[ str ]:
+    ''' Lists attributes of module, including lazily imported ones. '''
+    return [ *globals( ), *_lazy_attributes ]
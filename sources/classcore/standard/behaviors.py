@@ -23,9 +23,19 @@
 #       Maybe enum for mutability and visibility.
 
 
+from .. import factories as _factories
 from .. import utilities as _utilities
 from . import __
+from . import dynadoc as _dynadoc
 from . import nomina as _nomina
+from . import protocols as _protocols
+
+
+_sealings_mutex = __.threading.RLock( )
+# Pending sealers by class. Empty while sealing is in progress.
+_sealings_pending: __.weakref.WeakKeyDictionary[
+    type, _nomina.ClassSealers
+] = __.weakref.WeakKeyDictionary( )
 
 
 def access_core_function( # noqa: PLR0913
@@ -195,6 +205,50 @@ def augment_class_attributes_allocations(
     namespace[ '__slots__' ] = slots_
 
 
+def access_class_construction_arguments(
+    cls: type, /, *, attributes_namer: _nomina.AttributesNamer
+) -> __.typx.Optional[ dict[ str, __.typx.Any ] ]:
+    ''' Returns metaclass arguments captured during class construction.
+
+        Arguments are available until class initialization completes.
+    '''
+    state = _factories.access_class_construction_state( cls )
+    if state is None: return None
+    arguments_name = attributes_namer( 'class', 'construction_arguments' )
+    return state.get( arguments_name )
+
+
+def capture_class_construction_arguments(
+    attributes_namer: _nomina.AttributesNamer,
+    state: dict[ str, __.typx.Any ],
+    arguments: dict[ str, __.typx.Any ],
+) -> None:
+    ''' Captures metaclass arguments in construction state for later use.
+
+        Class under construction is not mutated.
+    '''
+    arguments_name = attributes_namer( 'class', 'construction_arguments' )
+    arguments_: dict[ str, __.typx.Any ] = { }
+    for name in (
+        'class_mutables', 'class_visibles',
+        'dynadoc_configuration',
+        'instances_assigner_core',
+        'instances_deleter_core',
+        'instances_surveyor_core',
+        'instances_hash_cache',
+        'instances_ignore_init_arguments',
+        'instances_intern',
+        'instances_mutables',
+        'instances_packed',
+        'instances_slots',
+        'instances_visibles',
+        'sealing_defer',
+    ):
+        if name not in arguments: continue
+        arguments_[ name ] = arguments.pop( name )
+    state[ arguments_name ] = arguments_
+
+
 def classify_behavior_exclusion_verifiers(
     verifiers: _nomina.BehaviorExclusionVerifiers
 ) -> tuple[
@@ -232,9 +286,14 @@ def produce_class_construction_preprocessor(
         arguments: dict[ str, __.typx.Any ],
         decorators: _nomina.DecoratorsMutable[ __.U ],
     ) -> None:
-        record_class_construction_arguments(
-            attributes_namer, namespace, arguments )
-        if '__slots__' in namespace:
+        state = _factories.access_class_construction_state( )
+        if state is None: state = { } # pragma: no cover
+        capture_class_construction_arguments(
+            attributes_namer, state, arguments )
+        # Tuple layouts cannot be extended by behaviors slot.
+        if _is_tupleclass_production( clscls, bases ):
+            namespace.setdefault( '__slots__', ( ) )
+        elif '__slots__' in namespace:
             augment_class_attributes_allocations( attributes_namer, namespace )
 
     return preprocess
@@ -245,7 +304,6 @@ def produce_class_construction_postprocessor(
     error_class_provider: _nomina.ErrorClassProvider,
 ) -> _nomina.ClassConstructionPostprocessor[ __.U ]:
     ''' Produces construction processor which determines class decorators. '''
-    arguments_name = attributes_namer( 'class', 'construction_arguments' )
     cores_default = dict(
         assigner = assign_attribute_if_mutable,
         deleter = delete_attribute_if_mutable,
@@ -254,34 +312,31 @@ def produce_class_construction_postprocessor(
     def postprocess(
         cls: type, decorators: _nomina.DecoratorsMutable[ __.U ]
     ) -> None:
-        arguments = getattr( cls, arguments_name, { } )
+        arguments = access_class_construction_arguments(
+            cls, attributes_namer = attributes_namer ) or { }
+        _seal_bases_unless_deferred( cls, attributes_namer, arguments )
         clscls = type( cls )
-        dcls_spec = getattr( cls, '__dataclass_transform__', None )
-        if not dcls_spec: # either base class or metaclass may be marked
-            dcls_spec = getattr( clscls, '__dataclass_transform__', None )
-        cores = { }
-        for core_name in ( 'assigner', 'deleter', 'surveyor' ):
-            core_function = access_core_function(
+        cores = {
+            core_name: access_core_function(
                 cls,
                 attributes_namer = attributes_namer,
                 arguments = arguments,
                 level = 'instances', name = core_name,
-                default = cores_default[ core_name ] )
-            cores[ core_name ] = core_function
+                default = core_default )
+            for core_name, core_default in cores_default.items( ) }
         instances_mutables = arguments.get(
             'instances_mutables', __.mutables_default )
         instances_visibles = arguments.get(
             'instances_visibles', __.visibles_default )
         instances_ignore_init_arguments = arguments.get(
             'instances_ignore_init_arguments', False )
-        if dcls_spec and dcls_spec.get( 'kw_only_default', False ):
-            from .decorators import dataclass_with_standard_behaviors
-            decorator_factory = dataclass_with_standard_behaviors
-            if not dcls_spec.get( 'frozen_default', True ):
-                instances_mutables = instances_mutables or '*'
-        else:
-            from .decorators import with_standard_behaviors
-            decorator_factory = with_standard_behaviors
+        options = {
+            option_name: _access_instances_option(
+                cls, attributes_namer, arguments, option_name )
+            for option_name in ( 'hash_cache', 'intern', 'packed', 'slots' ) }
+        decorator_factory, mutable = (
+            _select_instances_decorator_factory( cls ) )
+        if mutable: instances_mutables = instances_mutables or '*'
         decorator: _nomina.Decorator[ __.U ] = decorator_factory(
             attributes_namer = attributes_namer,
             error_class_provider = error_class_provider,
@@ -293,7 +348,11 @@ def produce_class_construction_postprocessor(
                 _nomina.SurveyorCore, cores[ 'surveyor' ] ),
             ignore_init_arguments = instances_ignore_init_arguments,
             mutables = instances_mutables,
-            visibles = instances_visibles )
+            visibles = instances_visibles,
+            **options )
+        if __.typx.is_protocol( cls ):
+            decorator = _protocols.produce_members_declarations_recorder(
+                attributes_namer, decorator )
         decorators.append( decorator )
         # Dynadoc tracks objects in weakset.
         # Must decorate after any potential class replacements.
@@ -302,7 +361,8 @@ def produce_class_construction_postprocessor(
             dynadoc_cfg_name = (
                 attributes_namer( 'classes', 'dynadoc_configuration' ) )
             dynadoc_cfg = getattr( clscls, dynadoc_cfg_name, { } )
-        decorators.append( __.ddoc.with_docstring( **dynadoc_cfg ) )
+        decorators.append(
+            _dynadoc.produce_class_docstring_decorator( dynadoc_cfg ) )
 
     return postprocess
 
@@ -311,33 +371,74 @@ def produce_class_initialization_completer(
     attributes_namer: _nomina.AttributesNamer
 ) -> _nomina.ClassInitializationCompleter:
     ''' Produces initialization completer which finalizes class behaviors. '''
-    arguments_name = attributes_namer( 'class', 'construction_arguments' )
+    deferral_name = attributes_namer( 'class', 'sealing_defer' )
 
     def complete( cls: type ) -> None:
-        arguments: __.typx.Optional[ dict[ str, __.typx.Any ] ] = (
-            getattr( cls, arguments_name, None ) )
-        if arguments is not None: delattr( cls, arguments_name )
-        arguments = arguments or { }
+        arguments = access_class_construction_arguments(
+            cls, attributes_namer = attributes_namer ) or { }
         mutables = arguments.get( 'class_mutables', __.mutables_default )
         visibles = arguments.get( 'class_visibles', __.visibles_default )
-        behaviors: set[ str ] = set( )
-        record_behavior(
-            cls, attributes_namer = attributes_namer,
-            level = 'class', basename = 'mutables',
-            label = _nomina.immutability_label, behaviors = behaviors,
-            verifiers = mutables )
-        record_behavior(
-            cls, attributes_namer = attributes_namer,
-            level = 'class', basename = 'visibles',
-            label = _nomina.concealment_label, behaviors = behaviors,
-            verifiers = visibles )
-        # Set behaviors attribute last since it enables enforcement.
-        behaviors_name = attributes_namer( 'class', 'behaviors' )
-        _utilities.setattr0( cls, behaviors_name, frozenset( behaviors ) )
+        if __.typx.is_protocol( cls ):
+            _protocols.repair_protocol_members(
+                cls, attributes_namer = attributes_namer )
+
+        def seal( ) -> None:
+            behaviors: set[ str ] = set( )
+            record_behavior(
+                cls, attributes_namer = attributes_namer,
+                level = 'class', basename = 'mutables',
+                label = _nomina.immutability_label, behaviors = behaviors,
+                verifiers = mutables )
+            record_behavior(
+                cls, attributes_namer = attributes_namer,
+                level = 'class', basename = 'visibles',
+                label = _nomina.concealment_label, behaviors = behaviors,
+                verifiers = visibles )
+            # Set behaviors attribute last since it enables enforcement.
+            behaviors_name = attributes_namer( 'class', 'behaviors' )
+            _utilities.setattr0( cls, behaviors_name, frozenset( behaviors ) )
+
+        deferral = is_class_sealing_deferred(
+            cls, attributes_namer = attributes_namer, arguments = arguments )
+        if deferral != getattr( cls, deferral_name, False ):
+            setattr( cls, deferral_name, deferral ) # heritable
+        if not deferral:
+            seal( )
+            return
+        defer_class_sealing(
+            cls, ( *arguments.get( 'instances_sealers', ( ) ), seal ) )
 
     return complete
 
 
+def defer_class_sealing(
+    cls: type, sealers: _nomina.ClassSealers
+) -> None:
+    ''' Registers sealers to run on first use of class. '''
+    with _sealings_mutex: _sealings_pending[ cls ] = tuple( sealers )
+
+
+def is_class_sealing_pending( cls: type ) -> bool:
+    ''' Is class awaiting deferred sealing? '''
+    return bool( _sealings_pending.get( cls ) )
+
+
+def is_class_sealing_deferred(
+    cls: type, /, *,
+    attributes_namer: _nomina.AttributesNamer,
+    arguments: __.cabc.Mapping[ str, __.typx.Any ],
+) -> bool:
+    ''' Is sealing of class deferred until its first use?
+
+        First checks for metaclass argument, then checks for heritable
+        attribute.
+    '''
+    deferral = arguments.get( 'sealing_defer' )
+    if deferral is not None: return bool( deferral )
+    deferral_name = attributes_namer( 'class', 'sealing_defer' )
+    return bool( getattr( cls, deferral_name, False ) )
+
+
 def record_behavior( # noqa: PLR0913
     cls: type, /, *,
     attributes_namer: _nomina.AttributesNamer,
@@ -375,31 +476,56 @@ def record_behavior( # noqa: PLR0913
     behaviors.add( label )
 
 
+@__.deprecated( "Use 'capture_class_construction_arguments' instead." )
 def record_class_construction_arguments(
     attributes_namer: _nomina.AttributesNamer,
     namespace: dict[ str, __.typx.Any ],
     arguments: dict[ str, __.typx.Any ],
 ) -> None:
-    ''' Captures metaclass arguments as class attribute for later use. '''
-    arguments_name = attributes_namer( 'class', 'construction_arguments' )
-    arguments_ = namespace.get( arguments_name, { } )
-    # Decorators, which replace classes, will cause construction of the
-    # replacements without arguments. If we had previously recorded them in
-    # the class namespace, then we do not want to clobber them.
-    if arguments_: return
-    arguments_ = { }
-    for name in (
-        'class_mutables', 'class_visibles',
-        'dynadoc_configuration',
-        'instances_assigner_core',
-        'instances_deleter_core',
-        'instances_surveyor_core',
-        'instances_ignore_init_arguments',
-        'instances_mutables', 'instances_visibles',
-    ):
-        if name not in arguments: continue
-        arguments_[ name ] = arguments.pop( name )
-    namespace[ arguments_name ] = arguments_
+    ''' Captures metaclass arguments for later use.
+
+        Arguments are captured in state of innermost class construction, if
+        any, else in class namespace, as formerly.
+    '''
+    state = _factories.access_class_construction_state( )
+    capture_class_construction_arguments(
+        attributes_namer, namespace if state is None else state, arguments )
+
+
+def seal_class( cls: type ) -> None:
+    ''' Materializes behaviors of class, if sealing was deferred.
+
+        Bases of class are sealed first. Safe to call from multiple threads;
+        sealing happens exactly once.
+    '''
+    if not _sealings_pending or cls not in _sealings_pending: return
+    with _sealings_mutex:
+        sealers = _sealings_pending.get( cls )
+        if not sealers: return # already sealed or sealing on this thread
+        _sealings_pending[ cls ] = ( )
+        try:
+            for base in cls.__mro__[ 1 : ]: seal_class( base )
+            for sealer in sealers: sealer( )
+        except BaseException:
+            _sealings_pending[ cls ] = sealers
+            raise
+        del _sealings_pending[ cls ]
+
+
+def _access_instances_option(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    arguments: __.cabc.Mapping[ str, __.typx.Any ],
+    basename: str,
+) -> bool:
+    # Metaclass argument first, then heritable attribute.
+    option_name = attributes_namer( 'instances', basename )
+    option = arguments.get( f"instances_{basename}" )
+    if option is None: return bool( getattr( cls, option_name, False ) )
+    option = bool( option )
+    if option != getattr( cls, option_name, False ):
+        setattr( cls, option_name, option ) # heritable
+    return option
 
 
 def _deduplicate_merge_sequences(
@@ -412,3 +538,45 @@ def _deduplicate_merge_sequences(
         if addend in augends_: continue
         result.append( addend )
     return tuple( result )
+
+
+def _is_tupleclass_production(
+    clscls: type, bases: __.cabc.Sequence[ type ]
+) -> bool:
+    if not any( issubclass( base, tuple ) for base in bases ): return False
+    return hasattr( clscls, '__dataclass_transform__' ) or any(
+        hasattr( base, '__dataclass_transform__' ) for base in bases )
+
+
+def _select_instances_decorator_factory(
+    cls: type
+) -> tuple[ __.cabc.Callable[ ..., _nomina.Decorator[ __.typx.Any ] ], bool ]:
+    # Returns decorator factory and whether instances are mutable by default.
+    dcls_spec = getattr( cls, '__dataclass_transform__', None )
+    if not dcls_spec: # either base class or metaclass may be marked
+        dcls_spec = getattr( type( cls ), '__dataclass_transform__', None )
+    if issubclass( cls, __.enum.Enum ):
+        from .decorators import enum_with_standard_behaviors
+        return enum_with_standard_behaviors, False
+    if dcls_spec and issubclass( cls, tuple ):
+        from .decorators import tupleclass_with_standard_behaviors
+        return tupleclass_with_standard_behaviors, False
+    if dcls_spec and dcls_spec.get( 'kw_only_default', False ):
+        from .decorators import dataclass_with_standard_behaviors
+        return (
+            dataclass_with_standard_behaviors,
+            not dcls_spec.get( 'frozen_default', True ) )
+    from .decorators import with_standard_behaviors
+    return with_standard_behaviors, False
+
+
+def _seal_bases_unless_deferred(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    arguments: __.cabc.Mapping[ str, __.typx.Any ],
+) -> None:
+    if is_class_sealing_deferred(
+        cls, attributes_namer = attributes_namer, arguments = arguments
+    ): return
+    # Eager profiles merge with profiles of bases.
+    for base in cls.__mro__[ 1 : ]: seal_class( base )
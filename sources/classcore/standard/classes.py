@@ -25,13 +25,16 @@ from . import __
 from . import decorators as _decorators
 from . import dynadoc as _dynadoc
 from . import nomina as _nomina
+from . import protocols as _protocols
 
 
 _abc_class_mutables = (
+    '__non_callable_proto_members__',
     '_abc_cache',
     '_abc_negative_cache',
     '_abc_negative_cache_version',
     '_abc_registry',
+    '_is_runtime_protocol',
 )
 _dynadoc_configuration = (
     _dynadoc.produce_dynadoc_configuration( table = __.fragments ) )
@@ -47,10 +50,15 @@ class ClassFactoryExtraArguments( __.typx.TypedDict, total = False ):
     dynadoc_configuration: _nomina.DynadocConfiguration
     instances_assigner_core: _nomina.AssignerCore
     instances_deleter_core: _nomina.DeleterCore
+    instances_hash_cache: bool
     instances_surveyor_core: _nomina.SurveyorCore
     instances_ignore_init_arguments: bool
+    instances_intern: bool
     instances_mutables: _nomina.BehaviorExclusionVerifiersOmni
+    instances_packed: bool
+    instances_slots: bool
     instances_visibles: _nomina.BehaviorExclusionVerifiersOmni
+    sealing_defer: bool
 
 
 @_class_factory( )
@@ -114,6 +122,26 @@ class DataclassMutable( type ):
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@_class_factory( )
+class EnumClass( __.enum.EnumMeta ):
+    ''' Metaclass for standard enumerations. '''
+
+    _dynadoc_fragments_ = (
+        'cfc produce enumeration',
+        'cfc class conceal', 'cfc class protect', 'cfc dynadoc' )
+
+    def __new__( # Typechecker stub.
+        clscls: type[ __.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ], *,
+        decorators: _nomina.Decorators[ __.T ] = ( ),
+        **arguments: __.typx.Unpack[ ClassFactoryExtraArguments ],
+    ) -> __.T:
+        return super( ).__new__(
+            clscls, name, bases, namespace ) # pyright: ignore
+
+
 @_class_factory( )
 class ProtocolClass( type( __.typx.Protocol ) ):
     ''' Metaclass for standard protocol classes. '''
@@ -133,6 +161,8 @@ class ProtocolClass( type( __.typx.Protocol ) ):
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
+    __instancecheck__ = _protocols.check_instance
+
 
 @_class_factory( )
 @__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
@@ -154,6 +184,8 @@ class ProtocolDataclass( type( __.typx.Protocol ) ):
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
+    __instancecheck__ = _protocols.check_instance
+
 
 @_class_factory( )
 @__.typx.dataclass_transform( kw_only_default = True )
@@ -176,6 +208,29 @@ class ProtocolDataclassMutable( type( __.typx.Protocol ) ):
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
+    __instancecheck__ = _protocols.check_instance
+
+
+@_class_factory( )
+@__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
+class Tupleclass( type ):
+    ''' Metaclass for standard tuple-backed records. '''
+
+    _dynadoc_fragments_ = (
+        'cfc produce tupleclass',
+        'cfc class conceal', 'cfc class protect', 'cfc dynadoc',
+        'cfc instance conceal' )
+
+    def __new__( # Typechecker stub.
+        clscls: type[ __.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ], *,
+        decorators: _nomina.Decorators[ __.T ] = ( ),
+        **arguments: __.typx.Unpack[ ClassFactoryExtraArguments ],
+    ) -> __.T:
+        return super( ).__new__( clscls, name, bases, namespace )
+
 
 class Object( metaclass = Class ):
     ''' Standard base class. '''
@@ -211,6 +266,37 @@ class DataclassObjectMutable( metaclass = DataclassMutable ):
         'class instance conceal' )
 
 
+class Enum( __.enum.Enum, metaclass = EnumClass ):
+    ''' Standard base enumeration.
+
+        By default, non-public class attributes are invisible.
+
+        By default, class attributes are immutable.
+
+        Is decorated by Dynadoc.
+    '''
+    # Enumerations reserve sunder names, such as for Dynadoc fragments.
+
+    @classmethod
+    def lookup( cls, value: __.typx.Any ) -> __.typx.Self:
+        ''' Returns member with value.
+
+            Equivalent to calling the enumeration with the value. Subclasses
+            replace this with a faster lookup from a mapping of values to
+            members, which is computed when they are produced.
+        '''
+        return cls( value )
+
+
+class TupleclassObject( tuple[ __.typx.Any, ... ], metaclass = Tupleclass ):
+    ''' Standard base tuple-backed record. '''
+
+    _dynadoc_fragments_ = (
+        'tupleclass',
+        'class concealment', 'class protection', 'class dynadoc',
+        'class instance conceal' )
+
+
 class Protocol(
     __.typx.Protocol,
     metaclass = ProtocolClass,
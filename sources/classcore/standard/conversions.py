@@ -0,0 +1,151 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Conversion of dataclass instances to dictionaries and tuples. '''
+
+
+from .. import utilities as _utilities
+from . import __
+from . import decorators as _decorators
+from . import modules as _modules
+
+
+class _Converter( __.typx.NamedTuple ):
+
+    names: tuple[ str, ... ]
+    access: __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]
+
+
+_converters: __.weakref.WeakKeyDictionary[
+    type, _Converter
+] = __.weakref.WeakKeyDictionary( )
+_scalars_types = frozenset( (
+    bool, bytes, complex, float, int, str, type( None ) ) )
+
+
+def asdict(
+    objct: __.typx.Annotated[
+        __.typx.Any, __.ddoc.Doc( ''' Dataclass instance to convert. ''' )
+    ], /, *,
+    deep: __.typx.Annotated[
+        bool,
+        __.ddoc.Doc(
+            ''' Convert nested dataclass instances and containers? ''' ),
+    ] = True,
+) -> dict[ str, __.typx.Any ]:
+    ''' Converts dataclass instance to dictionary of field values.
+
+        Field names and accessors are computed once per class. Bookkeeping
+        fields of standard dataclasses are omitted.
+
+        In deep mode, nested dataclass instances are converted to
+        dictionaries and lists, tuples, and dictionaries are rebuilt with
+        converted items. Unlike :py:func:`dataclasses.asdict`, other values,
+        including named tuples and container subclasses, are not copied.
+    '''
+    cls: type = objct.__class__
+    names, access = _access_converter( cls )
+    values = access( objct )
+    if not deep: return dict( zip( names, values ) )
+    return dict( zip( names, map( _convert_to_dictionaries, values ) ) )
+
+
+def astuple(
+    objct: __.typx.Annotated[
+        __.typx.Any, __.ddoc.Doc( ''' Dataclass instance to convert. ''' )
+    ], /, *,
+    deep: __.typx.Annotated[
+        bool,
+        __.ddoc.Doc(
+            ''' Convert nested dataclass instances and containers? ''' ),
+    ] = True,
+) -> tuple[ __.typx.Any, ... ]:
+    ''' Converts dataclass instance to tuple of field values.
+
+        Field accessors are computed once per class. Bookkeeping fields of
+        standard dataclasses are omitted.
+
+        In deep mode, nested dataclass instances are converted to tuples and
+        lists, tuples, and dictionaries are rebuilt with converted items.
+        Unlike :py:func:`dataclasses.astuple`, other values, including named
+        tuples and container subclasses, are not copied.
+    '''
+    cls: type = objct.__class__
+    _, access = _access_converter( cls )
+    values = access( objct )
+    if not deep: return values
+    return tuple( map( _convert_to_tuples, values ) )
+
+
+def _access_converter( cls: type ) -> _Converter:
+    return _utilities.access_class_cache(
+        _converters, cls, _produce_converter )
+
+
+def _convert_to_dictionaries( value: __.typx.Any ) -> __.typx.Any:
+    cls: type = value.__class__
+    if cls in _scalars_types: return value
+    if cls is list:
+        return [ _convert_to_dictionaries( item ) for item in value ]
+    if cls is tuple:
+        return tuple( map( _convert_to_dictionaries, value ) )
+    if cls is dict:
+        return {
+            _convert_to_dictionaries( key ): _convert_to_dictionaries( item )
+            for key, item in value.items( ) }
+    if not hasattr( cls, '__dataclass_fields__' ): return value
+    names, access = _access_converter( cls )
+    values = map( _convert_to_dictionaries, access( value ) )
+    return dict( zip( names, values ) )
+
+
+def _convert_to_tuples( value: __.typx.Any ) -> __.typx.Any:
+    cls: type = value.__class__
+    if cls in _scalars_types: return value
+    if cls is list: return [ _convert_to_tuples( item ) for item in value ]
+    if cls is tuple: return tuple( map( _convert_to_tuples, value ) )
+    if cls is dict:
+        return {
+            _convert_to_tuples( key ): _convert_to_tuples( item )
+            for key, item in value.items( ) }
+    if not hasattr( cls, '__dataclass_fields__' ): return value
+    _, access = _access_converter( cls )
+    return tuple( map( _convert_to_tuples, access( value ) ) )
+
+
+def _prewarm_converter( cls: type ) -> bool:
+    if not __.dcls.is_dataclass( cls ): return False
+    _access_converter( cls )
+    return True
+
+
+def _produce_converter( cls: type ) -> _Converter:
+    name = cls.__qualname__
+    if not __.dcls.is_dataclass( cls ):
+        from ..exceptions import ConversionInvalidity
+        raise ConversionInvalidity( name, 'Class is not a dataclass.' )
+    names = _decorators.survey_data_fields_names( cls )
+    access = _utilities.produce_attributes_accessor( names )
+    return _Converter( names = names, access = access )
+
+
+__.register_prewarmer( 'conversions', _prewarm_converter )
+_modules.finalize_module(
+    __name__, dynadoc_defer = True, dynadoc_table = __.fragments )
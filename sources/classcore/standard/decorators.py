@@ -34,9 +34,23 @@ from . import behaviors as _behaviors
 from . import dynadoc as _dynadoc
 from . import nomina as _nomina
 
-
+_copying_methods_names = ( '__copy__', '__deepcopy__' )
 _dataclass_core = __.dcls.dataclass( kw_only = True, slots = True )
 _dynadoc_configuration = _dynadoc.produce_dynadoc_configuration( )
+_pickling_methods_names = (
+    '__getstate__', '__reduce__', '__reduce_ex__', '__setstate__' )
+_profiles_accessors: dict[
+    str,
+    __.weakref.WeakKeyDictionary[
+        type, __.weakref.ref[ __.cabc.Callable[ [ ], __.typx.Any ] ] ],
+] = {
+    label: __.weakref.WeakKeyDictionary( ) for label in (
+        'assembly', 'copying', 'hashing',
+        'interning', 'pickling', 'replacement' ) }
+_protocol_initializers_modules = frozenset( ( 'typing', 'typing_extensions' ) )
+_protocol_initializers_names = frozenset( (
+    '_no_init', '_no_init_or_replace_init' ) )
+_slot_absence = object( )
 
 
 def prepare_dataclass_for_instances(
@@ -44,16 +58,55 @@ def prepare_dataclass_for_instances(
     decorators: _nomina.DecoratorsMutable[ __.U ], /, *,
     attributes_namer: _nomina.AttributesNamer,
 ) -> None:
-    ''' Annotates dataclass in support of instantiation machinery. '''
-    annotations = __.inspect.get_annotations( cls )
+    ''' Annotates dataclass in support of instantiation machinery.
+
+        Deferred annotations (PEP 649 and PEP 749) are not evaluated.
+    '''
     behaviors_name = attributes_namer( 'instance', 'behaviors' )
     # TODO: Only use mangling if not slotted.
     # behaviors_name_ = _utilities.mangle_name( cls, behaviors_name )
     behaviors_name_ = behaviors_name
-    annotations[ behaviors_name_ ] = set[ str ]
-    setattr( cls, '__annotations__', annotations ) # in case of absence
-    setattr( cls, behaviors_name_, __.dcls.field(
-        compare = False, hash = False, init = False, repr = False ) )
+    _add_dataclass_record_field( cls, behaviors_name_, set[ str ] )
+    # Generated initializers and replacers may be bypassed by replacement.
+    if '__init__' in cls.__dict__ or '__replace__' in cls.__dict__: return
+    setattr( cls, attributes_namer( 'instances', 'replacement' ), True )
+
+
+def prepare_dataclass_for_hash_cache(
+    cls: type,
+    decorators: _nomina.DecoratorsMutable[ __.U ], /, *,
+    attributes_namer: _nomina.AttributesNamer,
+) -> None:
+    ''' Annotates dataclass with slot for cached hash of instances.
+
+        Also provides field-wise equality comparison, which short-circuits on
+        identity and on differing cached hashes, unless class defines its own.
+
+        Deferred annotations (PEP 649 and PEP 749) are not evaluated.
+    '''
+    hash_name = attributes_namer( 'instance', 'hash' )
+    _add_dataclass_record_field( cls, hash_name, int )
+    if '__eq__' in cls.__dict__: return
+    marker_name = attributes_namer( 'instances', 'hashing' )
+    equalizer = _produce_fields_equalizer( hash_name )
+    setattr( equalizer, marker_name, True )
+    setattr( cls, '__eq__', equalizer )
+
+
+def prepare_dataclass_for_interning(
+    cls: type,
+    decorators: _nomina.DecoratorsMutable[ __.U ], /, *,
+    attributes_namer: _nomina.AttributesNamer,
+) -> None:
+    ''' Provides identity comparison and hashing for interned dataclass.
+
+        Equal instances of interned dataclasses are identical. Classes, which
+        define their own equality comparisons, retain them.
+    '''
+    if '__eq__' in cls.__dict__: return
+    setattr( cls, '__eq__', object.__eq__ )
+    if '__hash__' not in cls.__dict__:
+        setattr( cls, '__hash__', object.__hash__ )
 
 
 def apply_cfc_core_functions(
@@ -108,7 +161,6 @@ def apply_cfc_constructor(
             error_class_provider = error_class_provider ), )
     constructor: _nomina.ClassConstructor[ __.T ] = (
         _factories.produce_class_constructor(
-            attributes_namer = attributes_namer,
             preprocessors = preprocessors,
             postprocessors = postprocessors ) )
     decorator = produce_class_construction_decorator(
@@ -124,9 +176,7 @@ def apply_cfc_initializer(
         _behaviors.produce_class_initialization_completer(
             attributes_namer = attributes_namer ), )
     initializer = (
-        _factories.produce_class_initializer(
-            attributes_namer = attributes_namer,
-            completers = completers ) )
+        _factories.produce_class_initializer( completers = completers ) )
     decorator = produce_class_initialization_decorator(
         attributes_namer = attributes_namer, initializer = initializer )
     decorator( clscls )
@@ -228,6 +278,8 @@ def produce_instances_inception_decorator( # noqa: PLR0913, PLR0917
     ignore_init_arguments: bool,
     mutables: _nomina.BehaviorExclusionVerifiersOmni,
     visibles: _nomina.BehaviorExclusionVerifiersOmni,
+    hash_cache: bool = False,
+    intern: bool = False,
 ) -> _nomina.Decorator[ __.U ]:
     ''' Produces decorator to inject '__new__' or '__init__' method.
 
@@ -241,6 +293,9 @@ def produce_instances_inception_decorator( # noqa: PLR0913, PLR0917
         assigner = _behaviors.assign_attribute_if_mutable,
         deleter = _behaviors.delete_attribute_if_mutable,
         surveyor = _behaviors.survey_visible_attributes )
+    producers = _calculate_instances_decorators_producers(
+        ignore_init_arguments = ignore_init_arguments,
+        hash_cache = hash_cache, intern = intern )
 
     def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
         for core_name in ( 'assigner', 'deleter', 'surveyor' ):
@@ -253,21 +308,41 @@ def produce_instances_inception_decorator( # noqa: PLR0913, PLR0917
             core_aname = attributes_namer( 'instances', f"{core_name}_core" )
             setattr( cls, core_aname, core_function )
         behaviors: set[ str ] = set( )
-        _behaviors.record_behavior(
-            cls, attributes_namer = attributes_namer,
-            level = 'instances', basename = 'mutables',
-            label = _nomina.immutability_label, behaviors = behaviors,
-            verifiers = mutables )
-        _behaviors.record_behavior(
-            cls, attributes_namer = attributes_namer,
-            level = 'instances', basename = 'visibles',
-            label = _nomina.concealment_label, behaviors = behaviors,
-            verifiers = visibles )
-        decorator = produce_instances_initialization_decorator(
+
+        def seal( ) -> None:
+            _behaviors.record_behavior(
+                cls, attributes_namer = attributes_namer,
+                level = 'instances', basename = 'mutables',
+                label = _nomina.immutability_label, behaviors = behaviors,
+                verifiers = mutables )
+            _behaviors.record_behavior(
+                cls, attributes_namer = attributes_namer,
+                level = 'instances', basename = 'visibles',
+                label = _nomina.concealment_label, behaviors = behaviors,
+                verifiers = visibles )
+
+        arguments = _behaviors.access_class_construction_arguments(
+            cls, attributes_namer = attributes_namer )
+        deferral = arguments is not None and (
+            _behaviors.is_class_sealing_deferred(
+                cls, attributes_namer = attributes_namer,
+                arguments = arguments ) )
+        # Class initialization completer takes custody of deferred sealer.
+        if deferral and arguments is not None:
+            arguments.setdefault( 'instances_sealers', [ ] ).append( seal )
+        else: seal( )
+        cls = produce_instances_initialization_decorator(
             attributes_namer = attributes_namer,
             behaviors = behaviors,
-            ignore_init_arguments = ignore_init_arguments )
-        return decorator( cls )
+            ignore_init_arguments = ignore_init_arguments,
+            sealing_deferred = deferral )( cls )
+        for producer in producers:
+            decorator = producer(
+                attributes_namer = attributes_namer,
+                behaviors = behaviors,
+                sealing_deferred = deferral )
+            cls = decorator( cls )
+        return cls
 
     return decorate
 
@@ -319,21 +394,38 @@ def produce_instances_initialization_decorator(
     attributes_namer: _nomina.AttributesNamer,
     behaviors: __.cabc.MutableSet[ str ],
     ignore_init_arguments: bool,
+    sealing_deferred: bool = False,
 ) -> _nomina.Decorator[ __.U ]:
-    ''' Produces decorator to inject '__init__' method into class. '''
+    ''' Produces decorator to inject '__init__' method into class.
+
+        Protocol classes have no instances of their own, so they receive no
+        initializer, unless arguments must be ignored. Concrete subclasses of
+        protocol classes, which would only reach the protocol placeholder
+        initializer, initialize directly rather than through the MRO.
+    '''
+    terminal_name = attributes_namer( 'instances', 'initializer_terminal' )
+
     def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
         behaviors_name = attributes_namer( 'instance', 'behaviors' )
         original = cls.__dict__.get( '__init__' )
+        if __.typx.is_protocol( cls ) and not ignore_init_arguments:
+            return cls
+        activate = _produce_behaviors_activator(
+            cls, behaviors_name, behaviors )
 
-        if original is None:
+        if original is None and _is_initializer_terminal( cls, terminal_name ):
+            cls.__init__ = _produce_direct_initializer(
+                cls, activate, sealing_deferred, terminal_name )
+
+        elif original is None:
 
             def initialize_with_super(
                 self: object, *posargs: __.typx.Any, **nomargs: __.typx.Any
             ) -> None:
+                if sealing_deferred: _behaviors.seal_class( cls )
                 if ignore_init_arguments: super( cls, self ).__init__( )
                 else: super( cls, self ).__init__( *posargs, **nomargs )
-                _activate_instance_behaviors(
-                    cls, self, behaviors_name, behaviors )
+                activate( self )
 
             cls.__init__ = initialize_with_super
 
@@ -343,10 +435,10 @@ def produce_instances_initialization_decorator(
             def initialize_with_original(
                 self: object, *posargs: __.typx.Any, **nomargs: __.typx.Any
             ) -> None:
+                if sealing_deferred: _behaviors.seal_class( cls )
                 if ignore_init_arguments: original( self )
                 else: original( self, *posargs, **nomargs )
-                _activate_instance_behaviors(
-                    cls, self, behaviors_name, behaviors )
+                activate( self )
 
             cls.__init__ = initialize_with_original
 
@@ -355,6 +447,329 @@ def produce_instances_initialization_decorator(
     return decorate
 
 
+class _SlotsDescriptors( __.typx.NamedTuple ):
+
+    values: tuple[ __.typx.Any, ... ]
+    behaviors: __.typx.Any
+
+
+class _PicklingProfile( __.typx.NamedTuple ):
+
+    slots: tuple[ __.typx.Any, ... ]
+    names: tuple[ str, ... ]
+    store_behaviors: __.cabc.Callable[
+        [ __.typx.Any, frozenset[ str ] ], None ]
+
+
+def produce_instances_pickling_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.MutableSet[ str ],
+    sealing_deferred: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to inject pickling state methods into class.
+
+        State consists only of attribute values, with slotted values in slot
+        order, accompanied by slot names. Restoration of slotted values fails
+        if slot names differ from those of the class, such as after a change
+        of class definition. Active behaviors are not serialized; they are
+        activated once after all values have been restored, bypassing
+        enforcement.
+
+        Classes which customize their pickling are left untouched.
+    '''
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        marker_name = attributes_namer( 'instances', 'pickling' )
+        if _is_replication_customized(
+            cls, _pickling_methods_names, ( marker_name, )
+        ): return cls
+        behaviors_name_m, behaviors_names = (
+            _calculate_behaviors_names( cls, attributes_namer ) )
+        # Cached hashes are not portable across processes.
+        transients = frozenset( ( attributes_namer( 'instance', 'hash' ), ) )
+        excludes = behaviors_names | transients
+        _, access_profile = _produce_profile_access(
+            cls, __.funct.partial(
+                _produce_pickling_profile,
+                cls, behaviors_name_m, behaviors_names, transients ),
+            label = 'pickling' )
+
+        def getstate( self: object ) -> __.typx.Any:
+            profile = access_profile( )
+            return _capture_instance_state(
+                self, profile.slots, profile.names, excludes )
+
+        def setstate( self: object, state: __.typx.Any ) -> None:
+            if sealing_deferred: _behaviors.seal_class( cls )
+            profile = access_profile( )
+            # Instances of subclasses with custom state get verbatim restore.
+            if cls is not type( self ):
+                _restore_instance_state( self, state, profile, frozenset( ) )
+                return
+            if not _restore_slots_values( self, state, profile ):
+                _restore_instance_state( self, state, profile, excludes )
+            profile.store_behaviors( self, frozenset( behaviors ) )
+
+        setattr( cls, '__getstate__', getstate )
+        setattr( cls, '__setstate__', setstate )
+        setattr( cls, marker_name, True )
+        return cls
+
+    return decorate
+
+
+class _InstancesProfile( __.typx.NamedTuple ):
+
+    slots: tuple[ __.typx.Any, ... ]
+    slot_b: __.typx.Any
+    behaviors_names: __.cabc.Set[ str ]
+    behaviors_name_a: str
+    exemptionless: bool
+    transients: __.cabc.Set[ str ]
+
+
+def produce_instances_copying_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.MutableSet[ str ],
+    sealing_deferred: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to inject copying methods into class.
+
+        Instances, which are immutable and have no mutable attributes
+        exemptions, are their own shallow copies. They are also their own
+        deep copies, if all of their attribute values are their own deep
+        copies. Other copies are assembled directly from attribute values,
+        bypassing initialization and enforcement.
+
+        Classes which customize their copying or pickling, or which have
+        custom instance constructors, retain default copying.
+    '''
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        marker_name = attributes_namer( 'instances', 'copying' )
+        if not _is_copying_standard( cls, attributes_namer ):
+            _disinherit_copiers( cls, marker_name )
+            return cls
+        _, access_profile = _produce_profile_access(
+            cls, __.funct.partial(
+                _produce_instances_profile, cls, attributes_namer, behaviors ),
+            sealing_deferred, label = 'copying' )
+
+        def copy( self: __.U ) -> __.U:
+            return _copy_instance( self, cls, access_profile( ) )
+
+        def deepcopy( self: __.U, memo: dict[ int, __.typx.Any ] ) -> __.U:
+            return _deepcopy_instance( self, cls, access_profile( ), memo )
+
+        setattr( cls, '__copy__', copy )
+        setattr( cls, '__deepcopy__', deepcopy )
+        setattr( cls, marker_name, True )
+        return cls
+
+    return decorate
+
+
+class _AssemblyProfile( __.typx.NamedTuple ):
+
+    setters: tuple[
+        __.cabc.Callable[ [ __.typx.Any, __.typx.Any ], None ], ... ]
+    behaviors: frozenset[ str ]
+    store_behaviors: __.cabc.Callable[
+        [ __.typx.Any, frozenset[ str ] ], None ]
+    intern: __.typx.Optional[
+        __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ] ]
+
+
+def produce_instances_assembly_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.MutableSet[ str ],
+    sealing_deferred: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to inject trusted assembler into dataclass.
+
+        The assembler produces instances from sequences of field values,
+        ordered as the dataclass fields less bookkeeping fields. Values are
+        assigned directly, bypassing initialization and enforcement, and
+        behaviors are activated once, as with unpickling. Instances of
+        interning dataclasses are interned.
+    '''
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        if not __.dcls.is_dataclass( cls ): return cls
+        assembler_name = attributes_namer( 'instances', 'assembler' )
+        profile_cache, access_profile = _produce_profile_access(
+            cls, __.funct.partial(
+                _produce_assembly_profile, cls, attributes_namer, behaviors ),
+            sealing_deferred, label = 'assembly' )
+
+        def assemble( values: __.cabc.Iterable[ __.typx.Any ] ) -> __.U:
+            setters, behaviors_, store_behaviors, intern = (
+                profile_cache[ 0 ] if profile_cache else access_profile( ) )
+            instance = object.__new__( cls )
+            for setter, value in zip( setters, values ):
+                setter( instance, value )
+            store_behaviors( instance, behaviors_ )
+            if intern is None: return instance
+            return intern( instance )
+
+        setattr( cls, assembler_name, staticmethod( assemble ) )
+        return cls
+
+    return decorate
+
+
+class _ReplacementProfile( __.typx.NamedTuple ):
+
+    access: __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]
+    setters: __.typx.Optional[ tuple[ __.typx.Any, ... ] ]
+    setters_named: __.cabc.Mapping[ str, __.typx.Any ]
+    resets: tuple[ tuple[ __.typx.Any, __.typx.Any, __.typx.Any ], ... ]
+    initializer_post: __.typx.Optional[ __.cabc.Callable[ ..., None ] ]
+    behaviors: frozenset[ str ]
+    store_behaviors: __.cabc.Callable[
+        [ __.typx.Any, frozenset[ str ] ], None ]
+    intern: __.typx.Optional[
+        __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ] ]
+
+
+def produce_instances_replacement_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.MutableSet[ str ],
+    sealing_deferred: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to inject '__replace__' method into dataclass.
+
+        Replicas are assembled directly from the field values of their
+        originals with only the changed fields assigned anew, bypassing
+        initialization and enforcement. The '__post_init__' method, if any,
+        is invoked on each replica before its behaviors are activated once.
+        Replicas of interning dataclasses are interned.
+
+        Dataclasses, which define their own initializers or replacers, or
+        which have init-only variables, replace via 'dataclasses.replace'.
+    '''
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        marker_name = attributes_namer( 'instances', 'replacement' )
+        if not cls.__dict__.get( marker_name, False ): return cls
+        profile_cache, access_profile = _produce_profile_access(
+            cls, __.funct.partial(
+                _produce_replacement_profile,
+                cls, attributes_namer, behaviors ),
+            sealing_deferred, label = 'replacement' )
+
+        def replace( self: __.U, /, **changes: __.typx.Any ) -> __.U:
+            profile = (
+                profile_cache[ 0 ] if profile_cache else access_profile( ) )
+            if (    profile.setters is None
+                or  cls is not type( self )
+                or  not changes.keys( ) <= profile.setters_named.keys( )
+            ): return __.dcls.replace( self, **changes ) # pyright: ignore
+            return _replace_instance( self, cls, profile, changes )
+
+        setattr( cls, '__replace__', replace )
+        return cls
+
+    return decorate
+
+
+def produce_instances_hashing_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.MutableSet[ str ],
+    sealing_deferred: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to inject hash caching into class.
+
+        Hashes of instances are computed once and cached on the instances.
+        Instances must be immutable, without mutable attributes exemptions,
+        since their hashes must not change while they are in use as keys.
+
+        Dataclasses with field-wise equality hash their comparable fields.
+        Other classes only have hashes cached if they define their own
+        hashers.
+    '''
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        marker_name = attributes_namer( 'instances', 'hashing' )
+        hash_name = attributes_namer( 'instance', 'hash' )
+        hasher = _access_instances_hasher( cls, marker_name )
+        if hasher is None: return cls
+        store = _produce_hash_storer( cls, hash_name )
+        profile_cache, access_profile = _produce_profile_access(
+            cls, __.funct.partial(
+                _produce_instances_profile, cls, attributes_namer, behaviors ),
+            sealing_deferred,
+            label = 'hashing', validator = _validate_hash_cache_profile )
+
+        def hash_( self: object ) -> int:
+            value: __.typx.Optional[ int ] = getattr( self, hash_name, None )
+            if value is not None: return value
+            value = hasher( self )
+            if store is None or cls is not type( self ): return value
+            profile = (
+                profile_cache[ 0 ] if profile_cache else access_profile( ) )
+            # Instances under initialization are not yet immutable.
+            if _is_instance_immutable( self, profile ): store( self, value )
+            return value
+
+        setattr( hash_, '__wrapped__', hasher )
+        setattr( cls, '__hash__', hash_ )
+        setattr( cls, marker_name, True )
+        if not sealing_deferred: access_profile( )
+        return cls
+
+    return decorate
+
+
+def produce_instances_interning_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.MutableSet[ str ],
+    sealing_deferred: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to intern instances of dataclass.
+
+        Construction of an instance, which is equal to a live instance,
+        returns the live instance instead. Live instances are tracked in a
+        weak-value table, keyed by comparable field values, which never
+        outgrows the population of live instances. Unpickled instances are
+        interned too; copies are the instances themselves.
+
+        Instances must be immutable, without mutable attributes exemptions,
+        and their comparable field values must be hashable.
+    '''
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        interner_name = attributes_namer( 'instances', 'interner' )
+        initializer: __.cabc.Callable[ ..., None ] = (
+            getattr( cls, '__init__' ) )
+        intern = _produce_interner( cls )
+        profile_cache, access_profile = _produce_profile_access(
+            cls, __.funct.partial(
+                _produce_instances_profile, cls, attributes_namer, behaviors ),
+            sealing_deferred,
+            label = 'interning', validator = _validate_interning_profile )
+
+        def construct(
+            cls_: type[ __.U ], *posargs: __.typx.Any, **nomargs: __.typx.Any
+        ) -> __.U:
+            # Subclasses without interning construct conventionally.
+            if cls_ is not cls: return object.__new__( cls_ )
+            if not profile_cache: access_profile( )
+            instance = object.__new__( cls_ )
+            initializer( instance, *posargs, **nomargs )
+            return intern( instance )
+
+        def initialize(
+            self: object, *posargs: __.typx.Any, **nomargs: __.typx.Any
+        ) -> None:
+            # Constructed instances are already initialized.
+            if _is_instance_initialized( self, access_profile( ) ): return
+            initializer( self, *posargs, **nomargs )
+
+        setattr( cls, '__new__', staticmethod( construct ) )
+        setattr( cls, '__init__', initialize )
+        setattr( cls, interner_name, staticmethod( intern ) )
+        _inject_interned_replicators( cls, attributes_namer, interner_name )
+        if not sealing_deferred: access_profile( )
+        return cls
+
+    return decorate
+
+
 def produce_attributes_assignment_decorator(
     level: str,
     attributes_namer: _nomina.AttributesNamer,
@@ -364,7 +779,11 @@ def produce_attributes_assignment_decorator(
     ''' Produces decorator to inject '__setattr__' method into class. '''
     def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
         leveli = 'class' if level == 'classes' else level
+        sealable = level == 'classes'
         original = cls.__dict__.get( '__setattr__' )
+        # Protocol classes have no instances of their own to guard.
+        if original is None and level == 'instances' and (
+            __.typx.is_protocol( cls ) ): return cls
         core = _behaviors.access_core_function(
             cls,
             attributes_namer = attributes_namer,
@@ -382,6 +801,7 @@ def produce_attributes_assignment_decorator(
                 if cls is not type( self ):
                     ligation( name, value )
                     return
+                if sealable: _behaviors.seal_class( self ) # pyright: ignore
                 core(
                     self,
                     ligation = ligation,
@@ -403,6 +823,7 @@ def produce_attributes_assignment_decorator(
                 if cls is not type( self ):
                     ligation( name, value )
                     return
+                if sealable: _behaviors.seal_class( self ) # pyright: ignore
                 core(
                     self,
                     ligation = ligation,
@@ -427,7 +848,11 @@ def produce_attributes_deletion_decorator(
     ''' Produces decorator to inject '__delattr__' method into class. '''
     def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
         leveli = 'class' if level == 'classes' else level
+        sealable = level == 'classes'
         original = cls.__dict__.get( '__delattr__' )
+        # Protocol classes have no instances of their own to guard.
+        if original is None and level == 'instances' and (
+            __.typx.is_protocol( cls ) ): return cls
         core = _behaviors.access_core_function(
             cls,
             attributes_namer = attributes_namer,
@@ -443,6 +868,7 @@ def produce_attributes_deletion_decorator(
                 if cls is not type( self ):
                     ligation( name )
                     return
+                if sealable: _behaviors.seal_class( self ) # pyright: ignore
                 core(
                     self,
                     ligation = ligation,
@@ -462,6 +888,7 @@ def produce_attributes_deletion_decorator(
                 if cls is not type( self ):
                     ligation( name )
                     return
+                if sealable: _behaviors.seal_class( self ) # pyright: ignore
                 core(
                     self,
                     ligation = ligation,
@@ -485,7 +912,11 @@ def produce_attributes_surveillance_decorator(
     ''' Produces decorator to inject '__dir__' method into class. '''
     def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
         leveli = 'class' if level == 'classes' else level
+        sealable = level == 'classes'
         original = cls.__dict__.get( '__dir__' )
+        # Protocol classes have no instances of their own to guard.
+        if original is None and level == 'instances' and (
+            __.typx.is_protocol( cls ) ): return cls
         core = _behaviors.access_core_function(
             cls,
             attributes_namer = attributes_namer,
@@ -501,6 +932,7 @@ def produce_attributes_surveillance_decorator(
                 ligation = super( cls, self ).__dir__
                 # Only enforce behaviors at start of MRO.
                 if cls is not type( self ): return ligation( )
+                if sealable: _behaviors.seal_class( self ) # pyright: ignore
                 return core(
                     self,
                     ligation = ligation,
@@ -518,6 +950,7 @@ def produce_attributes_surveillance_decorator(
                 ligation = __.funct.partial( original, self )
                 # Only enforce behaviors at start of MRO.
                 if cls is not type( self ): return ligation( )
+                if sealable: _behaviors.seal_class( self ) # pyright: ignore
                 return core(
                     self,
                     ligation = ligation,
@@ -531,6 +964,76 @@ def produce_attributes_surveillance_decorator(
     return decorate
 
 
+def produce_instances_lookup_decorator( ) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to inject fast lookup of enumeration members.
+
+        Maps hashable values of members to members, once per enumeration.
+        Lookups of other values defer to the enumeration, so that aliases,
+        missing values, and unhashable values behave as when it is called.
+    '''
+
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        # Preserve customizations and members named for lookup.
+        if 'lookup' in cls.__dict__: return cls
+        if 'lookup' in getattr( cls, '__members__', { } ): return cls
+        # Aliases are the same objects as the members, which they alias.
+        members: dict[ __.typx.Any, __.typx.Any ] = {
+            member.value: member
+            for member in getattr( cls, '__members__', { } ).values( )
+            if __.is_hashable( member.value ) }
+        setattr( cls, 'lookup', staticmethod(
+            _produce_members_lookup( cls, members ) ) )
+        return cls
+
+    return decorate
+
+
+def produce_instances_tupling_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    visibles: _nomina.BehaviorExclusionVerifiersOmni,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to make tuple-backed record class.
+
+        Annotated attributes become fields, which access items of tuple.
+        Inherited fields precede new ones. Instantiation is keyword-only.
+    '''
+    behaviors_name = attributes_namer( 'instance', 'behaviors' )
+
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        fields: tuple[ str, ... ] = getattr( cls, '__match_args__', ( ) )
+        defaults: dict[ str, __.typx.Any ] = dict(
+            getattr( getattr( cls, '__new__' ), '__kwdefaults__', None )
+            or { } )
+        annotations = __.typx.get_annotations(
+            cls, format = __.typx.Format.FORWARDREF )
+        for name, annotation in annotations.items( ):
+            if __.is_class_variable( annotation ): continue
+            if name in cls.__dict__: defaults[ name ] = cls.__dict__[ name ]
+            if name not in fields: fields = ( *fields, name )
+            setattr( cls, name, _produce_tuple_item_accessor(
+                fields.index( name ) ) )
+        setattr( cls, '__match_args__', fields )
+        setattr( cls, '__new__', staticmethod(
+            _produce_tupleclass_constructor( cls, fields, defaults ) ) )
+        for name, method in _tupleclass_methods.items( ):
+            # Preserve customizations, but not implementations for tuples.
+            owner = next( (
+                base for base in cls.__mro__ if name in base.__dict__ ),
+                None )
+            if owner in ( None, tuple, object ): setattr( cls, name, method )
+        behaviors: set[ str ] = set( )
+        _behaviors.record_behavior(
+            cls, attributes_namer = attributes_namer,
+            level = 'instances', basename = 'visibles',
+            label = _nomina.concealment_label, behaviors = behaviors,
+            verifiers = visibles )
+        # Layout has no slot for behaviors, so class holds them for instances.
+        _utilities.setattr0( cls, behaviors_name, frozenset( behaviors ) )
+        return cls
+
+    return decorate
+
+
 @__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
 def dataclass_with_standard_behaviors( # noqa: PLR0913, PLR0917
     attributes_namer: _nomina.AttributesNamer = __.calculate_attrname,
@@ -542,6 +1045,10 @@ def dataclass_with_standard_behaviors( # noqa: PLR0913, PLR0917
     ignore_init_arguments: bool = False,
     mutables: _nomina.BehaviorExclusionVerifiersOmni = __.mutables_default,
     visibles: _nomina.BehaviorExclusionVerifiersOmni = __.visibles_default,
+    hash_cache: bool = False,
+    intern: bool = False,
+    packed: bool = False,
+    slots: bool = True, # dataclasses are always slotted
 ) -> _nomina.Decorator[ __.U ]:
     # https://github.com/microsoft/pyright/discussions/10344
     ''' Dataclass decorator factory. '''
@@ -554,14 +1061,159 @@ def dataclass_with_standard_behaviors( # noqa: PLR0913, PLR0917
             surveyor_core = surveyor_core,
             ignore_init_arguments = ignore_init_arguments,
             mutables = mutables,
-            visibles = visibles ) )
+            visibles = visibles,
+            hash_cache = hash_cache,
+            intern = intern ) )
+    class_preparers: list[ _nomina.ClassPreparer ] = [
+        prepare_dataclass_for_instances ]
+    if intern: class_preparers.append( prepare_dataclass_for_interning )
+    if hash_cache: class_preparers.append( prepare_dataclass_for_hash_cache )
     preparers: _nomina.DecorationPreparers[ __.U ] = (
         _produce_instances_decoration_preparers(
             attributes_namer = attributes_namer,
             error_class_provider = error_class_provider,
-            class_preparer = prepare_dataclass_for_instances ) )
+            class_preparers = class_preparers ) )
+    if packed:
+        from .packing import produce_dataclass_packing_decorator
+        dataclass_core = produce_dataclass_packing_decorator(
+            attributes_namer = attributes_namer, weakref_slot = intern )
+    else:
+        dataclass_core = (
+            _dataclass_core_weakref if intern else _dataclass_core )
     return decoration_by(
-        *decorators, _dataclass_core, *decorators_, preparers = preparers )
+        *decorators, dataclass_core, *decorators_, preparers = preparers )
+
+
+def enum_with_standard_behaviors( # noqa: PLR0913, PLR0917
+    attributes_namer: _nomina.AttributesNamer = __.calculate_attrname,
+    error_class_provider: _nomina.ErrorClassProvider = __.provide_error_class,
+    decorators: _nomina.Decorators[ __.U ] = ( ),
+    assigner_core: __.typx.Optional[ _nomina.AssignerCore ] = None,
+    deleter_core: __.typx.Optional[ _nomina.DeleterCore ] = None,
+    surveyor_core: __.typx.Optional[ _nomina.SurveyorCore ] = None,
+    ignore_init_arguments: bool = False,
+    mutables: _nomina.BehaviorExclusionVerifiersOmni = __.mutables_default,
+    visibles: _nomina.BehaviorExclusionVerifiersOmni = __.visibles_default,
+    hash_cache: bool = False,
+    intern: bool = False,
+    packed: bool = False,
+    slots: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Enumeration decorator factory.
+
+        Members are produced and managed by the enumeration machinery, so are
+        neither initialized nor guarded by standard behaviors. Instance
+        options are rejected.
+    '''
+    rejectors: _nomina.Decorators[ __.U ] = _produce_options_rejectors(
+        'enumerations',
+        hash_cache = hash_cache,
+        ignore_init_arguments = ignore_init_arguments,
+        intern = intern,
+        mutables = bool( mutables ),
+        packed = packed,
+        slots = slots,
+        visibles = visibles is not __.visibles_default )
+    return decoration_by(
+        *rejectors, *decorators, produce_instances_lookup_decorator( ) )
+
+
+def produce_instances_assembler(
+    cls: type[ __.U ],
+    attributes_namer: _nomina.AttributesNamer = __.calculate_attrname,
+) -> __.cabc.Callable[ [ __.cabc.Iterable[ __.typx.Any ] ], __.U ]:
+    ''' Produces assembler of dataclass instances from field values.
+
+        Values are ordered as the dataclass fields less bookkeeping fields.
+        Instances of standard dataclasses are assembled directly, bypassing
+        initialization, as with unpickling. Instances of other dataclasses
+        are initialized with the values.
+    '''
+    assembler_name = attributes_namer( 'instances', 'assembler' )
+    assembler = cls.__dict__.get( assembler_name )
+    if assembler is not None: return assembler.__func__
+    names = survey_data_fields_names( cls )
+
+    def assemble( values: __.cabc.Iterable[ __.typx.Any ] ) -> __.U:
+        return cls( **dict( zip( names, values ) ) )
+
+    return assemble
+
+
+def survey_data_fields_names( cls: type ) -> tuple[ str, ... ]:
+    ''' Returns names of dataclass fields, less bookkeeping fields. '''
+    return tuple(
+        field.name for field in __.dcls.fields( cls )
+        if not field.metadata.get( _nomina.record_field_label, False ) )
+
+
+def replace( objct: __.U, /, **changes: __.typx.Any ) -> __.U:
+    ''' Produces replica of dataclass instance with changed fields.
+
+        Standard dataclasses replace efficiently. Other dataclasses replace
+        via 'dataclasses.replace'.
+    '''
+    replacer = getattr( type( objct ), '__replace__', None )
+    if replacer is None:
+        return __.dcls.replace( objct, **changes ) # pyright: ignore
+    return replacer( objct, **changes )
+
+
+def restore_interned_instance(
+    cls: type[ __.U ], state: __.typx.Any, interner_name: str
+) -> __.U:
+    ''' Restores pickled instance and interns it, if class interns. '''
+    instance = object.__new__( cls )
+    getattr( instance, '__setstate__' )( state )
+    interner = cls.__dict__.get( interner_name )
+    if interner is None: return instance
+    return interner.__func__( instance )
+
+
+def restore_tupleclass_instance(
+    cls: type[ __.U ], values: tuple[ __.typx.Any, ... ]
+) -> __.U:
+    ''' Restores pickled instance of tuple-backed record class. '''
+    return tuple.__new__( cls, values ) # pyright: ignore
+
+
+@__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
+def tupleclass_with_standard_behaviors( # noqa: PLR0913, PLR0917
+    attributes_namer: _nomina.AttributesNamer = __.calculate_attrname,
+    error_class_provider: _nomina.ErrorClassProvider = __.provide_error_class,
+    decorators: _nomina.Decorators[ __.U ] = ( ),
+    assigner_core: __.typx.Optional[ _nomina.AssignerCore ] = None,
+    deleter_core: __.typx.Optional[ _nomina.DeleterCore ] = None,
+    surveyor_core: __.typx.Optional[ _nomina.SurveyorCore ] = None,
+    ignore_init_arguments: bool = False,
+    mutables: _nomina.BehaviorExclusionVerifiersOmni = __.mutables_default,
+    visibles: _nomina.BehaviorExclusionVerifiersOmni = __.visibles_default,
+    hash_cache: bool = False,
+    intern: bool = False,
+    packed: bool = False,
+    slots: bool = True,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Tuple-backed record decorator factory.
+
+        Instances are immutable by their layout, so are neither initialized
+        nor guarded by standard behaviors; only concealment applies to them.
+        Instance options, which concern other layouts, are rejected.
+    '''
+    rejectors: _nomina.Decorators[ __.U ] = _produce_options_rejectors(
+        'tuple-backed records',
+        hash_cache = hash_cache,
+        ignore_init_arguments = ignore_init_arguments,
+        intern = intern,
+        mutables = bool( mutables ),
+        packed = packed )
+    decorators_: _nomina.Decorators[ __.U ] = (
+        produce_instances_tupling_decorator(
+            attributes_namer = attributes_namer, visibles = visibles ),
+        produce_attributes_surveillance_decorator(
+            level = 'instances',
+            attributes_namer = attributes_namer,
+            implementation_core = surveyor_core ) )
+    return decoration_by( *rejectors, *decorators, *decorators_ )
 
 
 def with_standard_behaviors( # noqa: PLR0913, PLR0917
@@ -574,8 +1226,18 @@ def with_standard_behaviors( # noqa: PLR0913, PLR0917
     ignore_init_arguments: bool = False,
     mutables: _nomina.BehaviorExclusionVerifiersOmni = __.mutables_default,
     visibles: _nomina.BehaviorExclusionVerifiersOmni = __.visibles_default,
+    hash_cache: bool = False,
+    intern: bool = False,
+    packed: bool = False,
+    slots: bool = False,
 ) -> _nomina.Decorator[ __.U ]:
     ''' Class decorator factory. '''
+    if slots:
+        from .slotting import produce_instances_slotting_decorator
+        decorators = (
+            produce_instances_slotting_decorator( attributes_namer ),
+            *decorators )
+    if packed: decorators = ( _reject_packing, *decorators )
     decorators_: _nomina.Decorators[ __.U ] = (
         _produce_instances_decorators(
             attributes_namer = attributes_namer,
@@ -585,7 +1247,9 @@ def with_standard_behaviors( # noqa: PLR0913, PLR0917
             surveyor_core = surveyor_core,
             ignore_init_arguments = ignore_init_arguments,
             mutables = mutables,
-            visibles = visibles ) )
+            visibles = visibles,
+            hash_cache = hash_cache,
+            intern = intern ) )
     preparers: _nomina.DecorationPreparers[ __.U ] = (
         _produce_instances_decoration_preparers(
             attributes_namer = attributes_namer,
@@ -593,32 +1257,706 @@ def with_standard_behaviors( # noqa: PLR0913, PLR0917
     return decoration_by( *decorators, *decorators_, preparers = preparers )
 
 
-def _activate_instance_behaviors(
+def _add_dataclass_record_field(
+    cls: type, name: str, annotation: __.typx.Any
+) -> None:
+    # Record-keeping field: excluded from comparison, hashing, and init.
+    annotate = _access_annotate_function( cls )
+    if annotate is None:
+        annotations = dict( __.typx.get_annotations(
+            cls, format = __.typx.Format.FORWARDREF ) )
+        annotations[ name ] = annotation
+        setattr( cls, '__annotations__', annotations ) # in case of absence
+    else:
+        setattr( cls, '__annotate__', _produce_annotate_function_augmenter(
+            annotate, name, annotation ) )
+    setattr( cls, name, __.dcls.field(
+        compare = False, hash = False, init = False, repr = False,
+        metadata = { _nomina.record_field_label: True } ) )
+
+
+def _calculate_instances_decorators_producers(
+    ignore_init_arguments: bool, hash_cache: bool, intern: bool
+) -> tuple[ __.cabc.Callable[ ..., _nomina.Decorator[ __.typx.Any ] ], ... ]:
+    # Order matters: later decorators may use methods of earlier ones.
+    producers: list[
+        __.cabc.Callable[ ..., _nomina.Decorator[ __.typx.Any ] ]
+    ] = [
+        produce_instances_pickling_decorator,
+        produce_instances_copying_decorator,
+        produce_instances_assembly_decorator,
+    ]
+    if not ignore_init_arguments:
+        producers.append( produce_instances_replacement_decorator )
+    if hash_cache: producers.append( produce_instances_hashing_decorator )
+    if intern: producers.append( produce_instances_interning_decorator )
+    return tuple( producers )
+
+
+def _calculate_behaviors_names(
+    cls: type, attributes_namer: _nomina.AttributesNamer
+) -> tuple[ str, frozenset[ str ] ]:
+    # Slotted classes use plain name; others use mangled name.
+    behaviors_name = attributes_namer( 'instance', 'behaviors' )
+    behaviors_name_m = _utilities.mangle_name( cls, behaviors_name )
+    return (
+        behaviors_name_m, frozenset( ( behaviors_name, behaviors_name_m ) ) )
+
+
+def _calculate_behaviors_storage_name( cls: type, name: str ) -> str:
+    # Same resolution as private attribute accessors for instances.
+    for base in cls.__mro__:
+        slots = base.__dict__.get( '__slots__', ( ) )
+        if name in slots: return name
+    return _utilities.mangle_name( cls, name )
+
+
+def _capture_instance_state(
+    objct: object,
+    slots: __.cabc.Sequence[ __.typx.Any ],
+    names: tuple[ str, ... ],
+    excludes: __.cabc.Set[ str ],
+) -> __.typx.Any:
+    dictionary = getattr( objct, '__dict__', None )
+    if dictionary is not None:
+        dictionary = {
+            name: value for name, value in dictionary.items( )
+            if name not in excludes }
+        if not slots: return dictionary
+    cls = type( objct )
+    try: values = [ slot.__get__( objct, cls ) for slot in slots ]
+    except AttributeError: # unassigned slots
+        return ( dictionary, _survey_slots_values( objct, slots ) )
+    return ( dictionary, names, values )
+
+
+def _copy_instance(
+    objct: __.U, cls: type[ __.U ], profile: _InstancesProfile
+) -> __.U:
+    if profile.exemptionless and _is_instance_immutable( objct, profile ):
+        return objct
+    replica = object.__new__( cls )
+    if hasattr( objct, '__dict__' ):
+        replica.__dict__.update( objct.__dict__ )
+    _replicate_slots_values(
+        replica, objct, profile,
+        _capture_slots_values( objct, profile.slots ) )
+    return replica
+
+
+def _dataclass_core_weakref( cls: type[ __.U ] ) -> type[ __.U ]:
+    if __.sys.version_info >= ( 3, 11 ):
+        return __.dcls.dataclass(
+            cls, kw_only = True, slots = True, weakref_slot = True )
+    # Option for weak references slot is absent before Python 3.11.
+    cls_ = _dataclass_core( cls )
+    if cls_.__weakrefoffset__: return cls_ # inherited slot
+    slots: tuple[ str, ... ] = cls_.__dict__[ '__slots__' ]
+    namespace = {
+        name: value for name, value in cls_.__dict__.items( )
+        if name not in slots }
+    namespace[ '__slots__' ] = ( *slots, '__weakref__' )
+    cls__ = type( cls_ )( cls_.__name__, cls_.__bases__, namespace )
+    cls__.__qualname__ = cls_.__qualname__
+    return cls__
+
+
+def _deepcopy_instance(
+    objct: __.U,
     cls: type[ __.U ],
-    self: object,
+    profile: _InstancesProfile,
+    memo: dict[ int, __.typx.Any ],
+) -> __.U:
+    from copy import deepcopy
+    replica = object.__new__( cls )
+    memo[ id( objct ) ] = replica # in case of cycles
+    dictionary: dict[ str, __.typx.Any ] = getattr( objct, '__dict__', { } )
+    dictionary_ = {
+        name: (
+            value if name in profile.behaviors_names
+            else deepcopy( value, memo ) )
+        for name, value in dictionary.items( )
+        if name not in profile.transients }
+    values = _capture_slots_values( objct, profile.slots )
+    values_ = [
+        value if value is _slot_absence else deepcopy( value, memo )
+        for value in values ]
+    if (    profile.exemptionless
+        and _is_instance_immutable( objct, profile )
+        and all( map( _is_same, values, values_ ) )
+        and all(
+            value is dictionary[ name ]
+            for name, value in dictionary_.items( ) )
+    ):
+        memo[ id( objct ) ] = objct
+        return objct
+    if dictionary_: replica.__dict__.update( dictionary_ )
+    _replicate_slots_values( replica, objct, profile, values_ )
+    return replica
+
+
+def _capture_slots_values(
+    objct: object, slots: __.cabc.Sequence[ __.typx.Any ]
+) -> list[ __.typx.Any ]:
+    try: return [ slot.__get__( objct ) for slot in slots ]
+    except AttributeError: # unassigned slots
+        return [ _access_slot_value( objct, slot ) for slot in slots ]
+
+
+def _access_slot_value( objct: object, slot: __.typx.Any ) -> __.typx.Any:
+    try: return slot.__get__( objct )
+    except AttributeError: return _slot_absence
+
+
+def _collect_slots_descriptors(
+    cls: type,
+    behaviors_names: __.cabc.Set[ str ],
+    transients: __.cabc.Set[ str ] = frozenset( ),
+) -> _SlotsDescriptors:
+    descriptors: list[ __.typx.Any ] = [ ]
+    descriptor_b = None
+    names: set[ str ] = set( )
+    # Most-derived descriptors win, since slots may be redeclared.
+    for base in cls.__mro__:
+        slots: __.typx.Any = base.__dict__.get( '__slots__', ( ) )
+        if isinstance( slots, str ): slots = ( slots, )
+        for name in slots:
+            if name in ( '__dict__', '__weakref__' ): continue
+            name_ = name
+            if name.startswith( '__' ) and not name.endswith( '__' ):
+                name_ = "_{}{}".format( base.__name__.lstrip( '_' ), name )
+            if name_ in names: continue
+            names.add( name_ )
+            if name_ in transients: continue
+            if name_ in behaviors_names:
+                descriptor_b = base.__dict__[ name_ ]
+                continue
+            descriptors.append( base.__dict__[ name_ ] )
+    return _SlotsDescriptors(
+        values = tuple( descriptors ), behaviors = descriptor_b )
+
+
+def _is_replication_customized(
+    cls: type,
+    names: __.cabc.Iterable[ str ],
+    markers: __.cabc.Iterable[ str ],
+) -> bool:
+    for name in names:
+        for base in cls.__mro__:
+            if name not in base.__dict__: continue
+            if base is object: break
+            if any( marker in base.__dict__ for marker in markers ): break
+            return True
+    return False
+
+
+def _disinherit_copiers( cls: type, marker_name: str ) -> None:
+    # Injected copiers on bases would bypass customizations on the class.
+    for name in _copying_methods_names:
+        for base in cls.__mro__:
+            if name not in base.__dict__: continue
+            if base is not cls and marker_name in base.__dict__:
+                setattr( cls, name, None )
+            break
+
+
+def _is_copying_standard(
+    cls: type, attributes_namer: _nomina.AttributesNamer
+) -> bool:
+    if _is_replication_customized(
+        cls, _copying_methods_names,
+        ( attributes_namer( 'instances', 'copying' ), )
+    ): return False
+    if _is_replication_customized(
+        cls, _pickling_methods_names,
+        ( attributes_namer( 'instances', 'pickling' ), )
+    ): return False
+    return cls.__new__ is object.__new__ # pyright: ignore
+
+
+def _access_instances_hasher(
+    cls: type, marker_name: str
+) -> __.typx.Optional[ __.cabc.Callable[ [ __.typx.Any ], int ] ]:
+    hasher = _access_replaced_method( cls, '__hash__', marker_name )
+    if hasher is None: # hashing disabled by equality comparison
+        equalizer = getattr( cls, '__eq__', None )
+        if not getattr( equalizer, marker_name, False ): return None
+        return _produce_fields_hasher( cls )
+    if hasher is object.__hash__: return None
+    return hasher
+
+
+def _access_replaced_method(
+    cls: type, name: str, marker_name: str
+) -> __.typx.Any:
+    # Injected methods on bases are unwrapped to their originals.
+    for base in cls.__mro__:
+        if name not in base.__dict__: continue
+        method = base.__dict__[ name ]
+        if marker_name in base.__dict__:
+            return getattr( method, '__wrapped__', method )
+        return method
+    return None
+
+
+def _produce_hash_storer(
+    cls: type, hash_name: str
+) -> __.typx.Optional[ __.cabc.Callable[ [ __.typx.Any, int ], None ] ]:
+    # Stores bypass enforcement, since instances are already immutable.
+    slot = getattr( cls, hash_name, None )
+    if isinstance( slot, __.types.MemberDescriptorType ): return slot.__set__
+    if cls.__dictoffset__ == 0: return None
+
+    def store( objct: __.typx.Any, value: int ) -> None:
+        objct.__dict__[ hash_name ] = value
+
+    return store
+
+
+def _inject_interned_replicators(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    interner_name: str,
+) -> None:
+    # Interned instances are their own copies.
+    def copy( self: __.U ) -> __.U: return self
+
+    def deepcopy( self: __.U, memo: dict[ int, __.typx.Any ] ) -> __.U:
+        return self
+
+    setattr( cls, '__copy__', copy )
+    setattr( cls, '__deepcopy__', deepcopy )
+    if _is_replication_customized(
+        cls, _pickling_methods_names,
+        ( attributes_namer( 'instances', 'pickling' ), )
+    ): return
+
+    def reduce( self: object ) -> tuple[ __.typx.Any, ... ]:
+        state = getattr( self, '__getstate__' )( )
+        return (
+            restore_interned_instance,
+            ( type( self ), state, interner_name ) )
+
+    setattr( cls, '__reduce__', reduce )
+
+
+def _produce_interner(
+    cls: type
+) -> __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ]:
+    name = cls.__qualname__
+    if not __.dcls.is_dataclass( cls ):
+        from ..exceptions import InterningInvalidity
+        raise InterningInvalidity( name, 'Class is not a dataclass.' )
+    access_key = _produce_fields_accessor( cls )
+    instances: __.weakref.WeakValueDictionary[
+        tuple[ __.typx.Any, ... ], __.typx.Any
+    ] = __.weakref.WeakValueDictionary( )
+    mutex = __.threading.Lock( )
+
+    def intern( instance: __.typx.Any ) -> __.typx.Any:
+        key = _calculate_interning_key( access_key( instance ) )
+        canonical = instances.get( key )
+        if canonical is not None: return canonical
+        with mutex: return instances.setdefault( key, instance )
+
+    return intern
+
+
+def _calculate_interning_key(
+    values: tuple[ object, ... ]
+) -> tuple[ tuple[ type, object ], ... ]:
+    # Equal values of different types, such as 1, 1.0, and True, must not
+    # share canonical instances.
+    return tuple( map( _tag_interning_value, values ) )
+
+
+def _access_class_attribute( cls: type, name: str ) -> __.typx.Any:
+    # Bypasses descriptor protocol, unlike attribute access.
+    for base in cls.__mro__:
+        if name in base.__dict__: return base.__dict__[ name ]
+    return None
+
+
+def _has_dataclass_init_variables( cls: type ) -> bool:
+    # Same detection as 'dataclasses.replace'. Absent internals are assumed.
+    initvar = getattr( __.dcls, '_FIELD_INITVAR', None )
+    fields: dict[ str, __.typx.Any ] = getattr( cls, '__dataclass_fields__' )
+    return any(
+        getattr( field, '_field_type', initvar ) is initvar
+        for field in fields.values( ) )
+
+
+def _is_initializer_terminal( cls: type, marker_name: str ) -> bool:
+    # Is next initializer in MRO one which does nothing for instances?
+    for base in cls.__mro__[ 1 : ]:
+        initializer = base.__dict__.get( '__init__' )
+        if initializer is None: continue
+        if getattr( initializer, marker_name, False ): return True
+        if not __.typx.is_protocol( base ): return False
+        initializer = __.inspect.unwrap( initializer )
+        return (
+            getattr( initializer, '__module__', None )
+            in _protocol_initializers_modules
+            and getattr( initializer, '__name__', None )
+            in _protocol_initializers_names )
+    return False
+
+
+def _is_instance_initialized(
+    objct: object, profile: _InstancesProfile
+) -> bool:
+    return getattr( objct, profile.behaviors_name_a, None ) is not None
+
+
+def _is_instance_immutable(
+    objct: object, profile: _InstancesProfile
+) -> bool:
+    behaviors: __.cabc.Set[ str ] = (
+        getattr( objct, profile.behaviors_name_a, frozenset( ) ) )
+    return _nomina.immutability_label in behaviors
+
+
+def _is_mutables_exemptionless(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.Set[ str ],
+) -> bool:
+    if _nomina.immutability_label not in behaviors: return False
+    names_name = attributes_namer( 'instances', 'mutables_names' )
+    regexes_name = attributes_namer( 'instances', 'mutables_regexes' )
+    predicates_name = attributes_namer( 'instances', 'mutables_predicates' )
+    names: _nomina.BehaviorExclusionNamesOmni = (
+        getattr( cls, names_name, frozenset( ) ) )
+    regexes: _nomina.BehaviorExclusionRegexes = (
+        getattr( cls, regexes_name, ( ) ) )
+    predicates: _nomina.BehaviorExclusionPredicates = (
+        getattr( cls, predicates_name, ( ) ) )
+    return not ( names or regexes or predicates )
+
+
+def _is_same( left: object, right: object ) -> bool:
+    return left is right
+
+
+def _prewarm_profile( label: str, cls: type ) -> bool:
+    reference = _profiles_accessors[ label ].get( cls )
+    access = None if reference is None else reference( )
+    if access is None: return False
+    access( )
+    return True
+
+
+def _produce_profile_access(
+    cls: type,
+    producer: __.cabc.Callable[ [ ], __.U ],
+    sealing_deferred: bool = False,
+    label: __.typx.Optional[ str ] = None,
+    validator: __.typx.Optional[
+        __.cabc.Callable[ [ type, __.U ], None ] ] = None,
+) -> tuple[ __.cabc.Sequence[ __.U ], __.cabc.Callable[ [ ], __.U ] ]:
+    # Profiles of class are produced on first use, after any deferred sealing,
+    # and are cached in a one-item list. Hot paths may read the list directly
+    # and only call the accessor while it is empty. Profiles depend only on
+    # their class, so racing threads produce equivalent ones; any may be kept.
+    cache: list[ __.U ] = [ ]
+
+    def access( ) -> __.U:
+        if cache: return cache[ 0 ]
+        if sealing_deferred: _behaviors.seal_class( cls )
+        profile = producer( )
+        if validator is not None: validator( cls, profile )
+        cache.append( profile )
+        return cache[ 0 ]
+
+    # Accessor lives as long as the methods of the class, which close over it.
+    if label is not None:
+        _profiles_accessors[ label ][ cls ] = __.weakref.ref( access )
+    return cache, access
+
+
+def _produce_pickling_profile(
+    cls: type,
     behaviors_name: str,
-    behaviors: __.cabc.MutableSet[ str ],
+    behaviors_names: __.cabc.Set[ str ],
+    transients: __.cabc.Set[ str ],
+) -> _PicklingProfile:
+    slots, slot_b = _collect_slots_descriptors(
+        cls, behaviors_names, transients )
+    return _PicklingProfile(
+        slots = slots,
+        names = tuple( slot.__name__ for slot in slots ),
+        store_behaviors = _produce_behaviors_storer( slot_b, behaviors_name ) )
+
+
+def _produce_instances_profile(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.Set[ str ],
+) -> _InstancesProfile:
+    behaviors_name_m, behaviors_names = (
+        _calculate_behaviors_names( cls, attributes_namer ) )
+    transients = frozenset( ( attributes_namer( 'instance', 'hash' ), ) )
+    slots, slot_b = _collect_slots_descriptors(
+        cls, behaviors_names, transients )
+    return _InstancesProfile(
+        slots = slots,
+        slot_b = slot_b,
+        behaviors_names = behaviors_names,
+        # Slotted behaviors take precedence over mangled attribute.
+        behaviors_name_a = (
+            behaviors_name_m if slot_b is None else slot_b.__name__ ),
+        exemptionless = _is_mutables_exemptionless(
+            cls, attributes_namer, behaviors ),
+        transients = transients )
+
+
+def _produce_assembly_profile(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.Set[ str ],
+) -> _AssemblyProfile:
+    profile = _produce_instances_profile( cls, attributes_namer, behaviors )
+    interner = cls.__dict__.get( attributes_namer( 'instances', 'interner' ) )
+    setters = tuple(
+        _produce_attribute_setter( cls, name )
+        for name in survey_data_fields_names( cls ) )
+    return _AssemblyProfile(
+        setters = setters,
+        behaviors = frozenset( behaviors ),
+        store_behaviors = _produce_behaviors_storer(
+            profile.slot_b, profile.behaviors_name_a ),
+        intern = None if interner is None else interner.__func__ )
+
+
+def _produce_tuple_item_accessor( index: int ) -> __.typx.Any:
+    # Accessor from C implementation, which 'collections.namedtuple' uses.
+    try: from _collections import _tuplegetter # pyright: ignore
+    except ImportError: # pragma: no cover
+        return property( __.operator.itemgetter( index ) )
+    return _tuplegetter( index, None ) # pyright: ignore
+
+
+def _produce_members_lookup(
+    cls: type, members: __.cabc.Mapping[ __.typx.Any, __.typx.Any ]
+) -> __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ]:
+    def lookup( value: __.typx.Any ) -> __.typx.Any:
+        ''' Returns member with value. Faster than calling enumeration. '''
+        try: return members[ value ]
+        except ( KeyError, TypeError ): return cls( value )
+
+    lookup.__qualname__ = f"{cls.__qualname__}.lookup"
+    return lookup
+
+
+def _produce_tupleclass_constructor(
+    cls: type,
+    fields: __.cabc.Sequence[ str ],
+    defaults: __.cabc.Mapping[ str, __.typx.Any ],
+) -> __.cabc.Callable[ ..., __.typx.Any ]:
+    # Generated, as by 'collections.namedtuple', so that arguments are bound
+    # by interpreter rather than collected and unpacked.
+    items = ''.join( f"{name}, " for name in fields )
+    signature = f"_cls_, *, {', '.join( fields )}" if fields else '_cls_'
+    namespace: dict[ str, __.typx.Any ] = {
+        '_new_': getattr( tuple, '__new__' ) }
+    exec( # noqa: S102
+        f"def __new__( {signature} ): return _new_( _cls_, ( {items}) )",
+        namespace )
+    constructor = namespace[ '__new__' ]
+    constructor.__kwdefaults__ = {
+        name: value for name, value in defaults.items( ) if name in fields
+    } or None
+    constructor.__module__ = cls.__module__
+    constructor.__qualname__ = f"{cls.__qualname__}.__new__"
+    return constructor
+
+
+def _produce_attribute_setter(
+    cls: type, name: str
+) -> __.cabc.Callable[ [ __.typx.Any, __.typx.Any ], None ]:
+    # Setters bypass enforcement, since instances are not yet initialized.
+    slot = _access_class_attribute( cls, name )
+    if isinstance( slot, __.types.MemberDescriptorType ): return slot.__set__
+
+    def assign( objct: __.typx.Any, value: __.typx.Any ) -> None:
+        object.__setattr__( objct, name, value )
+
+    return assign
+
+
+def _produce_replacement_profile(
+    cls: type,
+    attributes_namer: _nomina.AttributesNamer,
+    behaviors: __.cabc.Set[ str ],
+) -> _ReplacementProfile:
+    profile = _produce_instances_profile( cls, attributes_namer, behaviors )
+    interner = cls.__dict__.get( attributes_namer( 'instances', 'interner' ) )
+    intern = None if interner is None else interner.__func__
+    eligible = (
+        ( intern is not None or cls.__new__ is object.__new__ )
+        and not _has_dataclass_init_variables( cls ) )
+    setters_named: dict[ str, __.typx.Any ] = { }
+    resets: list[ tuple[ __.typx.Any, __.typx.Any, __.typx.Any ] ] = [ ]
+    for field in __.dcls.fields( cls ):
+        slot = _access_class_attribute( cls, field.name )
+        if not isinstance( slot, __.types.MemberDescriptorType ):
+            eligible = False
+            continue
+        if field.init: setters_named[ field.name ] = slot.__set__
+        elif not (
+                field.default is __.dcls.MISSING
+            and field.default_factory is __.dcls.MISSING
+        ): resets.append(
+            ( slot.__set__, field.default, field.default_factory ) )
+    names = tuple( setters_named )
+    access = _utilities.produce_attributes_accessor( names )
+    return _ReplacementProfile(
+        access = access,
+        setters = tuple( setters_named.values( ) ) if eligible else None,
+        setters_named = setters_named,
+        resets = tuple( resets ),
+        initializer_post = getattr( cls, '__post_init__', None ),
+        behaviors = frozenset( behaviors ),
+        store_behaviors = _produce_behaviors_storer(
+            profile.slot_b, profile.behaviors_name_a ),
+        intern = intern )
+
+
+def _produce_behaviors_activator(
+    cls: type, behaviors_name: str, behaviors: __.cabc.Set[ str ]
+) -> __.cabc.Callable[ [ object ], None ]:
+    # Storage of behaviors is resolved once, rather than per instance.
+    names_cache, access_name = _produce_profile_access(
+        cls, __.funct.partial(
+            _calculate_behaviors_storage_name, cls, behaviors_name ) )
+
+    def activate( self: object ) -> None:
+        # Only record behaviors at start of MRO.
+        if cls is not type( self ): return
+        name = names_cache[ 0 ] if names_cache else access_name( )
+        behaviors_: set[ str ] = getattr( self, name, set( ) )
+        behaviors_.update( behaviors )
+        setattr( self, name, frozenset( behaviors_ ) )
+
+    return activate
+
+
+def _produce_direct_initializer(
+    cls: type,
+    activate: __.cabc.Callable[ [ object ], None ],
+    sealing_deferred: bool,
+    marker_name: str,
+) -> __.cabc.Callable[ ..., None ]:
+    # Next initializer in MRO would do nothing, so it is not called.
+    def initialize_directly(
+        self: object, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> None:
+        if sealing_deferred: _behaviors.seal_class( cls )
+        activate( self )
+
+    setattr( initialize_directly, marker_name, True )
+    return initialize_directly
+
+
+def _produce_fields_accessor(
+    cls: type, hashing: bool = False
+) -> __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]:
+    # Same field selections as standard dataclasses.
+    names = tuple(
+        field.name for field in __.dcls.fields( cls )
+        if (
+            field.compare if not hashing or field.hash is None
+            else field.hash ) )
+    return _utilities.produce_attributes_accessor( names )
+
+
+def _produce_behaviors_storer(
+    slot_b: __.typx.Any, behaviors_name: str
+) -> __.cabc.Callable[ [ __.typx.Any, frozenset[ str ] ], None ]:
+    # Stores behaviors on fresh instances directly, bypassing enforcement.
+    if slot_b is not None: return slot_b.__set__
+
+    def store( objct: __.typx.Any, value: frozenset[ str ] ) -> None:
+        objct.__dict__[ behaviors_name ] = value
+
+    return store
+
+
+def _produce_fields_equalizer(
+    hash_name: str
+) -> __.cabc.Callable[ [ __.typx.Any, __.typx.Any ], __.typx.Any ]:
+    accessors: dict[
+        type, __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]
+    ] = { }
+
+    def __eq__( self: __.typx.Any, other: __.typx.Any ) -> __.typx.Any:
+        if self is other: return True
+        cls = self.__class__
+        if other.__class__ is not cls: return NotImplemented
+        value = getattr( self, hash_name, None )
+        if value is not None:
+            value_ = getattr( other, hash_name, None )
+            if value_ is not None and value != value_: return False
+        access = _utilities.access_class_cache(
+            accessors, cls, _produce_fields_accessor )
+        return access( self ) == access( other )
+
+    return __eq__
+
+
+def _produce_fields_hasher(
+    cls: type
+) -> __.cabc.Callable[ [ __.typx.Any ], int ]:
+    # Same hash values as standard dataclasses.
+    access_values = _produce_fields_accessor( cls, hashing = True )
+
+    def hash_values( objct: __.typx.Any ) -> int:
+        return hash( access_values( objct ) )
+
+    return hash_values
+
+
+def _validate_hash_cache_profile(
+    cls: type, profile: _InstancesProfile
+) -> None:
+    if profile.exemptionless: return
+    from ..exceptions import HashCacheInvalidity
+    raise HashCacheInvalidity(
+        cls.__qualname__, 'Instances have mutable attributes.' )
+
+
+def _validate_slots_names(
+    objct: object,
+    profile: _PicklingProfile,
+    names: __.typx.Any,
+    values: __.typx.Any,
+) -> None:
+    # Positional values are only meaningful against identical slots.
+    if names == profile.names and len( values ) == len( names ): return
+    from ..exceptions import InstanceStateInvalidity
+    raise InstanceStateInvalidity(
+        _utilities.qualify_class_name( type( objct ) ),
+        f"Slots names {names!r} differ from {profile.names!r}." )
+
+
+def _validate_interning_profile(
+    cls: type, profile: _InstancesProfile
 ) -> None:
-    # Only record behaviors at start of MRO.
-    if cls is not type( self ): return
-    behaviors_: set[ str ] = (
-        _utilities.getattr0( self, behaviors_name, set( ) ) )
-    behaviors_.update( behaviors )
-    _utilities.setattr0( self, behaviors_name, frozenset( behaviors_ ) )
+    if profile.exemptionless: return
+    from ..exceptions import InterningInvalidity
+    raise InterningInvalidity(
+        cls.__qualname__, 'Instances have mutable attributes.' )
 
 
 def _produce_instances_decoration_preparers(
     attributes_namer: _nomina.AttributesNamer,
     error_class_provider: _nomina.ErrorClassProvider,
-    class_preparer: __.typx.Optional[ _nomina.ClassPreparer ] = None,
+    class_preparers: __.cabc.Sequence[ _nomina.ClassPreparer ] = ( ),
 ) -> _nomina.DecorationPreparers[ __.U ]:
     ''' Produces processors for standard decorators. '''
-    preprocessors: list[ _nomina.DecorationPreparer[ __.U ] ] = [ ]
-    if class_preparer is not None:
-        preprocessors.append(
-            __.funct.partial(
-                class_preparer, attributes_namer = attributes_namer ) )
-    return tuple( preprocessors )
+    return tuple(
+        __.funct.partial( class_preparer, attributes_namer = attributes_namer )
+        for class_preparer in class_preparers )
 
 
 def _produce_instances_decorators( # noqa: PLR0913, PLR0917
@@ -630,6 +1968,8 @@ def _produce_instances_decorators( # noqa: PLR0913, PLR0917
     ignore_init_arguments: bool,
     mutables: _nomina.BehaviorExclusionVerifiersOmni,
     visibles: _nomina.BehaviorExclusionVerifiersOmni,
+    hash_cache: bool = False,
+    intern: bool = False,
 ) -> _nomina.Decorators[ __.U ]:
     ''' Produces standard decorators. '''
     decorators: list[ _nomina.Decorator[ __.U ] ] = [ ]
@@ -640,7 +1980,8 @@ def _produce_instances_decorators( # noqa: PLR0913, PLR0917
             deleter_core = deleter_core,
             surveyor_core = surveyor_core,
             ignore_init_arguments = ignore_init_arguments,
-            mutables = mutables, visibles = visibles ) )
+            mutables = mutables, visibles = visibles,
+            hash_cache = hash_cache, intern = intern ) )
     decorators.append(
         produce_attributes_assignment_decorator(
             level = 'instances',
@@ -659,3 +2000,211 @@ def _produce_instances_decorators( # noqa: PLR0913, PLR0917
             attributes_namer = attributes_namer,
             implementation_core = surveyor_core ) )
     return decorators
+
+
+def _replace_instance(
+    objct: __.U,
+    cls: type[ __.U ],
+    profile: _ReplacementProfile,
+    changes: dict[ str, __.typx.Any ],
+) -> __.U:
+    replica = object.__new__( cls )
+    setters = __.typx.cast( tuple[ __.typx.Any, ... ], profile.setters )
+    for setter, value in zip( setters, profile.access( objct ) ):
+        setter( replica, value )
+    setters_named = profile.setters_named
+    for name, value in changes.items( ):
+        setters_named[ name ]( replica, value )
+    for setter, default, factory in profile.resets:
+        setter(
+            replica,
+            default if factory is __.dcls.MISSING else factory( ) )
+    if profile.initializer_post is not None:
+        profile.initializer_post( replica )
+    profile.store_behaviors( replica, profile.behaviors )
+    if profile.intern is None: return replica
+    return profile.intern( replica )
+
+
+def _restore_slots_values(
+    objct: object, state: __.typx.Any, profile: _PicklingProfile
+) -> bool:
+    # Fast path for state which consists only of slotted values.
+    if type( state ) is not tuple: return False
+    state_ = __.typx.cast( tuple[ __.typx.Any, ... ], state )
+    if len( state_ ) != 3 or state_[ 0 ] is not None: # noqa: PLR2004
+        return False
+    _, names, values = state_
+    _validate_slots_names( objct, profile, names, values )
+    for slot, value in zip( profile.slots, values ):
+        slot.__set__( objct, value )
+    return True
+
+
+def _restore_instance_state(
+    objct: object,
+    state: __.typx.Any,
+    profile: _PicklingProfile,
+    excludes: __.cabc.Set[ str ],
+) -> None:
+    # Also accepts state from default pickling of earlier versions.
+    dictionary: __.typx.Optional[ dict[ str, __.typx.Any ] ] = None
+    values: __.typx.Any = None
+    if isinstance( state, tuple ):
+        state_ = __.typx.cast( tuple[ __.typx.Any, ... ], state )
+        if len( state_ ) == 3: # noqa: PLR2004
+            dictionary, names, values = state_
+            _validate_slots_names( objct, profile, names, values )
+        else: dictionary, values = state_
+    elif isinstance( state, dict ):
+        dictionary = __.typx.cast( dict[ str, __.typx.Any ], state )
+    if dictionary:
+        dictionary_ = objct.__dict__
+        dictionary_.update( dictionary )
+        for name in excludes: dictionary_.pop( name, None )
+    if isinstance( values, list ):
+        values_ = __.typx.cast( list[ __.typx.Any ], values )
+        for slot, value in zip( profile.slots, values_ ):
+            slot.__set__( objct, value )
+        return
+    if not values: return
+    for name, value in __.typx.cast(
+        dict[ str, __.typx.Any ], values
+    ).items( ):
+        if name in excludes: continue
+        object.__setattr__( objct, name, value )
+
+
+def _reject_packing( cls: type[ __.U ] ) -> type[ __.U ]:
+    from ..exceptions import PackingInvalidity
+    raise PackingInvalidity(
+        _utilities.qualify_class_name( cls ), 'Class is not a dataclass.' )
+
+
+def _produce_options_rejectors(
+    description: str, **options: bool
+) -> _nomina.Decorators[ __.typx.Any ]:
+    # Rejection on decoration, so that errors name classes.
+    names = tuple( name for name, option in options.items( ) if option )
+    if not names: return ( )
+
+    def reject( cls: type[ __.U ] ) -> type[ __.U ]:
+        from ..exceptions import InstancesOptionsInvalidity
+        raise InstancesOptionsInvalidity(
+            _utilities.qualify_class_name( cls ),
+            f"Options not applicable to {description}: "
+            f"{', '.join( names )}." )
+
+    return ( reject, )
+
+
+def _replicate_slots_values(
+    replica: object,
+    original: object,
+    profile: _InstancesProfile,
+    values: __.cabc.Sequence[ __.typx.Any ],
+) -> None:
+    for slot, value in zip( profile.slots, values ):
+        if value is _slot_absence: continue
+        slot.__set__( replica, value )
+    if profile.slot_b is None: return
+    # Behaviors last, since they enable enforcement.
+    behaviors = _access_slot_value( original, profile.slot_b )
+    if behaviors is _slot_absence: return
+    profile.slot_b.__set__( replica, behaviors )
+
+
+def _survey_slots_values(
+    objct: object, slots: __.cabc.Sequence[ __.typx.Any ]
+) -> dict[ str, __.typx.Any ]:
+    cls = type( objct )
+    return {
+        slot.__name__: slot.__get__( objct, cls ) for slot in slots
+        if hasattr( objct, slot.__name__ ) }
+
+
+def _tag_interning_value( value: object ) -> tuple[ type, object ]:
+    class_ = type( value )
+    if isinstance( value, tuple ):
+        items = __.typx.cast( tuple[ object, ... ], value )
+        return ( class_, _calculate_interning_key( items ) )
+    if isinstance( value, frozenset ):
+        members = __.typx.cast( frozenset[ object ], value )
+        return ( class_, frozenset( map( _tag_interning_value, members ) ) )
+    return ( class_, value )
+
+
+def _access_annotate_function(
+    cls: type
+) -> __.typx.Optional[ __.cabc.Callable[ [ int ], dict[ str, __.typx.Any ] ] ]:
+    if __.sys.version_info < ( 3, 14 ): return None
+    annotationlib = _import_annotationlib( )
+    return annotationlib.get_annotate_from_class_namespace( cls.__dict__ )
+
+
+def _import_annotationlib( ) -> __.types.ModuleType:
+    # Module only exists on Python 3.14 and later.
+    from importlib import import_module
+    return import_module( 'annotationlib' )
+
+
+def _produce_annotate_function_augmenter(
+    annotate: __.cabc.Callable[ [ int ], dict[ str, __.typx.Any ] ],
+    name: str,
+    annotation: __.typx.Any,
+) -> __.cabc.Callable[ [ int ], dict[ str, __.typx.Any ] ]:
+    annotationlib = _import_annotationlib( )
+    formats = annotationlib.Format
+
+    def augment( format: int ) -> dict[ str, __.typx.Any ]: # noqa: A002
+        if format == formats.VALUE_WITH_FAKE_GLOBALS:
+            raise NotImplementedError
+        annotations = dict(
+            annotationlib.call_annotate_function( annotate, format ) )
+        if format == formats.STRING:
+            annotations[ name ] = annotationlib.type_repr( annotation )
+        else: annotations[ name ] = annotation
+        return annotations
+
+    return augment
+
+
+def _copy_tupleclass_instance(
+    self: tuple[ __.typx.Any, ... ]
+) -> tuple[ __.typx.Any, ... ]:
+    return self # immutable
+
+
+def _reduce_tupleclass_instance(
+    self: tuple[ __.typx.Any, ... ]
+) -> tuple[ __.typx.Any, ... ]:
+    return ( restore_tupleclass_instance, ( type( self ), tuple( self ) ) )
+
+
+def _replace_tupleclass_instance(
+    self: tuple[ __.typx.Any, ... ], /, **changes: __.typx.Any
+) -> __.typx.Any:
+    cls = type( self )
+    values = dict( zip( getattr( cls, '__match_args__' ), self ) )
+    values.update( changes )
+    return cls( **values )
+
+
+def _represent_tupleclass_instance( self: tuple[ __.typx.Any, ... ] ) -> str:
+    cls = type( self )
+    values = ', '.join(
+        f"{name}={value!r}"
+        for name, value in zip( getattr( cls, '__match_args__' ), self ) )
+    return f"{cls.__qualname__}({values})"
+
+_tupleclass_methods: dict[ str, __.cabc.Callable[ ..., __.typx.Any ] ] = {
+    '__copy__': _copy_tupleclass_instance,
+    '__reduce__': _reduce_tupleclass_instance,
+    '__replace__': _replace_tupleclass_instance,
+    '__repr__': _represent_tupleclass_instance,
+}
+
+
+for _label in _profiles_accessors:
+    __.register_prewarmer(
+        _label, __.funct.partial( _prewarm_profile, _label ) )
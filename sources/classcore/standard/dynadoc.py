@@ -23,6 +23,7 @@
 
 from .. import utilities as _utilities
 from . import __
+from . import behaviors as _behaviors
 from . import nomina as _nomina
 
 
@@ -34,6 +35,8 @@ dynadoc_class_introspection_control = (
             __.ddoc.introspection.introspect_special_classes, ) ) )
 dynadoc_module_introspection_control = (
     __.ddoc.ModuleIntrospectionControl( ) )
+_inheritance_avoidance = __.ddoc.IntrospectionLimit(
+    class_limit = __.ddoc.ClassIntrospectionLimit( avoid_inheritance = True ) )
 
 
 def dynadoc_avoid_immutables(
@@ -43,6 +46,7 @@ def dynadoc_avoid_immutables(
 ) -> __.ddoc.IntrospectionControl:
     ''' Disables introspection of immutable objects. '''
     if __.inspect.isclass( objct ):
+        _behaviors.seal_class( objct )
         behaviors_name = attributes_namer( 'class', 'behaviors' )
         behaviors = _utilities.getattr0( objct, behaviors_name, frozenset( ) )
         if _nomina.immutability_label in behaviors:
@@ -127,3 +131,68 @@ def produce_dynadoc_configuration(
         introspection = introspection,
         preserve = preserve,
         table = table ) )
+
+
+def produce_class_docstring_decorator(
+    configuration: __.cabc.Mapping[ str, __.typx.Any ]
+) -> __.cabc.Callable[ [ type ], type ]:
+    ''' Produces Dynadoc class decorator which preserves lazy annotations.
+
+        Dynadoc reads class annotations in the ``VALUE`` format. On Python
+        3.14 and later, this would evaluate deferred annotations
+        (:pep:`649`) during class construction and fail on forward
+        references which are not yet resolvable. Instead, Dynadoc is
+        presented with the annotations of the class, and of its bases when
+        inheritance is introspected, in the ``FORWARDREF`` format.
+        Unresolved references are rendered by name. The annotations are
+        presented through a private mechanism of CPython, which is verified
+        once; without it, Dynadoc reads annotations as it otherwise would.
+    '''
+    decorate = __.ddoc.with_docstring( **configuration )
+    if __.sys.version_info < ( 3, 14 ): return decorate
+    if not _detect_annotations_cache_override( ): return decorate
+    introspection: __.ddoc.IntrospectionControl = configuration.get(
+        'introspection', __.ddoc.assembly.introspection_default )
+    inheritance = introspection.class_control.inheritance
+    configuration_: dict[ str, __.typx.Any ] = dict( configuration )
+    configuration_[ 'introspection' ] = (
+        introspection.with_limit( _inheritance_avoidance ) )
+    decorate_forwardref = __.ddoc.with_docstring( **configuration_ )
+
+    def decorate_sans_evaluation( cls: type ) -> type:
+        # Materialized annotations take precedence over any cache.
+        if '__annotations__' in cls.__dict__: return decorate( cls )
+        annotations: dict[ str, __.typx.Any ] = { }
+        for class_ in reversed( cls.__mro__ ) if inheritance else ( cls, ):
+            annotations.update( __.typx.get_annotations(
+                class_, format = __.typx.Format.FORWARDREF ) )
+        # Class under construction is not yet visible to other threads.
+        # Dynadoc reads this in place of evaluating annotate function.
+        type.__setattr__( cls, '__annotations_cache__', annotations )
+        try: return decorate_forwardref( cls )
+        finally: type.__delattr__( cls, '__annotations_cache__' )
+
+    return decorate_sans_evaluation
+
+
+@__.funct.cache
+def _detect_annotations_cache_override( ) -> bool:
+    # No public API presents annotations in place of evaluation by readers,
+    # such as Dynadoc, so verify private mechanism before relying on it.
+
+    def annotate( format: int ) -> dict[ str, __.typx.Any ]: # noqa: A002
+        raise NameError # evaluation would defeat presentation
+
+    class Probe: pass
+
+    annotations: dict[ str, __.typx.Any ] = { 'value': 'Unresolvable' }
+    try:
+        type.__setattr__( Probe, '__annotate__', annotate )
+        type.__setattr__( Probe, '__annotations_cache__', annotations )
+        try: presented = __.inspect.get_annotations( Probe )
+        finally: type.__delattr__( Probe, '__annotations_cache__' )
+    except Exception: return False
+    return (
+            presented == annotations
+        and '__annotations_cache__' not in Probe.__dict__
+        and getattr( Probe, '__annotate__', None ) is annotate )
@@ -23,15 +23,63 @@
 
 from .. import utilities as _utilities
 from . import __
+from . import behaviors as _behaviors
 from . import classes as _classes
 from . import dynadoc as _dynadoc
 from . import nomina as _nomina
 
 
-class Module( _classes.Object, __.types.ModuleType ):
+def _assign_module_attribute( # noqa: PLR0913
+    obj: object, /, *,
+    ligation: _nomina.AssignerLigation,
+    attributes_namer: _nomina.AttributesNamer,
+    error_class_provider: _nomina.ErrorClassProvider,
+    level: str,
+    name: str,
+    value: __.typx.Any,
+) -> None:
+    ''' Binds lazily imported submodules, else assigns if mutable.
+
+        The import system binds each newly imported submodule to its parent
+        package. This must succeed for packages which load some of their
+        submodules on first use.
+    '''
+    if (    isinstance( value, __.types.ModuleType )
+        and value.__name__ == f"{obj.__name__}.{name}" # pyright: ignore
+        and __.sys.modules.get( value.__name__ ) is value
+    ):
+        ligation( name, value )
+        return
+    _behaviors.assign_attribute_if_mutable(
+        obj,
+        ligation = ligation,
+        attributes_namer = attributes_namer,
+        error_class_provider = error_class_provider,
+        level = level,
+        name = name,
+        value = value )
+
+
+class Module(
+    _classes.Object, __.types.ModuleType,
+    instances_assigner_core = _assign_module_attribute,
+):
     ''' Modules with attributes immutability and concealment. '''
 
 
+class _ModuleDocstringDeferral( __.typx.NamedTuple ):
+
+    module: __.types.ModuleType
+    fragments: tuple[ __.ddoc.interfaces.Fragment, ... ]
+    attributes_namer: _nomina.AttributesNamer
+    introspection: __.ddoc.IntrospectionControl
+    reclassifications: tuple[ tuple[ __.types.ModuleType, type ], ... ]
+    table: __.cabc.Mapping[ str, str ]
+
+
+_module_docstrings_deferrals: dict[ str, _ModuleDocstringDeferral ] = { }
+
+
 def finalize_module( # noqa: PLR0913
     module: __.typx.Annotated[
         str | __.types.ModuleType,
@@ -39,6 +87,11 @@ def finalize_module( # noqa: PLR0913
     ], /,
     *fragments: __.ddoc.interfaces.Fragment,
     attributes_namer: _nomina.AttributesNamer = __.calculate_attrname,
+    dynadoc_defer: __.typx.Annotated[
+        bool,
+        __.ddoc.Doc(
+            ''' Defer docstring assignment until explicitly requested? ''' ),
+    ] = False,
     dynadoc_introspection: _nomina.DynadocIntrospectionArgument = (
         _dynadoc.dynadoc_introspection_on_package ),
     dynadoc_table: _nomina.DynadocTableArgument = __.dictproxy_empty,
@@ -63,6 +116,11 @@ def finalize_module( # noqa: PLR0913
         dynadoc introspection to document only the provided module. When
         recursive is True, automatically includes module targets so Dynadoc
         can recursively document all modules.
+
+        When deferral is requested, docstring assignment, which can be a
+        significant fraction of package import time, is postponed until
+        :py:func:`assign_deferred_module_docstrings` is called. Documentation
+        builders should call that function after importing the package.
     '''
     module_target = __.ddoc.IntrospectionTargets.Module
     if recursive:
@@ -80,19 +138,69 @@ def finalize_module( # noqa: PLR0913
             targets_exclusions = module_target )
         introspection = dynadoc_introspection.with_limit( limit )
     else: introspection = dynadoc_introspection
-    _dynadoc.assign_module_docstring(
-        module,
-        *fragments,
-        introspection = introspection,
-        table = dynadoc_table )
+    if not dynadoc_defer:
+        _dynadoc.assign_module_docstring(
+            module,
+            *fragments,
+            introspection = introspection,
+            table = dynadoc_table )
+    reclassifications: dict[ __.types.ModuleType, type ] = { }
     _reclassify_module(
         module,
         attributes_namer = attributes_namer,
         excludes = excludes, recursive = recursive,
+        reclassifications = reclassifications,
         replacement_class = replacement_class )
+    if not dynadoc_defer: return
+    if isinstance( module, str ): module = __.sys.modules[ module ]
+    _module_docstrings_deferrals[ module.__name__ ] = _ModuleDocstringDeferral(
+        module = module,
+        fragments = fragments,
+        attributes_namer = attributes_namer,
+        introspection = introspection,
+        reclassifications = tuple( reclassifications.items( ) ),
+        table = dynadoc_table )
+
 
+def assign_deferred_module_docstrings( ) -> int:
+    ''' Assigns module docstrings which were deferred during finalization.
 
-@__.typx.deprecated( "Use 'finalize_module' instead." )
+        Returns number of deferrals which were processed.
+
+        Modules, which were reclassified during finalization, temporarily
+        revert to their original classes while Dynadoc updates docstrings,
+        so that the results are identical to those of eager assignment.
+        Not safe to call while other threads are using these modules.
+    '''
+    count = 0
+    while _module_docstrings_deferrals:
+        count += 1
+        _, deferral = _module_docstrings_deferrals.popitem( )
+        behaviors_name = deferral.attributes_namer( 'instance', 'behaviors' )
+        seals: list[ tuple[ __.types.ModuleType, type, str, __.typx.Any ] ]
+        seals = [ ]
+        for module, class_original in deferral.reclassifications:
+            behaviors_name_m = (
+                _utilities.mangle_name( module, behaviors_name ) )
+            behaviors = module.__dict__.pop( behaviors_name_m, None )
+            seals.append(
+                ( module, type( module ), behaviors_name_m, behaviors ) )
+            object.__setattr__( module, '__class__', class_original )
+        try:
+            _dynadoc.assign_module_docstring(
+                deferral.module,
+                *deferral.fragments,
+                introspection = deferral.introspection,
+                table = deferral.table )
+        finally:
+            for module, class_, behaviors_name_m, behaviors in seals:
+                object.__setattr__( module, '__class__', class_ )
+                if behaviors is None: continue
+                module.__dict__[ behaviors_name_m ] = behaviors
+    return count
+
+
+@__.deprecated( "Use 'finalize_module' instead." )
 def reclassify_modules(
     attributes: __.typx.Annotated[
         __.cabc.Mapping[ str, __.typx.Any ] | __.types.ModuleType | str,
@@ -135,7 +243,7 @@ def reclassify_modules(
         replacement_class = replacement_class )
 
 
-def _reclassify_module( # noqa: C901,PLR0912
+def _reclassify_module( # noqa: C901,PLR0912,PLR0913
     attributes: __.typx.Annotated[
         __.cabc.Mapping[ str, __.typx.Any ] | __.types.ModuleType | str,
         __.ddoc.Doc(
@@ -153,6 +261,11 @@ def _reclassify_module( # noqa: C901,PLR0912
     recursive: __.typx.Annotated[
         bool, __.ddoc.Doc( ''' Recursively reclassify package modules? ''' )
     ] = False,
+    reclassifications: __.typx.Annotated[
+        __.typx.Optional[ dict[ __.types.ModuleType, type ] ],
+        __.ddoc.Doc(
+            ''' Records original classes of reclassified modules. ''' ),
+    ] = None,
     replacement_class: __.typx.Annotated[
         type[ __.types.ModuleType ],
         __.ddoc.Doc( ''' New class for module. ''' ),
@@ -193,8 +306,11 @@ def _reclassify_module( # noqa: C901,PLR0912
                 value,
                 attributes_namer = attributes_namer,
                 excludes = excludes, recursive = True,
+                reclassifications = reclassifications,
                 replacement_class = replacement_class )
     if module and not isinstance( module, replacement_class ):
+        if reclassifications is not None:
+            reclassifications[ module ] = type( module )
         _seal_module( module, attributes_namer, replacement_class )
 
 
@@ -27,6 +27,7 @@ from . import __
 
 concealment_label = 'concealment'
 immutability_label = 'immutability'
+record_field_label = 'classcore.record'
 
 
 BehaviorExclusionNames: __.typx.TypeAlias = __.cabc.Set[ str ]
@@ -45,6 +46,15 @@ BehaviorExclusionVerifiers: __.typx.TypeAlias = (
     __.cabc.Sequence[ BehaviorExclusionVerifier ] )
 BehaviorExclusionVerifiersOmni: __.typx.TypeAlias = (
     BehaviorExclusionVerifiers | __.typx.Literal[ '*' ] )
+ClassRecipe: __.typx.TypeAlias = tuple[
+    type,
+    str,
+    tuple[ type, ... ],
+    __.cabc.Mapping[ str, __.typx.Any ],
+    __.cabc.Mapping[ str, __.typx.Any ],
+]
+ClassSealer: __.typx.TypeAlias = __.cabc.Callable[ [ ], None ]
+ClassSealers: __.typx.TypeAlias = __.cabc.Sequence[ ClassSealer ]
 ErrorClassProvider: __.typx.TypeAlias = __.typx.Annotated[
     __.cabc.Callable[ [ str ], type[ Exception ] ],
     __.ddoc.Doc(
@@ -0,0 +1,154 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Packed storage of numeric fields of dataclass instances. '''
+
+
+import                      struct
+
+from .. import utilities as _utilities
+from . import __
+from . import decorators as _decorators
+from . import nomina as _nomina
+
+
+_dataclass_core = __.dcls.dataclass( kw_only = True )
+_formats: dict[ type, str ] = { bool: '?', float: 'd', int: 'q' }
+
+
+class _PackedField:
+    ''' Dataclass field, stored in packed slot and decoded on read. '''
+
+    __slots__ = (
+        'getter', 'name', 'offset', 'packer', 'setter', 'size', 'unpacker' )
+
+    def __init__(
+        self,
+        slot: __.typx.Any, name: str, format_: str, offset: int, size: int,
+    ) -> None:
+        self.name = name
+        self.getter = slot.__get__
+        self.setter = slot.__set__
+        structure = struct.Struct( f"<{format_}" )
+        self.packer = structure.pack_into
+        self.unpacker = structure.unpack_from
+        self.offset = offset
+        self.size = size
+
+    def __get__(
+        self, instance: __.typx.Any, owner: __.typx.Optional[ type ] = None
+    ) -> __.typx.Any:
+        if instance is None: return self
+        return self.unpacker( self.getter( instance ), self.offset )[ 0 ]
+
+    def __set__( self, instance: object, value: __.typx.Any ) -> None:
+        # Bytes are immutable, so packs value into copy of buffer.
+        try: buffer = bytearray( self.getter( instance ) )
+        except AttributeError: buffer = bytearray( self.size )
+        try: self.packer( buffer, self.offset, value )
+        except struct.error as exc:
+            from ..exceptions import PackingValueInvalidity
+            raise PackingValueInvalidity(
+                self.name,
+                _utilities.qualify_class_name( type( instance ) ),
+                str( exc ) ) from None
+        self.setter( instance, bytes( buffer ) )
+
+
+def produce_dataclass_packing_decorator(
+    attributes_namer: _nomina.AttributesNamer,
+    weakref_slot: bool = False,
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator to make slotted dataclass with packed fields.
+
+        Values of fields, which must be annotated as integers, floats, or
+        booleans, are stored together, as bytes, in one slot. Fields are
+        descriptors, which decode their values on read. Integers are signed
+        64-bit values and floats are double-precision values. Bookkeeping
+        fields retain their own slots.
+    '''
+    packed_name = attributes_namer( 'instance', 'packed' )
+
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        cls = _dataclass_core( cls )
+        fields = __.dcls.fields( cls ) # pyright: ignore
+        names = _decorators.survey_data_fields_names( cls )
+        formats = _calculate_formats( cls, names )
+        inheriteds = _collect_inherited_slots( cls )
+        slots = [
+            field.name for field in fields if field.name not in names ]
+        slots.append( packed_name )
+        if weakref_slot and not any(
+            base.__weakrefoffset__ for base in cls.__bases__
+        ): slots.append( '__weakref__' )
+        namespace = dict( cls.__dict__ )
+        namespace[ '__slots__' ] = tuple(
+            slot for slot in slots if slot not in inheriteds )
+        for field in fields: namespace.pop( field.name, None )
+        namespace.pop( '__dict__', None )
+        namespace.pop( '__weakref__', None )
+        cls_ = type( cls )( cls.__name__, cls.__bases__, namespace )
+        cls_.__qualname__ = cls.__qualname__
+        slot = _access_slot( cls_, packed_name )
+        size = struct.calcsize( '<' + ''.join( formats ) )
+        offset = 0
+        for name, format_ in zip( names, formats ):
+            setattr(
+                cls_, name, _PackedField( slot, name, format_, offset, size ) )
+            offset += struct.calcsize( f"<{format_}" )
+        return cls_
+
+    return decorate
+
+
+def _access_slot( cls: type, name: str ) -> __.typx.Any:
+    for base in cls.__mro__:
+        if name in base.__dict__: return base.__dict__[ name ]
+    return None
+
+
+def _calculate_formats(
+    cls: type, names: __.cabc.Sequence[ str ]
+) -> tuple[ str, ... ]:
+    from ..exceptions import PackingInvalidity
+    try: hints = __.typx.get_type_hints( cls )
+    except NameError as exc:
+        raise PackingInvalidity(
+            _utilities.qualify_class_name( cls ),
+            f"Could not resolve annotations: {exc}" ) from None
+    formats: list[ str ] = [ ]
+    for name in names:
+        format_ = _formats.get( hints.get( name ) ) # pyright: ignore
+        if format_ is None:
+            raise PackingInvalidity(
+                _utilities.qualify_class_name( cls ),
+                f"Field {name!r} is not annotated as "
+                "'bool', 'float', or 'int'." )
+        formats.append( format_ )
+    return tuple( formats )
+
+
+def _collect_inherited_slots( cls: type ) -> frozenset[ str ]:
+    names: set[ str ] = set( )
+    for base in cls.__mro__[ 1 : ]:
+        slots: __.typx.Any = base.__dict__.get( '__slots__', ( ) )
+        if isinstance( slots, str ): slots = ( slots, )
+        names.update( slots )
+    return frozenset( names )
@@ -0,0 +1,156 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Materialization of lazy state ahead of process forks. '''
+
+
+from .. import utilities as _utilities
+from . import __
+from . import behaviors as _behaviors
+from . import classes as _classes
+from . import modules as _modules
+
+
+class PrewarmReport( _classes.DataclassObject ):
+    ''' Summary of state materialized by prewarming. '''
+
+    caches: __.typx.Annotated[
+        __.cabc.Mapping[ str, int ],
+        __.ddoc.Doc(
+            ''' Numbers of visited classes with materialized entries, by
+                cache.
+            ''' ),
+    ]
+    classes: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Number of classes visited. ''' ) ]
+    classes_sealed: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Number of classes with deferred sealing. ''' ) ]
+    modules_documented: __.typx.Annotated[
+        int,
+        __.ddoc.Doc( ''' Number of modules with deferred docstrings. ''' ),
+    ]
+    objects_frozen: __.typx.Annotated[
+        int,
+        __.ddoc.Doc(
+            ''' Number of objects in permanent garbage collector generation.
+            ''' ),
+    ]
+
+
+_metaclasses_default = (
+    _classes.Class,
+    _classes.Dataclass,
+    _classes.DataclassMutable,
+    _classes.EnumClass,
+    _classes.ProtocolClass,
+    _classes.ProtocolDataclass,
+    _classes.ProtocolDataclassMutable,
+    _classes.Tupleclass,
+)
+
+
+def prewarm(
+    *,
+    gc_freeze: __.typx.Annotated[
+        bool,
+        __.ddoc.Doc(
+            ''' Move all tracked objects into permanent generation? ''' ),
+    ] = False,
+    metaclasses: __.typx.Annotated[
+        __.cabc.Sequence[ type ],
+        __.ddoc.Doc( ''' Metaclasses whose classes should be prewarmed. ''' ),
+    ] = _metaclasses_default,
+) -> PrewarmReport:
+    ''' Materializes lazily-computed state of classes and modules.
+
+        Intended for pre-fork servers, which should call this in the parent
+        process, after importing everything and before forking workers.
+        Children then start with sealed classes, computed name digests, and
+        assigned docstrings, rather than each computing these on first use.
+
+        Visits every live class produced by the metaclasses, seals classes
+        with deferred sealing, computes their mangled name digests, and
+        materializes their entries in the caches of imported modules, such
+        as the profiles used for pickling, copying, replacement, and
+        assembly of instances, the converters of dataclass instances, the
+        codecs of records, and the verdicts caches of protocol classes. Cache
+        entries, which cannot be materialized, are skipped; the failures
+        surface on first use instead. Also assigns deferred module
+        docstrings. Optionally, freezes the garbage collector so that
+        collections in children do not write to pages shared with the
+        parent.
+
+        Must be called from a single thread: no import lock is held, so no
+        other threads may import modules, produce classes, or use these
+        classes or modules while prewarming is in progress.
+    '''
+    metaclasses_ = tuple( metaclasses )
+    classes = [
+        cls for cls in _survey_classes( ) if isinstance( cls, metaclasses_ ) ]
+    classes_sealed_count = sum(
+        map( _behaviors.is_class_sealing_pending, classes ) )
+    prewarmers = dict( __.survey_prewarmers( ) )
+    caches_counts = dict.fromkeys( prewarmers, 0 )
+    for cls in classes:
+        _behaviors.seal_class( cls )
+        _utilities.mangle_name( cls, '' )
+        _prewarm_caches( cls, prewarmers, caches_counts )
+    modules_count = _modules.assign_deferred_module_docstrings( )
+    __.provide_error_class( 'AttributeImmutability' )
+    objects_count = 0
+    if gc_freeze:
+        import gc
+        gc.freeze( )
+        objects_count = gc.get_freeze_count( )
+    return PrewarmReport(
+        caches = __.types.MappingProxyType( caches_counts ),
+        classes = len( classes ),
+        classes_sealed = classes_sealed_count,
+        modules_documented = modules_count,
+        objects_frozen = objects_count )
+
+
+def _prewarm_caches(
+    cls: type,
+    prewarmers: __.cabc.Mapping[ str, __.cabc.Callable[ [ type ], bool ] ],
+    counts: dict[ str, int ],
+) -> None:
+    for name, prewarmer in prewarmers.items( ):
+        # Failures surface on first use instead, as without prewarming.
+        try: prewarmed = prewarmer( cls )
+        except Exception: continue # noqa: S112
+        counts[ name ] += prewarmed
+
+
+def _survey_classes( ) -> __.cabc.Iterator[ type ]:
+    seen: set[ int ] = set( )
+    stack: list[ type ] = [ object ]
+    while stack:
+        cls = stack.pop( )
+        # Unbound call works for metaclasses too.
+        for subclass in type.__subclasses__( cls ):
+            if id( subclass ) in seen: continue
+            seen.add( id( subclass ) )
+            stack.append( subclass )
+            yield subclass
+
+
+_modules.finalize_module(
+    __name__, dynadoc_defer = True, dynadoc_table = __.fragments )
@@ -0,0 +1,189 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Cached runtime structural checks for standard protocol classes. '''
+
+
+from . import __
+from . import nomina as _nomina
+
+
+_InstancesVerdict: __.typx.TypeAlias = (
+    bool | tuple[ tuple[ str, bool ], ... ] )
+
+
+_attribute_absence = object( )
+# Structural verdicts by protocol class, then by concrete class of instances.
+_instances_verdicts: __.weakref.WeakKeyDictionary[
+    type, __.weakref.WeakKeyDictionary[ type, _InstancesVerdict ]
+] = __.weakref.WeakKeyDictionary( )
+_protocol_bases_names = frozenset( ( 'Generic', 'Protocol' ) )
+_protocol_instances_checker: __.cabc.Callable[ [ type, object ], bool ] = (
+    getattr( type( __.typx.Protocol ), '__instancecheck__' ) )
+
+
+def check_instance( protocol: type, instance: object ) -> bool:
+    ''' Is instance structurally compatible with protocol class?
+
+        Nominal compatibility, via inheritance or registration, is checked
+        first against the caches of abstract base classes, which are
+        invalidated whenever classes are registered. Structural verdicts are
+        then cached per protocol class and per concrete class of instances,
+        since members found on a concrete class are the same for all of its
+        instances. Only members, which instances must provide from their
+        own dictionaries, are checked for each instance. As with the caches
+        of abstract base classes, later changes to concrete classes are not
+        noticed.
+
+        Checks against concrete subclasses of protocol classes, against
+        protocol classes which are not runtime-checkable, and of instances
+        which masquerade as other classes are delegated to the protocol
+        metaclass.
+    '''
+    cls = type( instance )
+    if (    instance.__class__ is not cls
+        or  not getattr( protocol, '_is_protocol', False )
+        or  not getattr( protocol, '_is_runtime_protocol', False )
+    ): return _protocol_instances_checker( protocol, instance )
+    if __.abc.ABCMeta.__instancecheck__( protocol, instance ): return True
+    verdicts = _instances_verdicts.get( protocol )
+    if verdicts is None: verdicts = _access_instances_verdicts( protocol )
+    verdict = verdicts.get( cls )
+    if verdict is None:
+        verdict = verdicts[ cls ] = (
+            _calculate_instances_verdict( protocol, cls ) )
+    if verdict is True or verdict is False: return verdict
+    return _is_instance_conformant( instance, verdict )
+
+
+def produce_members_declarations_recorder(
+    attributes_namer: _nomina.AttributesNamer,
+    decorator: _nomina.Decorator[ __.U ],
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator which records members declared by class.
+
+        Protocol members are surveyed from class dictionaries, which also
+        hold the attributes and methods injected for standard behaviors.
+        Only attributes and annotations, which are present before the
+        decorator applies, are recorded as declared members.
+    '''
+    declarations_name = attributes_namer( 'class', 'protocol_declarations' )
+
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        annotations = __.typx.get_annotations(
+            cls, format = __.typx.Format.FORWARDREF )
+        declarations = frozenset( ( *cls.__dict__, *annotations ) ) - {
+            __.ddoc.fragments_name_default }
+        cls_ = decorator( cls )
+        setattr( cls_, declarations_name, declarations )
+        return cls_
+
+    return decorate
+
+
+def repair_protocol_members(
+    cls: type, /, attributes_namer: _nomina.AttributesNamer
+) -> None:
+    ''' Excludes undeclared attributes and methods from protocol members. '''
+    members: __.typx.Optional[ set[ str ] ] = (
+        cls.__dict__.get( '__protocol_attrs__' ) )
+    if members is None: return
+    declarations_name = attributes_namer( 'class', 'protocol_declarations' )
+    members_ = {
+        name for name in members
+        if _is_member_declared( cls, name, declarations_name ) }
+    if len( members_ ) < len( members ):
+        setattr( cls, '__protocol_attrs__', members_ )
+
+
+def _access_class_attribute( cls: type, name: str ) -> __.typx.Any:
+    for base in cls.__mro__:
+        if name in base.__dict__: return base.__dict__[ name ]
+    return _attribute_absence
+
+
+def _access_instances_verdicts(
+    protocol: type
+) -> __.weakref.WeakKeyDictionary[ type, _InstancesVerdict ]:
+    # Racing threads produce empty mappings; first one wins.
+    return _instances_verdicts.setdefault(
+        protocol, __.weakref.WeakKeyDictionary( ) )
+
+
+def _calculate_instances_verdict(
+    protocol: type, cls: type
+) -> _InstancesVerdict:
+    # Members, which are missing from concrete class, must be checked on
+    # instances, since they may be assigned during initialization.
+    noncallables: __.cabc.Set[ str ] = (
+        getattr( protocol, '__non_callable_proto_members__', frozenset( ) ) )
+    requirements: list[ tuple[ str, bool ] ] = [ ]
+    for name in __.typx.get_protocol_members( protocol ):
+        attribute = _access_class_attribute( cls, name )
+        callable_ = name not in noncallables
+        if attribute is _attribute_absence or (
+            attribute is None and callable_
+        ): requirements.append( ( name, callable_ ) )
+    if not requirements: return True
+    if not any( '__dict__' in base.__dict__ for base in cls.__mro__ ):
+        return False
+    return tuple( requirements )
+
+
+def _is_instance_conformant(
+    instance: object, requirements: tuple[ tuple[ str, bool ], ... ]
+) -> bool:
+    try: dictionary = object.__getattribute__( instance, '__dict__' )
+    except AttributeError: return False
+    for name, callable_ in requirements:
+        value = dictionary.get( name, _attribute_absence )
+        if value is _attribute_absence: return False
+        if value is None and callable_: return False
+    return True
+
+
+def _is_member_declared(
+    cls: type, name: str, declarations_name: str
+) -> bool:
+    # Same bases as surveyed for protocol members.
+    for base in cls.__mro__[ : -1 ]:
+        if base.__name__ in _protocol_bases_names: continue
+        declarations: __.typx.Optional[ frozenset[ str ] ] = (
+            base.__dict__.get( declarations_name ) )
+        if declarations is not None:
+            if name in declarations: return True
+            continue
+        if name in base.__dict__: return True
+        annotations = __.typx.get_annotations(
+            base, format = __.typx.Format.FORWARDREF )
+        if name in annotations: return True
+    return False
+
+
+def _prewarm_instances_verdicts( cls: type ) -> bool:
+    # Concrete classes of checked instances are not known in advance.
+    if (    not getattr( cls, '_is_protocol', False )
+        or  not getattr( cls, '_is_runtime_protocol', False )
+    ): return False
+    _access_instances_verdicts( cls )
+    return True
+
+
+__.register_prewarmer( 'protocols', _prewarm_instances_verdicts )
@@ -0,0 +1,817 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Compact binary records for instances of dataclasses. '''
+
+
+import                      array
+import itertools as         itert
+import                      mmap
+import                      os
+import                      struct
+
+from .. import utilities as _utilities
+from . import __
+from . import classes as _classes
+from . import decorators as _decorators
+from . import modules as _modules
+
+
+_batch_profiles: __.weakref.WeakKeyDictionary[
+    type, '_BatchProfile'
+] = __.weakref.WeakKeyDictionary( )
+# Arrays lack booleans; bytes hold them.
+_column_typecodes = { '?': 'b', 'd': 'd', 'q': 'q' }
+_fixed_formats: dict[ type, str ] = { bool: '?', float: 'd', int: 'q' }
+_length_format = 'I'
+_record_codecs: __.weakref.WeakKeyDictionary[
+    type, 'RecordCodec'
+] = __.weakref.WeakKeyDictionary( )
+_store_batch_size = 1024
+_store_flag_indexed = 1
+# Magic, version, flags, records count, index offset, schema size.
+_store_head = struct.Struct( '<4sHHQQI' )
+_store_magic = b'CCRS'
+_store_offset = struct.Struct( '<Q' )
+_store_version = 1
+
+
+class _BatchProfile( __.typx.NamedTuple ):
+
+    names: tuple[ str, ... ]
+    typecodes: tuple[ __.typx.Optional[ str ], ... ]
+    textuals: tuple[ bool, ... ]
+    booleans: tuple[ int, ... ]
+    access: __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]
+    assemble: __.cabc.Callable[
+        [ __.cabc.Iterable[ __.typx.Any ] ], __.typx.Any ]
+
+
+class _VariableColumn:
+    ''' Strings or bytes as contiguous content with offsets. '''
+
+    __slots__ = ( 'content', 'offsets', 'textual' )
+
+    def __init__( self, textual: bool ) -> None:
+        self.content = bytearray( )
+        self.offsets = array.array( 'Q', ( 0, ) )
+        self.textual = textual
+
+    def __getitem__( self, index: int ) -> __.typx.Any:
+        offsets = self.offsets
+        content = self.content[ offsets[ index ] : offsets[ index + 1 ] ]
+        return content.decode( ) if self.textual else bytes( content )
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.typx.Any ]:
+        return map( self.__getitem__, range( len( self ) ) )
+
+    def __len__( self ) -> int: return len( self.offsets ) - 1
+
+    def append( self, value: __.typx.Any ) -> None:
+        self.content += value.encode( ) if self.textual else value
+        self.offsets.append( len( self.content ) )
+
+    def extend( self, values: __.cabc.Iterable[ __.typx.Any ] ) -> None:
+        if isinstance( values, _VariableColumn ):
+            base = len( self.content )
+            self.content += values.content
+            self.offsets.extend(
+                base + offset for offset in values.offsets[ 1 : ] )
+            return
+        for value in values: self.append( value )
+
+    def select( self, start: int, stop: int ) -> '_VariableColumn':
+        ''' Returns contiguous range of column as new column. '''
+        column = _VariableColumn( self.textual )
+        begin, end = self.offsets[ start ], self.offsets[ stop ]
+        column.content = self.content[ begin : end ]
+        column.offsets = array.array(
+            'Q', ( offset - begin for offset in
+                   self.offsets[ start : stop + 1 ] ) )
+        return column
+
+    def take( self, indices: __.cabc.Sequence[ int ] ) -> '_VariableColumn':
+        ''' Returns column with values at indices, in order. '''
+        column = _VariableColumn( self.textual )
+        content, offsets = self.content, self.offsets
+        content_, offsets_ = column.content, column.offsets
+        for index in indices:
+            content_ += content[ offsets[ index ] : offsets[ index + 1 ] ]
+            offsets_.append( len( content_ ) )
+        return column
+
+
+_Column: __.typx.TypeAlias = (
+    'array.array[ __.typx.Any ] | _VariableColumn' )
+
+
+class RecordCodec( _classes.Object ):
+    ''' Binary codec for instances of dataclass with fixed schema.
+
+        Records consist of a head, with the values of fixed-size fields and
+        the lengths of variable-size fields, followed by the contents of the
+        variable-size fields. Integers are signed 64-bit values and larger
+        ones cannot be encoded; floats are double-precision values. Strings
+        are encoded as UTF-8. All values are little-endian and unaligned.
+    '''
+
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Class of encoded instances. ''' ) ]
+    record_size: __.typx.Annotated[
+        __.typx.Optional[ int ],
+        __.ddoc.Doc(
+            ''' Size of each record, if all fields have fixed sizes. ''' ),
+    ]
+    schema: __.typx.Annotated[
+        str,
+        __.ddoc.Doc( ''' Names and types of encoded fields, in order. ''' ),
+    ]
+
+    def __init__( self, record_class: type ) -> None:
+        name = record_class.__qualname__
+        if not __.dcls.is_dataclass( record_class ):
+            _raise_schema_invalidity( name, 'Class is not a dataclass.' )
+        names = _decorators.survey_data_fields_names( record_class )
+        formats, variables, schema = (
+            _calculate_record_layout( record_class, names ) )
+        self.record_class = record_class
+        self.schema = schema
+        self._fields = tuple( zip( names, formats ) )
+        self._head = struct.Struct( '<' + ''.join( formats ) )
+        self.record_size = None if variables else self._head.size
+        self._variables = variables
+        self._access = _utilities.produce_attributes_accessor( names )
+        self._assemble = _decorators.produce_instances_assembler(
+            record_class )
+
+    def encode( self, instance: __.typx.Any ) -> bytes:
+        ''' Encodes instance as record. '''
+        self._verify_instance( instance )
+        if not self._variables:
+            heads = self._access( instance )
+            try: return self._head.pack( *heads )
+            except struct.error as exc:
+                self._raise_value_invalidity( heads, exc )
+        heads, contents = self._divide_values( instance )
+        try: head = self._head.pack( *heads )
+        except struct.error as exc: self._raise_value_invalidity( heads, exc )
+        return head + b''.join( contents )
+
+    def encode_many(
+        self, instances: __.cabc.Iterable[ __.typx.Any ]
+    ) -> bytearray:
+        ''' Encodes instances as consecutive records in one buffer.
+
+            Buffer is allocated once, at its final size.
+        '''
+        head = self._head
+        if not self._variables:
+            instances_ = tuple( instances )
+            access, cls, size = self._access, self.record_class, head.size
+            buffer = bytearray( size * len( instances_ ) )
+            instance = None
+            try:
+                for index, instance in enumerate( instances_ ):
+                    if instance.__class__ is not cls:
+                        self._verify_instance( instance )
+                    head.pack_into( buffer, index * size, *access( instance ) )
+            except struct.error as exc:
+                self._raise_value_invalidity( access( instance ), exc )
+            return buffer
+        parts: list[ bytes ] = [ ]
+        heads: list[ __.typx.Any ] = [ ]
+        try:
+            for instance in instances:
+                heads, contents = self._divide_values( instance )
+                parts.append( head.pack( *heads ) )
+                parts.extend( contents )
+        except struct.error as exc: self._raise_value_invalidity( heads, exc )
+        # Joins measure parts before allocating.
+        return bytearray( ).join( parts )
+
+    def decode(
+        self, buffer: __.typx.Buffer, offset: int = 0
+    ) -> __.typx.Any:
+        ''' Decodes instance from record at offset in buffer.
+
+            Values are read in place, without copying the buffer. Instances
+            are assembled directly, as with unpickling, bypassing their
+            initializers.
+        '''
+        if not self._variables:
+            return self._assemble( self._head.unpack_from( buffer, offset ) )
+        with memoryview( buffer ) as view:
+            values, _ = self._decode_values( view, offset )
+        return self._assemble( values )
+
+    def decode_many(
+        self, buffer: __.typx.Buffer, offset: int = 0
+    ) -> list[ __.typx.Any ]:
+        ''' Decodes instances from consecutive records in buffer. '''
+        assemble = self._assemble
+        with memoryview( buffer ) as view:
+            if not self._variables:
+                return list( map(
+                    assemble, self._head.iter_unpack( view[ offset : ] ) ) )
+            instances: list[ __.typx.Any ] = [ ]
+            decode_values = self._decode_values
+            end = view.nbytes
+            while offset < end:
+                values, offset = decode_values( view, offset )
+                instances.append( assemble( values ) )
+        return instances
+
+    def _decode_values(
+        self, view: memoryview, offset: int
+    ) -> tuple[ list[ __.typx.Any ], int ]:
+        values = list( self._head.unpack_from( view, offset ) )
+        offset += self._head.size
+        for index, textual in self._variables:
+            end = offset + values[ index ]
+            content = view[ offset : end ]
+            values[ index ] = (
+                str( content, 'utf-8' ) if textual else content.tobytes( ) )
+            offset = end
+        return values, offset
+
+    def _divide_values(
+        self, instance: __.typx.Any
+    ) -> tuple[ list[ __.typx.Any ], list[ bytes ] ]:
+        if instance.__class__ is not self.record_class:
+            self._verify_instance( instance )
+        heads = list( self._access( instance ) )
+        contents: list[ bytes ] = [ ]
+        for index, textual in self._variables:
+            content = heads[ index ]
+            if textual: content = content.encode( )
+            contents.append( content )
+            heads[ index ] = len( content )
+        return heads, contents
+
+    def _raise_value_invalidity(
+        self, values: __.cabc.Sequence[ __.typx.Any ], error: struct.error
+    ) -> __.typx.NoReturn:
+        from ..exceptions import RecordValueInvalidity
+        target = _utilities.qualify_class_name( self.record_class )
+        # Values are verified one by one, so one field reproduces error.
+        for ( name, format_ ), value in zip( self._fields, values ):
+            reason = _diagnose_packing( format_, value )
+            if reason:
+                raise RecordValueInvalidity( name, target, reason ) from None
+        raise error
+
+    def _verify_instance( self, instance: __.typx.Any ) -> None:
+        cls: type = instance.__class__
+        if cls is self.record_class: return
+        _raise_schema_invalidity(
+            _utilities.qualify_class_name( cls ),
+            f"Codec is for class {self.record_class.__qualname__!r}." )
+
+
+def produce_record_codec(
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Dataclass with fixed schema. ''' )
+    ],
+) -> RecordCodec:
+    ''' Produces binary codec for instances of dataclass.
+
+        Fields must be annotated as integers, floats, booleans, strings, or
+        bytes. Codecs are produced once per class.
+    '''
+    return _utilities.access_class_cache(
+        _record_codecs, record_class, RecordCodec )
+
+
+class RecordBatch( _classes.Object ):
+    ''' Columnar collection of instances of dataclass with fixed schema.
+
+        Each field is stored in its own column: integers, floats, and
+        booleans in typed arrays; strings and bytes as contiguous content
+        with offsets. No objects are held per instance. Instances are
+        assembled only when accessed, bypassing their initializers, as with
+        record codecs. Fields must be annotated as for record codecs.
+    '''
+
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Class of collected instances. ''' ) ]
+
+    def __init__(
+        self,
+        record_class: type,
+        instances: __.cabc.Iterable[ __.typx.Any ] = ( ),
+    ) -> None:
+        profile = _access_batch_profile( record_class )
+        self.record_class = record_class
+        self._columns: tuple[ _Column, ... ] = tuple(
+            _VariableColumn( textual ) if typecode is None
+            else array.array( typecode )
+            for typecode, textual
+            in zip( profile.typecodes, profile.textuals ) )
+        self.extend( instances )
+
+    def __getitem__( self, index: int | slice ) -> __.typx.Any:
+        count = len( self )
+        if isinstance( index, slice ):
+            start, stop, step = index.indices( count )
+            if 1 != step: return self.take( range( start, stop, step ) )
+            batch = RecordBatch( self.record_class )
+            stop = max( start, stop )
+            for target, column in zip( batch._columns, self._columns ):
+                target.extend( _select_column( column, start, stop ) )
+            return batch
+        index_ = index + count if index < 0 else index
+        if not 0 <= index_ < count:
+            from ..exceptions import RecordAbsence
+            raise RecordAbsence( index, count )
+        profile = _access_batch_profile( self.record_class )
+        values = [ column[ index_ ] for column in self._columns ]
+        for position in profile.booleans:
+            values[ position ] = bool( values[ position ] )
+        return profile.assemble( values )
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.typx.Any ]:
+        profile = _access_batch_profile( self.record_class )
+        columns = map( self._iterate_column, range( len( self._columns ) ) )
+        return map( profile.assemble, zip( *columns ) )
+
+    def __len__( self ) -> int: return len( self._columns[ 0 ] )
+
+    def append( self, instance: __.typx.Any ) -> None:
+        ''' Appends values of instance to columns. '''
+        self.extend( ( instance, ) )
+
+    def column( self, name: str ) -> __.cabc.Sequence[ __.typx.Any ]:
+        ''' Returns copy of column of values for field.
+
+            Numeric and boolean columns are typed arrays, which support the
+            buffer protocol. Columns of strings or bytes are lists.
+        '''
+        column = self._columns[ self._locate_column( name ) ]
+        if isinstance( column, _VariableColumn ): return list( column )
+        return array.array( column.typecode, column )
+
+    def extend( self, instances: __.cabc.Iterable[ __.typx.Any ] ) -> None:
+        ''' Appends values of instances to columns.
+
+            Columns are unchanged if any instance is of another class or has
+            values which do not fit their columns.
+        '''
+        profile = _access_batch_profile( self.record_class )
+        cls = self.record_class
+        rows: list[ tuple[ __.typx.Any, ... ] ] = [ ]
+        for instance in instances:
+            if instance.__class__ is not cls:
+                _raise_schema_invalidity(
+                    _utilities.qualify_class_name( instance.__class__ ),
+                    f"Batch is for class {cls.__qualname__!r}." )
+            rows.append( profile.access( instance ) )
+        if not rows: return
+        # Columns are filled in full or restored to original lengths.
+        count = len( self )
+        try:
+            for column, values in zip( self._columns, zip( *rows ) ):
+                column.extend( values )
+        except BaseException:
+            for column in self._columns: _truncate_column( column, count )
+            raise
+
+    def filter(
+        self, name: str, predicate: __.cabc.Callable[ [ __.typx.Any ], bool ]
+    ) -> 'RecordBatch':
+        ''' Returns batch of instances whose field satisfies predicate.
+
+            Only column of field is read; instances are not assembled.
+        '''
+        values = self._iterate_column( self._locate_column( name ) )
+        return self.take( tuple(
+            index for index, value in enumerate( values )
+            if predicate( value ) ) )
+
+    def take( self, indices: __.cabc.Iterable[ int ] ) -> 'RecordBatch':
+        ''' Returns batch of instances at indices, in order. '''
+        count = len( self )
+        indices_ = tuple(
+            index + count if index < 0 else index for index in indices )
+        for index in indices_:
+            if not 0 <= index < count:
+                from ..exceptions import RecordAbsence
+                raise RecordAbsence( index, count )
+        batch = RecordBatch( self.record_class )
+        for target, column in zip( batch._columns, self._columns ):
+            target.extend( _take_column( column, indices_ ) )
+        return batch
+
+    def transform(
+        self,
+        name: str,
+        function: __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ],
+    ) -> 'RecordBatch':
+        ''' Returns batch with function applied to each value of field.
+
+            Other columns are copied without assembling instances.
+        '''
+        position = self._locate_column( name )
+        batch = RecordBatch( self.record_class )
+        for index, ( target, column ) in enumerate(
+            zip( batch._columns, self._columns )
+        ):
+            if index == position:
+                target.extend( map( function, self._iterate_column( index ) ) )
+            else: target.extend( column )
+        return batch
+
+    def _iterate_column(
+        self, position: int
+    ) -> __.cabc.Iterable[ __.typx.Any ]:
+        column = self._columns[ position ]
+        profile = _access_batch_profile( self.record_class )
+        if position in profile.booleans: return map( bool, column )
+        return column
+
+    def _locate_column( self, name: str ) -> int:
+        names = _access_batch_profile( self.record_class ).names
+        if name in names: return names.index( name )
+        from ..exceptions import RecordFieldAbsence
+        raise RecordFieldAbsence(
+            name, _utilities.qualify_class_name( self.record_class ) )
+
+
+class RecordStore( _classes.Object ):
+    ''' Read-only sequence of records in memory-mapped file.
+
+        Instances are decoded from the mapping only when accessed, so opening
+        a store costs the same regardless of its size. Pages are loaded on
+        demand by the operating system and are shared between processes
+        which map the same file.
+    '''
+
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Class of stored instances. ''' ) ]
+
+    def __init__(
+        self, location: str | os.PathLike[ str ], record_class: type
+    ) -> None:
+        location_ = os.fspath( location )
+        with open( location_, 'rb' ) as file:
+            if os.fstat( file.fileno( ) ).st_size < _store_head.size:
+                _raise_store_invalidity( location_, 'Store is truncated.' )
+            mapping = mmap.mmap(
+                file.fileno( ), 0, access = mmap.ACCESS_READ )
+        try:
+            self._attach(
+                location_, mapping, produce_record_codec( record_class ) )
+        except BaseException:
+            mapping.close( )
+            raise
+
+    def __enter__( self ) -> __.typx.Self: return self
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None: self.close( )
+
+    def __getitem__( self, index: int | slice ) -> __.typx.Any:
+        count = self._count
+        if isinstance( index, slice ):
+            start, stop, step = index.indices( count )
+            if 1 == step and self._size:
+                return self._decode_range( start, stop )
+            return list( map( self._decode, range( start, stop, step ) ) )
+        index_ = index + count if index < 0 else index
+        if not 0 <= index_ < count:
+            from ..exceptions import RecordAbsence
+            raise RecordAbsence( index, count )
+        return self._decode( index_ )
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.typx.Any ]:
+        return map( self._decode, range( self._count ) )
+
+    def __len__( self ) -> int: return self._count
+
+    def close( self ) -> None:
+        ''' Unmaps file. Previously decoded instances remain valid. '''
+        self._mapping.close( )
+
+    def _attach(
+        self, location: str, mapping: __.typx.Any, codec: RecordCodec
+    ) -> None:
+        count, start, index = _survey_store( location, mapping, codec )
+        self.record_class = codec.record_class
+        self._codec = codec
+        self._count = count
+        self._index = index
+        self._mapping = mapping
+        self._size = codec.record_size or 0
+        self._start = start
+
+    def _decode( self, index: int ) -> __.typx.Any:
+        if self._size:
+            offset = self._start + index * self._size
+        else:
+            offset, = _store_offset.unpack_from(
+                self._mapping, self._index + index * _store_offset.size )
+        return self._codec.decode( self._mapping, offset )
+
+    def _decode_range( self, start: int, stop: int ) -> list[ __.typx.Any ]:
+        if start >= stop: return [ ]
+        begin = self._start + start * self._size
+        end = self._start + stop * self._size
+        with memoryview( self._mapping ) as view, view[ begin : end ] as part:
+            return self._codec.decode_many( part )
+
+
+class SharedRecordStore( RecordStore ):
+    ''' Read-only sequence of records in shared memory block.
+
+        Handles are pickled by name of block, so passing one to a worker
+        process attaches the worker to the same block rather than copying
+        records. Memory therefore scales with size of dataset rather than
+        with number of workers. Handles should be passed to child processes,
+        such as process pool workers, which share the resource tracker of
+        their parent.
+    '''
+
+    name: __.typx.Annotated[
+        str, __.ddoc.Doc( ''' Name of shared memory block. ''' ) ]
+
+    def __init__( self, name: str, record_class: type ) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+        memory = SharedMemory( name )
+        try:
+            self._attach(
+                name, memory.buf, produce_record_codec( record_class ) )
+        except BaseException:
+            memory.close( )
+            raise
+        self.name = name
+        self._memory = memory
+
+    def __reduce__( self ) -> tuple[ __.typx.Any, ... ]:
+        return ( self.__class__, ( self.name, self.record_class ) )
+
+    def close( self ) -> None:
+        ''' Detaches from block. Previously decoded instances remain valid. '''
+        self._memory.close( )
+
+    def unlink( self ) -> None:
+        ''' Destroys block once all handles to it are closed.
+
+            Should be called once, by owner of block, after workers finish.
+        '''
+        self._memory.unlink( )
+
+
+def open_record_store(
+    location: __.typx.Annotated[
+        str | os.PathLike[ str ],
+        __.ddoc.Doc( ''' Path to file written as record store. ''' ),
+    ],
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Dataclass of stored instances. ''' )
+    ],
+) -> RecordStore:
+    ''' Opens record store as read-only sequence of instances.
+
+        Schema of stored records must match schema of class.
+    '''
+    return RecordStore( location, record_class )
+
+
+def share_records(
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Dataclass with fixed schema. ''' )
+    ],
+    instances: __.typx.Annotated[
+        __.cabc.Iterable[ __.typx.Any ],
+        __.ddoc.Doc( ''' Instances of dataclass, in order. ''' ),
+    ],
+) -> SharedRecordStore:
+    ''' Places instances, as records, into new shared memory block.
+
+        Layout of block is same as that of record store files. Caller owns
+        block and should unlink it when it is no longer needed.
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+    codec = produce_record_codec( record_class )
+    stream = __.io.BytesIO( )
+    _write_store( stream, codec, instances )
+    with stream.getbuffer( ) as content:
+        memory = SharedMemory( create = True, size = content.nbytes )
+        buffer = __.typx.cast( memoryview, memory.buf )
+        buffer[ : content.nbytes ] = content
+    try: return SharedRecordStore( memory.name, record_class )
+    except BaseException:
+        memory.unlink( )
+        raise
+    finally: memory.close( )
+
+
+def write_record_store(
+    location: __.typx.Annotated[
+        str | os.PathLike[ str ],
+        __.ddoc.Doc( ''' Path to file, which is replaced if it exists. ''' ),
+    ],
+    record_class: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Dataclass with fixed schema. ''' )
+    ],
+    instances: __.typx.Annotated[
+        __.cabc.Iterable[ __.typx.Any ],
+        __.ddoc.Doc( ''' Instances of dataclass, in order. ''' ),
+    ],
+) -> int:
+    ''' Writes instances as record store and returns number of records.
+
+        Records of fixed size are laid out back to back. Records of variable
+        size are followed by an index of their offsets. Instances are
+        consumed in batches, so iterables larger than memory can be written.
+    '''
+    with open( location, 'wb' ) as file:
+        return _write_store(
+            file, produce_record_codec( record_class ), instances )
+
+
+def _access_batch_profile( record_class: type ) -> _BatchProfile:
+    return _utilities.access_class_cache(
+        _batch_profiles, record_class, _produce_batch_profile )
+
+
+def _calculate_record_layout(
+    record_class: type, names: tuple[ str, ... ]
+) -> tuple[ list[ str ], tuple[ tuple[ int, bool ], ... ], str ]:
+    try: annotations = __.typx.get_type_hints( record_class )
+    except NameError as exception:
+        _raise_schema_invalidity(
+            record_class.__qualname__,
+            f"Field annotations cannot be evaluated: {exception}" )
+    formats: list[ str ] = [ ]
+    variables: list[ tuple[ int, bool ] ] = [ ]
+    entries: list[ str ] = [ ]
+    for index, name in enumerate( names ):
+        annotation = annotations.get( name )
+        entries.append( f"{name}:{getattr( annotation, '__name__', '' )}" )
+        if annotation in _fixed_formats:
+            formats.append( _fixed_formats[ annotation ] )
+        elif annotation is str or annotation is bytes:
+            formats.append( _length_format )
+            variables.append( ( index, annotation is str ) )
+        else:
+            _raise_schema_invalidity(
+                record_class.__qualname__,
+                f"Field {name!r} has unsupported type {annotation!r}." )
+    return formats, tuple( variables ), ' '.join( entries )
+
+
+def _diagnose_packing( format_: str, value: __.typx.Any ) -> str:
+    try: struct.pack( f"<{format_}", value )
+    except struct.error as exc: return str( exc )
+    return ''
+
+
+def _produce_batch_profile( record_class: type ) -> _BatchProfile:
+    name = record_class.__qualname__
+    if not __.dcls.is_dataclass( record_class ):
+        _raise_schema_invalidity( name, 'Class is not a dataclass.' )
+    names = _decorators.survey_data_fields_names( record_class )
+    if not names:
+        _raise_schema_invalidity( name, 'Class has no fields.' )
+    formats, variables, _ = _calculate_record_layout( record_class, names )
+    textuals = dict( variables )
+    return _BatchProfile(
+        names = names,
+        typecodes = tuple( map( _column_typecodes.get, formats ) ),
+        textuals = tuple(
+            textuals.get( index, False ) for index in range( len( names ) ) ),
+        booleans = tuple(
+            index for index, format_ in enumerate( formats )
+            if '?' == format_ ),
+        access = _utilities.produce_attributes_accessor( names ),
+        assemble = _decorators.produce_instances_assembler( record_class ) )
+
+
+def _prewarm_record_caches( cls: type ) -> bool:
+    # Schemas are only known to be supported for classes already in use.
+    if cls not in _record_codecs and cls not in _batch_profiles: return False
+    produce_record_codec( cls )
+    _access_batch_profile( cls )
+    return True
+
+
+def _raise_schema_invalidity(
+    target: str, reason: str
+) -> __.typx.NoReturn:
+    from ..exceptions import RecordSchemaInvalidity
+    raise RecordSchemaInvalidity( target, reason )
+
+
+def _raise_store_invalidity(
+    location: str, reason: str
+) -> __.typx.NoReturn:
+    from ..exceptions import RecordStoreInvalidity
+    raise RecordStoreInvalidity( location, reason )
+
+
+def _select_column( column: _Column, start: int, stop: int ) -> _Column:
+    if isinstance( column, _VariableColumn ):
+        return column.select( start, stop )
+    return column[ start : stop ]
+
+
+def _survey_store(
+    location: str, mapping: mmap.mmap, codec: RecordCodec
+) -> tuple[ int, int, int ]:
+    magic, version, flags, count, index, schema_size = (
+        _store_head.unpack_from( mapping ) )
+    if magic != _store_magic:
+        _raise_store_invalidity( location, 'Content is not a record store.' )
+    if version != _store_version:
+        _raise_store_invalidity(
+            location, f"Unsupported store version {version}." )
+    start = _store_head.size + schema_size
+    # Unpacking copies schema without exporting buffer of mapping.
+    schema, = struct.unpack_from(
+        f"{schema_size}s", mapping, _store_head.size )
+    if schema != codec.schema.encode( ):
+        _raise_store_invalidity(
+            location,
+            f"Stored schema {schema.decode( errors = 'replace' )!r} "
+            f"differs from schema {codec.schema!r} "
+            f"of class {codec.record_class.__qualname__!r}." )
+    size = codec.record_size
+    if size is None:
+        if not flags & _store_flag_indexed:
+            _raise_store_invalidity( location, 'Records index is absent.' )
+        end = index + count * _store_offset.size
+    else:
+        end = start + count * size
+    # Shared memory blocks may be rounded up to whole pages.
+    if end > len( mapping ):
+        _raise_store_invalidity( location, 'Store is truncated.' )
+    return count, start, index
+
+
+def _write_store(
+    file: __.typx.BinaryIO,
+    codec: RecordCodec,
+    instances: __.cabc.Iterable[ __.typx.Any ],
+) -> int:
+    schema = codec.schema.encode( )
+    indexed = codec.record_size is None
+    flags = _store_flag_indexed if indexed else 0
+    offsets = array.array( 'Q' )
+    count = 0
+    # Head is rewritten with count and index offset when complete.
+    file.write( _store_head.pack(
+        _store_magic, _store_version, flags, 0, 0, len( schema ) ) )
+    file.write( schema )
+    offset = _store_head.size + len( schema )
+    iterator = iter( instances )
+    while batch := tuple( itert.islice( iterator, _store_batch_size ) ):
+        if indexed:
+            for instance in batch:
+                offsets.append( offset )
+                offset += file.write( codec.encode( instance ) )
+        else: offset += file.write( codec.encode_many( batch ) )
+        count += len( batch )
+    if indexed:
+        if 'big' == __.sys.byteorder: offsets.byteswap( )
+        file.write( offsets.tobytes( ) )
+    end = file.tell( )
+    file.seek( 0 )
+    file.write( _store_head.pack(
+        _store_magic, _store_version, flags, count,
+        offset if indexed else 0, len( schema ) ) )
+    file.seek( end )
+    return count
+
+
+def _take_column( column: _Column, indices: tuple[ int, ... ] ) -> _Column:
+    if isinstance( column, _VariableColumn ): return column.take( indices )
+    values = map( column.__getitem__, indices )
+    return array.array( column.typecode, values )
+
+
+def _truncate_column( column: _Column, count: int ) -> None:
+    if isinstance( column, _VariableColumn ):
+        del column.offsets[ count + 1 : ]
+        del column.content[ column.offsets[ -1 ] : ]
+    else: del column[ count : ]
+
+
+__.register_prewarmer( 'records', _prewarm_record_caches )
+_modules.finalize_module(
+    __name__, dynadoc_defer = True, dynadoc_table = __.fragments )
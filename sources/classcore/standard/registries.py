@@ -0,0 +1,273 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Registry of dynamically-produced classes for pickling by reference. '''
+
+
+from .. import utilities as _utilities
+from . import __
+from . import modules as _modules
+from . import nomina as _nomina
+
+
+class _ClassRegistration( __.typx.NamedTuple ):
+
+    fingerprint: str
+    recipe: _nomina.ClassRecipe
+    recipe_pickling: bool
+
+
+_registry_mutex = __.threading.RLock( )
+# Registry does not keep classes alive; unreferenced classes are dropped.
+_classes_by_fingerprint: __.weakref.WeakValueDictionary[ str, type ] = (
+    __.weakref.WeakValueDictionary( ) )
+_registrations: __.weakref.WeakKeyDictionary[
+    type, _ClassRegistration
+] = __.weakref.WeakKeyDictionary( )
+_functions_types = ( __.types.FunctionType, __.types.BuiltinFunctionType )
+_identity_regex = __.re.compile( r''' at 0x[0-9a-fA-F]+\b''' )
+_metaclasses_reducible: set[ type ] = set( )
+# Objects which are described by their attributes rather than by identity.
+_objects_attributes_names: __.cabc.Mapping[ type, tuple[ str, ... ] ] = (
+    __.types.MappingProxyType( {
+        classmethod: ( '__func__', ),
+        __.dcls.Field: (
+            'default', 'default_factory', 'init', 'repr', 'hash', 'compare',
+            'metadata', 'kw_only' ),
+        __.funct.partial: ( 'func', 'args', 'keywords' ),
+        property: ( 'fget', 'fset', 'fdel' ),
+        staticmethod: ( '__func__', ),
+    } ) )
+
+
+def produce_class( # noqa: PLR0913
+    metaclass: __.typx.Annotated[
+        type, __.ddoc.Doc( ''' Metaclass with which to produce class. ''' )
+    ],
+    name: __.typx.Annotated[ str, __.ddoc.Doc( ''' Name of class. ''' ) ],
+    bases: __.typx.Annotated[
+        __.cabc.Sequence[ type ], __.ddoc.Doc( ''' Bases of class. ''' )
+    ] = ( ),
+    namespace: __.typx.Annotated[
+        __.typx.Optional[ __.cabc.Mapping[ str, __.typx.Any ] ],
+        __.ddoc.Doc(
+            ''' Namespace of class, including any field annotations. ''' ),
+    ] = None,
+    arguments: __.typx.Annotated[
+        __.typx.Optional[ __.cabc.Mapping[ str, __.typx.Any ] ],
+        __.ddoc.Doc( ''' Metaclass arguments. ''' ),
+    ] = None, *,
+    recipe_pickling: __.typx.Annotated[
+        bool,
+        __.ddoc.Doc(
+            ''' Include recipe in pickles of class?
+
+                Recipes make pickles larger by the size of their namespaces
+                and metaclass arguments: about 150 bytes for a dataclass with
+                two fields. This cost is paid once per pickle, as pickles
+                memoize classes, rather than once per instance. If false,
+                pickles only carry the fingerprint, which is as compact as
+                the qualified name of a statically-defined class. Then,
+                unpickling processes must have already produced or restored
+                the class.
+            ''' ),
+    ] = True,
+) -> type:
+    ''' Produces class which can be pickled by reference across processes.
+
+        Classes are registered by fingerprint, which is calculated from
+        metaclass, name, bases, namespace, and metaclass arguments. Within a
+        process, identical recipes produce the same class, for as long as
+        that class is referenced elsewhere. The registry does not keep
+        classes alive on its own.
+
+        By default, pickles of registered classes, and hence of their
+        instances, carry fingerprints and recipes, so that fresh processes,
+        such as pool workers, can unpickle them. Unpickling processes
+        reconstruct each class at most once and reuse it thereafter.
+        Namespaces and metaclass arguments must be picklable; functions must
+        be importable by qualified name.
+
+        Pickling by reference is installed, via :py:func:`copyreg.pickle`,
+        for the metaclass of each produced class. This applies process-wide
+        to all classes of that metaclass, including the standard metaclasses
+        shared with statically-defined classes. Classes which are not
+        registered are still pickled by qualified name, as before.
+
+        Recipes containing objects which can only be described by identity,
+        such as lambdas and local functions, are rejected.
+    '''
+    namespace_ = dict( namespace or { } )
+    namespace_.setdefault( '__module__', __name__ )
+    if '__annotations__' in namespace_:
+        namespace_[ '__annotations__' ] = (
+            dict( namespace_[ '__annotations__' ] ) )
+    recipe: _nomina.ClassRecipe = (
+        metaclass, name, tuple( bases ), namespace_, dict( arguments or { } ) )
+    return _restore_class(
+        calculate_class_fingerprint( recipe ), recipe, recipe_pickling )
+
+
+def access_class_fingerprint( cls: type ) -> __.typx.Optional[ str ]:
+    ''' Returns fingerprint of class, if it is registered. '''
+    registration = _registrations.get( cls )
+    if registration is None: return None
+    return registration.fingerprint
+
+
+def calculate_class_fingerprint( recipe: _nomina.ClassRecipe ) -> str:
+    ''' Calculates fingerprint of class recipe.
+
+        Fingerprints are reproducible across processes. Recipes containing
+        objects which can only be described by identity, such as lambdas,
+        local functions, and objects without informative representations,
+        are rejected.
+    '''
+    metaclass, name, bases, namespace, arguments = recipe
+    description = '|'.join( (
+        _describe_value( metaclass ),
+        name,
+        _describe_value( bases ),
+        _describe_value( namespace ),
+        _describe_value( arguments ) ) )
+    return __.hashlib.sha256( description.encode( ) ).hexdigest( )[ : 32 ]
+
+
+def restore_class(
+    fingerprint: str, recipe: __.typx.Optional[ _nomina.ClassRecipe ] = None
+) -> type:
+    ''' Returns registered class, producing it from recipe if necessary.
+
+        Called when unpickling references to registered classes.
+    '''
+    return _restore_class( fingerprint, recipe, recipe is not None )
+
+
+def _describe_attributes(
+    value: object, names: __.cabc.Iterable[ str ]
+) -> str:
+    return "<{} {}>".format(
+        _utilities.qualify_class_name( type( value ) ),
+        ', '.join(
+            f"{name}={_describe_value( getattr( value, name ) )}"
+            for name in names ) )
+
+
+def _describe_class( cls: type ) -> str:
+    fingerprint = access_class_fingerprint( cls )
+    if fingerprint is not None: return f"<class {fingerprint}>"
+    qname = _utilities.qualify_class_name( cls )
+    if '<' in qname: _reject_value( f"Class {qname!r} is not importable." )
+    return f"<class {qname}>"
+
+
+def _describe_function( function: __.typx.Any ) -> str:
+    qname = f"{function.__module__}.{function.__qualname__}"
+    holder = getattr( function, '__self__', None )
+    if '<' in qname or not (
+        holder is None or isinstance( holder, __.types.ModuleType )
+    ): _reject_value( f"Function {qname!r} is not importable." )
+    return f"<function {qname}>"
+
+
+def _describe_object( value: object ) -> str:
+    if value is __.dcls.MISSING: return '<dataclasses.MISSING>'
+    names = _objects_attributes_names.get( type( value ) )
+    if names is not None: return _describe_attributes( value, names )
+    if isinstance( value, __.enum.Enum ):
+        cls = type( value )
+        return f"<{_describe_class( cls )}.{value.name}>"
+    description = repr( value )
+    if (    type( value ).__repr__ is object.__repr__
+        or  _identity_regex.search( description )
+    ):
+        cls_name = _utilities.qualify_class_name( type( value ) )
+        _reject_value(
+            f"Instance of {cls_name!r} can only be described by identity." )
+    return description
+
+
+def _describe_value( value: __.typx.Any ) -> str:
+    if isinstance( value, type ): return _describe_class( value )
+    if isinstance( value, _functions_types ):
+        return _describe_function( value )
+    if isinstance( value, __.cabc.Mapping ):
+        items = __.typx.cast(
+            __.cabc.Mapping[ __.typx.Any, __.typx.Any ], value )
+        return "{{{}}}".format( ', '.join( sorted(
+            f"{_describe_value( key )}: {_describe_value( item )}"
+            for key, item in items.items( ) ) ) )
+    if isinstance( value, ( frozenset, set ) ):
+        elements = __.typx.cast( __.cabc.Set[ __.typx.Any ], value )
+        return "{{{}}}".format( ', '.join( sorted( map(
+            _describe_value, elements ) ) ) )
+    if isinstance( value, ( list, tuple ) ):
+        elements = __.typx.cast( __.cabc.Sequence[ __.typx.Any ], value )
+        return "({})".format( ', '.join( map( _describe_value, elements ) ) )
+    return _describe_object( value )
+
+
+def _reduce_class( cls: type ) -> __.typx.Any:
+    registration = _registrations.get( cls )
+    if registration is None: return cls.__qualname__ # by qualified name
+    if not registration.recipe_pickling:
+        return ( restore_class, ( registration.fingerprint, ) )
+    return ( restore_class, ( registration.fingerprint, registration.recipe ) )
+
+
+def _restore_class(
+    fingerprint: str,
+    recipe: __.typx.Optional[ _nomina.ClassRecipe ],
+    recipe_pickling: bool,
+) -> type:
+    cls = _classes_by_fingerprint.get( fingerprint )
+    if cls is not None: return cls
+    if recipe is None:
+        from ..exceptions import ClassRegistrationAbsence
+        raise ClassRegistrationAbsence( fingerprint )
+    with _registry_mutex:
+        cls = _classes_by_fingerprint.get( fingerprint )
+        if cls is not None: return cls
+        metaclass, name, bases, namespace, arguments = recipe
+        cls_: type = metaclass( name, bases, dict( namespace ), **arguments )
+        _registrations[ cls_ ] = _ClassRegistration(
+            fingerprint, recipe, recipe_pickling )
+        _classes_by_fingerprint[ fingerprint ] = cls_
+        _register_metaclass_reducer( type( cls_ ) )
+    return cls_
+
+
+def _register_metaclass_reducer( metaclass: type ) -> None:
+    # Dispatch table of copyreg is process-wide and keyed by exact type, so
+    # reducer intercepts pickling of every class of metaclass, registered or
+    # not. Unregistered classes reduce to qualified names, as by default.
+    if metaclass in _metaclasses_reducible: return
+    import copyreg
+    copyreg.pickle( metaclass, _reduce_class )
+    _metaclasses_reducible.add( metaclass )
+
+
+def _reject_value( reason: str ) -> __.typx.NoReturn:
+    from ..exceptions import ClassRecipeInvalidity
+    raise ClassRecipeInvalidity( reason )
+
+
+_modules.finalize_module(
+    __name__, dynadoc_defer = True, dynadoc_table = __.fragments )
@@ -0,0 +1,187 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Inference of slots for instances of standard classes. '''
+
+
+import                      ast
+
+from . import __
+from . import nomina as _nomina
+
+
+_assignments: __.weakref.WeakKeyDictionary[
+    __.types.CodeType, __.typx.Optional[ frozenset[ str ] ]
+] = __.weakref.WeakKeyDictionary( )
+_attribute_absence = object( )
+
+
+def produce_instances_slotting_decorator(
+    attributes_namer: _nomina.AttributesNamer
+) -> _nomina.Decorator[ __.U ]:
+    ''' Produces decorator which infers slots for instances of class.
+
+        Slots are inferred from annotations of the class and from attributes
+        which its methods assign on instances, per analysis of their sources.
+        Classes which declare slots are returned as they are. Instances retain
+        a dictionary for attributes which cannot be slotted, such as ones
+        which shadow class attributes, or if sources are unavailable.
+    '''
+    behaviors_name = attributes_namer( 'instance', 'behaviors' )
+
+    def decorate( cls: type[ __.U ] ) -> type[ __.U ]:
+        if '__slots__' in cls.__dict__: return cls
+        annotations = _survey_annotations( cls )
+        assignments = _survey_assignments( cls )
+        inheriteds = _collect_inherited_slots( cls )
+        slots: list[ str ] = [ ]
+        dictionary = assignments is None or _has_cached_properties( cls )
+        for name in ( *annotations, *( assignments or ( ) ) ):
+            if name in inheriteds or name in slots: continue
+            attribute: object = _access_class_attribute( cls, name )
+            if attribute is _attribute_absence: slots.append( name )
+            elif not hasattr( type( attribute ), '__set__' ):
+                dictionary = dictionary or name in ( assignments or ( ) )
+        if behaviors_name not in inheriteds: slots.append( behaviors_name )
+        if dictionary and not any(
+            base.__dictoffset__ for base in cls.__bases__
+        ): slots.append( '__dict__' )
+        namespace = dict( cls.__dict__ )
+        namespace[ '__slots__' ] = tuple( slots )
+        namespace.pop( '__dict__', None )
+        namespace.pop( '__weakref__', None )
+        cls_ = type( cls )( cls.__name__, cls.__bases__, namespace )
+        cls_.__qualname__ = cls.__qualname__
+        return cls_
+
+    return decorate
+
+
+def _access_class_attribute( cls: type, name: str ) -> __.typx.Any:
+    for base in cls.__mro__:
+        if name in base.__dict__: return base.__dict__[ name ]
+    return _attribute_absence
+
+
+def _collect_inherited_slots( cls: type ) -> frozenset[ str ]:
+    names: set[ str ] = set( )
+    for base in cls.__mro__[ 1 : ]:
+        slots: __.typx.Any = base.__dict__.get( '__slots__', ( ) )
+        if isinstance( slots, str ): slots = ( slots, )
+        names.update( slots )
+    return frozenset( names )
+
+
+def _has_cached_properties( cls: type ) -> bool:
+    return any(
+        isinstance( attribute, __.funct.cached_property )
+        for base in cls.__mro__ for attribute in base.__dict__.values( ) )
+
+
+def _survey_annotations( cls: type ) -> tuple[ str, ... ]:
+    annotations = __.typx.get_annotations(
+        cls, format = __.typx.Format.FORWARDREF )
+    return tuple(
+        name for name, annotation in annotations.items( )
+        if not __.is_class_variable( annotation ) )
+
+
+def _survey_assignments(
+    cls: type
+) -> __.typx.Optional[ tuple[ str, ... ] ]:
+    names: dict[ str, None ] = { }
+    for attribute in cls.__dict__.values( ):
+        if isinstance( attribute, property ):
+            functions = ( attribute.fget, attribute.fset, attribute.fdel )
+        elif isinstance( attribute, __.types.FunctionType ):
+            functions = ( attribute, )
+        else: continue
+        for function in functions:
+            if function is None: continue
+            names_ = _survey_function_assignments(
+                __.inspect.unwrap( function ) )
+            if names_ is None: return None
+            names.update( dict.fromkeys( sorted( names_ ) ) )
+    return tuple( names )
+
+
+def _survey_function_assignments(
+    function: __.cabc.Callable[ ..., __.typx.Any ]
+) -> __.typx.Optional[ frozenset[ str ] ]:
+    code = getattr( function, '__code__', None )
+    if code is None: return None
+    if code in _assignments: return _assignments[ code ]
+    names: __.typx.Optional[ frozenset[ str ] ]
+    if not code.co_argcount: names = frozenset( )
+    else:
+        from textwrap import dedent
+        try: source = dedent( __.inspect.getsource( function ) )
+        except ( OSError, TypeError ): names = None
+        else:
+            names = _survey_source_assignments(
+                source, code.co_varnames[ 0 ] )
+    return _assignments.setdefault( code, names )
+
+
+def _survey_source_assignments(
+    source: str, instance_name: str
+) -> __.typx.Optional[ frozenset[ str ] ]:
+    try: tree = ast.parse( source )
+    except SyntaxError: return None # e.g., lambda within expression
+    names: set[ str ] = set( )
+    for node in ast.walk( tree ):
+        if isinstance( node, ast.Attribute ):
+            if not isinstance( node.ctx, ( ast.Store, ast.Del ) ):
+                continue
+            if _is_name( node.value, instance_name ): names.add( node.attr )
+        elif isinstance( node, ast.Call ):
+            name = _survey_setattr_call( node, instance_name )
+            if name is None: continue
+            # Literal private names are not mangled, unlike slots.
+            if name.startswith( '__' ) and not name.endswith( '__' ):
+                return None
+            names.add( name )
+    return frozenset( names )
+
+
+def _survey_setattr_call(
+    node: ast.Call, instance_name: str
+) -> __.typx.Optional[ str ]:
+    # Detects 'setattr( self, name, value )',
+    # 'object.__setattr__( self, name, value )',
+    # and 'super( ).__setattr__( name, value )'.
+    function = node.func
+    arguments: list[ ast.expr ] = list( node.args )
+    if (    isinstance( function, ast.Attribute )
+        and function.attr == '__setattr__'
+    ):
+        if isinstance( function.value, ast.Call ):
+            arguments.insert( 0, ast.Name( id = instance_name ) )
+    elif not _is_name( function, 'setattr' ): return None
+    if len( arguments ) < 2: return None # noqa: PLR2004
+    if not _is_name( arguments[ 0 ], instance_name ): return None
+    name = arguments[ 1 ]
+    if isinstance( name, ast.Constant ) and isinstance( name.value, str ):
+        return name.value
+    return None
+
+
+def _is_name( node: ast.AST, name: str ) -> bool:
+    return isinstance( node, ast.Name ) and node.id == name
@@ -24,6 +24,27 @@
 from . import __
 
 
+# Digests are pure functions of qualified class names; memoize them.
+_mangled_names_digests: __.weakref.WeakKeyDictionary[ type, str ] = (
+    __.weakref.WeakKeyDictionary( ) )
+
+
+def access_class_cache(
+    cache: __.cabc.MutableMapping[ type, __.U ],
+    cls: type,
+    producer: __.cabc.Callable[ [ type ], __.U ],
+) -> __.U:
+    ''' Returns value cached for class, producing and caching it if absent.
+
+        Values must depend only on their classes. Threads, which race to
+        produce an absent value, produce equivalent values; first one cached
+        wins, so no lock is needed.
+    '''
+    value = cache.get( cls )
+    if value is None: value = cache.setdefault( cls, producer( cls ) )
+    return value
+
+
 def describe_object( objct: object, / ) -> str:
     ''' Returns object type with fully-qualified name. '''
     if __.inspect.isclass( objct ):
@@ -43,9 +64,9 @@ def getattr0(
         except when attribute is slotted. Slotted attributes are effectively
         isolated from inheritance.
     '''
-    if not __.inspect.isclass( objct ):
-        for base in type( objct ).mro( ):
-            slots = getattr( base, '__slots__', ( ) )
+    if not isinstance( objct, type ):
+        for base in type( objct ).__mro__:
+            slots = base.__dict__.get( '__slots__', ( ) )
             if name in slots: return getattr( objct, name, default )
     name_m = mangle_name( objct, name )
     return getattr( objct, name_m, default )
@@ -60,9 +81,9 @@ def delattr0( objct: object, /, name: str ) -> None:
         except when attribute is slotted. Slotted attributes are effectively
         isolated from inheritance.
     '''
-    if not __.inspect.isclass( objct ):
-        for base in type( objct ).mro( ):
-            slots = getattr( base, '__slots__', ( ) )
+    if not isinstance( objct, type ):
+        for base in type( objct ).__mro__:
+            slots = base.__dict__.get( '__slots__', ( ) )
             if name in slots:
                 delattr( objct, name )
                 return
@@ -79,9 +100,9 @@ def setattr0( objct: object, /, name: str, value: __.typx.Any ) -> None:
         except when attribute is slotted. Slotted attributes are effectively
         isolated from inheritance.
     '''
-    if not __.inspect.isclass( objct ):
-        for base in type( objct ).mro( ):
-            slots = getattr( base, '__slots__', ( ) )
+    if not isinstance( objct, type ):
+        for base in type( objct ).__mro__:
+            slots = base.__dict__.get( '__slots__', ( ) )
             if name in slots:
                 setattr( objct, name, value )
                 return
@@ -97,15 +118,31 @@ def mangle_name( objct: object, /, name: str ) -> str:
     '''
     # TODO: Replace expensive SHA-256 hash with simple 'id'.
     #       Need to debug weird issue with using 'id' early on dataclasses.
-    if not __.inspect.isclass( objct ):
-        return mangle_name( type( objct ), name )
-    # return "{name}{uid}".format( name = name, uid = id( objct ) )
-    namehash = __.hashlib.sha256( )
-    namehash.update( qualify_class_name( objct ).encode( ) )
-    namehash_hex = namehash.hexdigest( )
+    cls = objct if isinstance( objct, type ) else type( objct )
+    # return "{name}{uid}".format( name = name, uid = id( cls ) )
+    namehash_hex = access_class_cache(
+        _mangled_names_digests, cls, _calculate_name_digest )
     return f"{name}{namehash_hex}"
 
 
+def produce_attributes_accessor(
+    names: __.cabc.Sequence[ str ]
+) -> __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]:
+    ''' Produces function which returns tuple of attribute values.
+
+        Unlike bare attribute getters, always returns tuples, even for one
+        or no attribute names.
+    '''
+    if len( names ) > 1: return __.operator.attrgetter( *names )
+    access_value = __.operator.attrgetter( *names ) if names else None
+
+    def access_values( objct: __.typx.Any ) -> tuple[ __.typx.Any, ... ]:
+        if access_value is None: return ( )
+        return ( access_value( objct ), )
+
+    return access_values
+
+
 def qualify_class_name( cls: type ) -> str:
     ''' Returns fully-qualified class name. '''
     return f"{cls.__module__}.{cls.__qualname__}"
@@ -113,8 +150,8 @@ def qualify_class_name( cls: type ) -> str:
 
 def repair_class_reproduction( original: type, reproduction: type ) -> None:
     ''' Repairs a class reproduction, if necessary. '''
-    match __.platform.python_implementation( ):
-        case 'CPython' | 'PyPy':  # pragma: no branch
+    match __.sys.implementation.name:
+        case 'cpython' | 'pypy':  # pragma: no branch
             _repair_cpython_class_closures( original, reproduction )
         case _: pass  # pragma: no cover
 
@@ -145,3 +182,9 @@ def _repair_cpython_class_closures(
                 accessor = getattr( attribute_, aname )
                 if None is accessor: continue
                 if try_repair_closure( accessor ): return
+
+
+def _calculate_name_digest( cls: type ) -> str:
+    namehash = __.hashlib.sha256( )
+    namehash.update( qualify_class_name( cls ).encode( ) )
+    return namehash.hexdigest( )
@@ -28,6 +28,22 @@ CLASS_NAMES = (
     'AttributeImmutability',
     'ErrorProvideFailure',
 )
+CLASS_NAMES_LAZY = (
+    'ClassRecipeInvalidity',
+    'ClassRegistrationAbsence',
+    'ConversionInvalidity',
+    'HashCacheInvalidity',
+    'InstanceStateInvalidity',
+    'InstancesOptionsInvalidity',
+    'InterningInvalidity',
+    'PackingInvalidity',
+    'PackingValueInvalidity',
+    'RecordAbsence',
+    'RecordFieldAbsence',
+    'RecordSchemaInvalidity',
+    'RecordStoreInvalidity',
+    'RecordValueInvalidity',
+)
 MODULE_QNAME = f"{PACKAGE_NAME}.exceptions"
 
 
@@ -133,3 +149,22 @@ def test_300_error_provide_failure_instantiation( ):
         raise class_( 'FooFailure', 'does not exist' )
     assert 'FooFailure' in str( excinfo.value )
     assert 'does not exist' in str( excinfo.value )
+
+
+@pytest.mark.parametrize( 'class_name', CLASS_NAMES_LAZY )
+def test_400_lazy_class_provision( class_name ):
+    ''' Lazily defined class belongs to module. '''
+    import pickle
+    module = cache_import_module( MODULE_QNAME )
+    assert class_name in dir( module )
+    class_ = getattr( module, class_name )
+    assert issubclass( class_, module.Omnierror )
+    assert class_.__module__ == MODULE_QNAME
+    assert pickle.loads( pickle.dumps( class_ ) ) is class_ # noqa: S301
+
+
+def test_401_lazy_class_absence( ):
+    ''' Absent class is reported as absent attribute. '''
+    module = cache_import_module( MODULE_QNAME )
+    with pytest.raises( AttributeError ):
+        module.FooInvalidity
@@ -19,6 +19,7 @@
 
 
 from dataclasses import dataclass
+from types import SimpleNamespace
 
 import pytest
 
@@ -70,6 +71,50 @@ def test_200_attr0( ):
         module.delattr0( cs, 'missing' )
 
 
+def test_201_mangle_name_digests( ):
+    ''' Mangled names depend on qualified names; digests are cached weakly. '''
+    import gc
+    import weakref
+    module = cache_import_module( MODULE_QNAME )
+
+    def produce_class( ):
+        class C: pass
+        return C
+
+    c1, c2 = produce_class( ), produce_class( )
+    assert module.mangle_name( c1, 'x' ) == module.mangle_name( c2, 'x' )
+    assert module.mangle_name( c1, 'x' ) != module.mangle_name( Foo, 'x' )
+    assert c1 in module._mangled_names_digests
+    reference = weakref.ref( c1 )
+    del c1
+    gc.collect( )
+    assert reference( ) is None
+
+
+def test_210_produce_attributes_accessor( ):
+    ''' Attributes accessors always return tuples. '''
+    module = cache_import_module( MODULE_QNAME )
+    objct = SimpleNamespace( x = 1, y = 2 )
+    assert module.produce_attributes_accessor( ( 'x', 'y' ) )( objct ) == (
+        1, 2 )
+    assert module.produce_attributes_accessor( ( 'y', ) )( objct ) == ( 2, )
+    assert module.produce_attributes_accessor( ( ) )( objct ) == ( )
+
+
+def test_220_access_class_cache( ):
+    ''' Values are produced once per class and then cached. '''
+    module = cache_import_module( MODULE_QNAME )
+    cache = { }
+    classes = [ ]
+    def produce( cls ):
+        classes.append( cls )
+        return cls.__name__
+    assert module.access_class_cache( cache, Foo, produce ) == 'Foo'
+    assert module.access_class_cache( cache, Foo, produce ) == 'Foo'
+    assert classes == [ Foo ]
+    assert cache == { Foo: 'Foo' }
+
+
 def test_300_class_repair_function_closure( ):
     ''' Reproduction has class cell repaired in function closure. '''
     class Wut:
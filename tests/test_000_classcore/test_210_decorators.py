@@ -18,7 +18,7 @@
 #============================================================================#
 
 
-# import pytest
+import pytest
 
 from .__ import PACKAGE_NAME, cache_import_module
 
@@ -30,13 +30,11 @@ def test_111_produce_class_initialization_decorator_original( ):
     module = cache_import_module( MODULE_QNAME )
     base_module = cache_import_module( f"{PACKAGE_NAME}.__" )
     factories_module = cache_import_module( f"{PACKAGE_NAME}.factories" )
-    constructor = factories_module.produce_class_constructor(
-        attributes_namer = base_module.calculate_attrname )
+    constructor = factories_module.produce_class_constructor( )
     cdecorator = module.produce_class_construction_decorator(
         attributes_namer = base_module.calculate_attrname,
         constructor = constructor )
-    initializer = factories_module.produce_class_initializer(
-        attributes_namer = base_module.calculate_attrname )
+    initializer = factories_module.produce_class_initializer( )
     idecorator = module.produce_class_initialization_decorator(
         attributes_namer = base_module.calculate_attrname,
         initializer = initializer )
@@ -47,3 +45,14 @@ def test_111_produce_class_initialization_decorator_original( ):
             self._hello = 'Hi'
     class Object( metaclass = Class ): pass
     assert Object._hello == 'Hi'
+
+
+def test_112_factories_attributes_namer_deprecation( ):
+    base_module = cache_import_module( f"{PACKAGE_NAME}.__" )
+    factories_module = cache_import_module( f"{PACKAGE_NAME}.factories" )
+    with pytest.warns( DeprecationWarning, match = 'attributes_namer' ):
+        factories_module.produce_class_constructor(
+            attributes_namer = base_module.calculate_attrname )
+    with pytest.warns( DeprecationWarning, match = 'attributes_namer' ):
+        factories_module.produce_class_initializer(
+            attributes_namer = base_module.calculate_attrname )
@@ -18,6 +18,9 @@
 #============================================================================#
 
 
+import dataclasses
+import sys
+
 import pytest
 
 from .__ import PACKAGE_NAME, cache_import_module
@@ -184,3 +187,155 @@ def test_221_cfc_core_function_replacements_inheritance( ):
     assert 'foo' in dir( Derivation )
     del Derivation.foo
     assert not hasattr( Derivation, 'foo' )
+
+
+def test_230_cfc_shared_behaviors_plans( ):
+    ''' Classes with identical behaviors plans behave independently. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    @module.class_factory( )
+    class Class( type ): pass
+
+    class Alpha( metaclass = Class, instances_mutables = [ 'foo' ] ): pass
+    class Beta( metaclass = Class, instances_mutables = [ 'foo' ] ): pass
+
+    for cls in ( Alpha, Beta ):
+        objct = cls( )
+        objct.foo = 1
+        assert objct.foo == 1
+        with pytest.raises( exceptions.AttributeImmutability ):
+            objct.bar = 2
+    with pytest.raises( exceptions.BehaviorExclusionInvalidity ):
+        class Delta( metaclass = Class, instances_mutables = [ 42 ] ): pass
+
+
+@pytest.mark.skipif(
+    sys.version_info < ( 3, 14 ), reason = "Requires deferred annotations." )
+def test_300_prepare_dataclass_deferred_annotations( ):
+    ''' Dataclass preparation does not evaluate deferred annotations. '''
+    import annotationlib
+    module = cache_import_module( MODULE_QNAME )
+    base = cache_import_module( f"{PACKAGE_NAME}.__" )
+    behaviors_name = base.calculate_attrname( 'instance', 'behaviors' )
+
+    class Node:
+        parent: Tree # noqa: F821
+
+    module.prepare_dataclass_for_instances(
+        Node, [ ], attributes_namer = base.calculate_attrname )
+    formats = annotationlib.Format
+    annotations = annotationlib.get_annotations(
+        Node, format = formats.STRING )
+    assert annotations == { 'parent': 'Tree', behaviors_name: 'set[str]' }
+    annotations = annotationlib.get_annotations(
+        Node, format = formats.FORWARDREF )
+    assert isinstance( annotations[ 'parent' ], annotationlib.ForwardRef )
+    assert annotations[ behaviors_name ] == set[ str ]
+    with pytest.raises( NameError ):
+        annotationlib.get_annotations( Node, format = formats.VALUE )
+
+
+def test_310_dataclass_replacement( ):
+    ''' Decorated dataclasses replace via injected replacers. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    @module.dataclass_with_standard_behaviors( )
+    class Point:
+        x: int
+        y: int = 0
+
+    point = module.replace( Point( x = 1 ), y = 2 )
+    assert ( point.x, point.y ) == ( 1, 2 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point.x = 3
+
+
+def test_320_instances_assembler( ):
+    ''' Assemblers produce initialized instances from field values. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Point( classes.DataclassObject ):
+        x: int
+        y: int = 0
+        def __post_init__( self ): raise AssertionError
+
+    assert module.survey_data_fields_names( Point ) == ( 'x', 'y' )
+    point = module.produce_instances_assembler( Point )( ( 1, 2 ) )
+    assert ( point.x, point.y ) == ( 1, 2 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point.x = 3
+
+    @dataclasses.dataclass
+    class Plain:
+        x: int
+
+    assert module.produce_instances_assembler( Plain )( ( 1, ) ) == (
+        Plain( x = 1 ) )
+
+
+@pytest.mark.skipif(
+    sys.version_info < ( 3, 14 ), reason = "Requires deferred annotations." )
+def test_310_docstring_deferred_annotations( ):
+    ''' Docstring assembly does not evaluate deferred annotations. '''
+    import annotationlib
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+
+    class Node( classes.DataclassObject ):
+        ''' Node of tree. '''
+        parent: Tree | None = None # noqa: F821
+
+    class Leaf( Node ):
+        ''' Leaf of tree. '''
+        label: str = ''
+
+    assert ':vartype parent: Tree | None' in Node.__doc__
+    assert ':vartype parent: Tree | None' in Leaf.__doc__
+    assert ':vartype label: str' in Leaf.__doc__
+    for cls in ( Node, Leaf ):
+        assert '__annotations_cache__' not in cls.__dict__
+        with pytest.raises( NameError ):
+            annotationlib.get_annotations(
+                cls, format = annotationlib.Format.VALUE )
+
+
+@pytest.mark.skipif(
+    sys.version_info < ( 3, 14 ), reason = "Requires deferred annotations." )
+def test_311_docstring_deferred_annotations_fidelity( ):
+    ''' Presented annotations change neither docstrings nor classes. '''
+    import annotationlib
+
+    import dynadoc as ddoc
+    module = cache_import_module( f"{PACKAGE_NAME}.standard.dynadoc" )
+    assert module._detect_annotations_cache_override( )
+    configuration = module.produce_dynadoc_configuration( )
+
+    def produce_classes( ):
+
+        class Base:
+            ''' Base. '''
+            identifier: int
+
+        class Derivation( Base ):
+            ''' Derivation. '''
+            label: str
+            parent: int | None
+
+        return Base, Derivation
+
+    references = produce_classes( )
+    classes = produce_classes( )
+    decorate = ddoc.with_docstring( **configuration )
+    decorate_ = module.produce_class_docstring_decorator( configuration )
+    for reference, cls in zip( references, classes ):
+        annotate = cls.__annotate__
+        decorate( reference )
+        decorate_( cls )
+        assert cls.__doc__ == reference.__doc__
+        assert '__annotations_cache__' not in cls.__dict__
+        assert cls.__annotate__ is annotate
+        assert annotationlib.get_annotations( cls ) == (
+            annotationlib.get_annotations( reference ) )
@@ -18,7 +18,19 @@
 #============================================================================#
 
 
-# import pytest
+import copy
+import dataclasses
+import enum
+import gc
+import pickle
+import sys
+import textwrap
+import threading
+import types
+import typing
+import weakref
+
+import pytest
 
 from .__ import PACKAGE_NAME, cache_import_module
 
@@ -46,3 +58,1424 @@ def test_124_cfc_instances_ignore_init_arguments( ):
 
     u = UrlWithInit( *urlparse( 'https://python.org' ) )
     assert u.scheme == 'https'
+
+
+def _survey_class_profile( cls ):
+    return {
+        name: value for name, value in vars( cls ).items( )
+        if name.startswith( '_classcore_' )
+        and not name.startswith( '_classcore_class_sealing_defer' ) }
+
+
+def _produce_sealing_classes( module, deferral ):
+    class Base(
+        module.Object,
+        class_mutables = ( 'x', ),
+        instances_mutables = ( 'a', ),
+        sealing_defer = deferral,
+    ): x = 1
+
+    class Derivation( Base, instances_visibles = ( 'b', ) ): pass
+
+    return Base, Derivation
+
+
+def test_200_sealing_defer_profile( ):
+    ''' Deferred sealing produces same behaviors as eager sealing. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    eagers = _produce_sealing_classes( module, deferral = False )
+    lazies = _produce_sealing_classes( module, deferral = True )
+    behaviors_name = 'class_behaviors'
+    for cls in lazies:
+        assert not any(
+            behaviors_name in name for name in _survey_class_profile( cls ) )
+    objct = lazies[ 1 ]( )
+    objct.a = 42
+    with pytest.raises( exceptions.AttributeImmutability ):
+        objct.c = 13
+    for eager, lazy in zip( eagers, lazies ):
+        assert _survey_class_profile( eager ) == _survey_class_profile( lazy )
+    lazies[ 0 ].x = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        lazies[ 0 ].y = 3
+
+
+def test_201_sealing_defer_triggers( ):
+    ''' Deferred sealing happens on first class mutation or survey. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    _, mutated = _produce_sealing_classes( module, deferral = True )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        mutated.y = 3
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del mutated.y
+    _, surveyed = _produce_sealing_classes( module, deferral = True )
+    assert 'x' in dir( surveyed )
+    assert not any( '_classcore_' in name for name in dir( surveyed ) )
+
+
+def test_202_sealing_defer_threads( ):
+    ''' Deferred sealing is safe under concurrent first use. '''
+    from concurrent.futures import ThreadPoolExecutor
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    _, cls = _produce_sealing_classes( module, deferral = True )
+
+    def instantiate( _ ):
+        objct = cls( )
+        try: objct.c = 13
+        except exceptions.AttributeImmutability: return True
+        return False
+
+    with ThreadPoolExecutor( max_workers = 8 ) as executor:
+        assert all( executor.map( instantiate, range( 64 ) ) )
+
+
+def test_300_dataclass_local_definition( ):
+    ''' Standard dataclasses can be defined in local scopes. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Point( module.DataclassObject ):
+        x: int
+        y: int = 0
+
+    point = Point( x = 1 )
+    assert ( point.x, point.y ) == ( 1, 0 )
+    assert 'x' in Point.__slots__
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point.x = 2
+    assert not any( 'construction' in name for name in vars( Point ) )
+
+
+def test_301_classes_concurrent_construction( ):
+    ''' Classes can be constructed concurrently from multiple threads. '''
+    from concurrent.futures import ThreadPoolExecutor
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    def construct( index ):
+        class Record(
+            module.DataclassObject, instances_mutables = ( 'note', )
+        ):
+            identifier: int
+            note: str = ''
+
+        record = Record( identifier = index )
+        record.note = 'mutable'
+        try: record.identifier = -1
+        except exceptions.AttributeImmutability:
+            return record.identifier == index
+        return False
+
+    with ThreadPoolExecutor( max_workers = 8 ) as executor:
+        assert all( executor.map( construct, range( 64 ) ) )
+
+
+def test_302_classes_decorators_productions( ):
+    ''' Classes from decorators, other than reproductions, are processed. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    siblings = [ ]
+
+    def produce_sibling( cls ):
+        siblings.append( type( cls )(
+            cls.__name__, cls.__bases__, { '__module__': cls.__module__ } ) )
+        return cls
+
+    class Point( module.Object, decorators = ( produce_sibling, ) ):
+        x = 1
+
+    with pytest.raises( exceptions.AttributeImmutability ):
+        Point.x = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        siblings[ 0 ].x = 2
+    assert siblings[ 0 ] is not Point
+
+
+def test_303_construction_arguments_recording_deprecation( ):
+    ''' Deprecated recorder captures arguments in class namespace. '''
+    base = cache_import_module( f"{PACKAGE_NAME}.__" )
+    behaviors = cache_import_module( f"{PACKAGE_NAME}.standard.behaviors" )
+    namespace = { }
+    arguments = { 'class_mutables': '*', 'metaclass_option': True }
+    with pytest.warns( DeprecationWarning ):
+        behaviors.record_class_construction_arguments(
+            base.calculate_attrname, namespace, arguments )
+    arguments_name = base.calculate_attrname(
+        'class', 'construction_arguments' )
+    assert namespace == { arguments_name: { 'class_mutables': '*' } }
+    assert arguments == { 'metaclass_option': True }
+
+
+PICKLING_SOURCE = textwrap.dedent( f'''
+    import {PACKAGE_NAME}.standard as ccstd
+
+    class Point( ccstd.DataclassObject ):
+        x: int
+        y: int = 0
+
+    class Counter( ccstd.DataclassObjectMutable ):
+        count: int = 0
+
+    class Registry( ccstd.Object ):
+        def __init__( self, name ):
+            self.name = name
+
+    class Lazy( ccstd.DataclassObject, sealing_defer = True ):
+        value: int
+
+    class Custom( ccstd.Object ):
+        def __init__( self, name ):
+            self.name = name
+        def __reduce__( self ):
+            return ( type( self ), ( self.name.upper( ), ) )
+
+    class CustomDerivation( Custom ): pass
+
+    class Hybrid( ccstd.Object ):
+        __slots__ = ( '__secret', 'slotted' )
+        def __init__( self ):
+            self.slotted = 1
+            self.__secret = 2
+            self.unslotted = 3
+        def reveal( self ):
+            return self.__secret
+
+    class CustomState( Registry ):
+        def __getstate__( self ):
+            return dict( self.__dict__ )
+
+    class Currency( ccstd.DataclassObject, instances_hash_cache = True ):
+        code: str
+        digits: int = 2
+
+    class Region( ccstd.DataclassObject, instances_intern = True ):
+        name: str
+        zone: int = 0
+
+    class Reading( ccstd.DataclassObject, instances_packed = True ):
+        level: float
+        count: int = 0
+        valid: bool = True
+
+    class Coordinate( ccstd.TupleclassObject ):
+        latitude: float
+        longitude: float = 0.0
+
+    class Signal( ccstd.Enum ):
+        STOP = 0
+        GO = 1
+''' )
+
+
+@pytest.fixture
+def pickling_module( ):
+    name = '_classcore_pickling_fixtures'
+    module = types.ModuleType( name )
+    sys.modules[ name ] = module
+    try:
+        exec( PICKLING_SOURCE, module.__dict__ ) # noqa: S102
+        yield module
+    finally: del sys.modules[ name ]
+
+
+def test_400_pickling_immutable_dataclass( pickling_module ):
+    ''' Immutable dataclass instances pickle values in slot order. '''
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    point = pickling_module.Point( x = 1, y = 2 )
+    assert point.__reduce_ex__( 4 )[ 2 ] == ( None, ( 'x', 'y' ), [ 1, 2 ] )
+    point_ = pickle.loads( pickle.dumps( point ) ) # noqa: S301
+    assert point_ == point
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point_.x = 3
+    assert 'x' in dir( point_ )
+    assert not any( '_classcore_' in name for name in dir( point_ ) )
+
+
+def test_401_pickling_mutable_dataclass( pickling_module ):
+    ''' Mutable dataclass instances remain mutable after unpickling. '''
+    counter = pickling_module.Counter( count = 5 )
+    counter_ = pickle.loads( pickle.dumps( counter ) ) # noqa: S301
+    assert counter_.count == 5
+    counter_.count = 6
+    assert counter_.count == 6
+
+
+def test_402_pickling_immutable_object( pickling_module ):
+    ''' Instances with attributes dictionaries omit behaviors from state. '''
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    registry = pickling_module.Registry( 'main' )
+    assert registry.__reduce_ex__( 4 )[ 2 ] == { 'name': 'main' }
+    registry_ = pickle.loads( pickle.dumps( registry ) ) # noqa: S301
+    assert registry_.name == 'main'
+    with pytest.raises( exceptions.AttributeImmutability ):
+        registry_.name = 'other'
+
+
+def test_403_pickling_state_from_defaults( pickling_module ):
+    ''' State from default pickling protocol is still restorable. '''
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    behaviors_name = '_classcore_instance_behaviors_'
+    point = object.__new__( pickling_module.Point )
+    point.__setstate__(
+        ( None, { 'x': 1, 'y': 2, behaviors_name: frozenset( ) } ) )
+    assert ( point.x, point.y ) == ( 1, 2 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point.x = 3
+    registry = object.__new__( pickling_module.Registry )
+    registry.__setstate__( { 'name': 'main' } )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        registry.name = 'other'
+
+
+def test_404_pickling_unassigned_slots( pickling_module ):
+    ''' Unassigned slots are omitted from state. '''
+    point = object.__new__( pickling_module.Point )
+    object.__setattr__( point, 'x', 1 )
+    point_ = pickle.loads( pickle.dumps( point ) ) # noqa: S301
+    assert point_.x == 1
+    assert not hasattr( point_, 'y' )
+
+
+def test_405_pickling_sealing_defer( pickling_module ):
+    ''' Unpickling seals classes with deferred sealing. '''
+    behaviors = cache_import_module( f"{PACKAGE_NAME}.standard.behaviors" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    lazy = pickling_module.Lazy
+    state = pickle.dumps( object.__new__( lazy ) )
+    assert behaviors.is_class_sealing_pending( lazy )
+    lazy_ = pickle.loads( state ) # noqa: S301
+    assert not behaviors.is_class_sealing_pending( lazy )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        lazy_.value = 1
+
+
+def test_406_pickling_customization( pickling_module ):
+    ''' Custom pickling is respected, including by subclasses. '''
+    for cls in (
+        pickling_module.Custom, pickling_module.CustomDerivation
+    ):
+        assert '__getstate__' not in cls.__dict__
+        objct = pickle.loads( pickle.dumps( cls( 'main' ) ) ) # noqa: S301
+        assert objct.name == 'MAIN'
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    registry = pickling_module.CustomState( 'main' )
+    registry_ = pickle.loads( pickle.dumps( registry ) ) # noqa: S301
+    assert registry_.name == 'main'
+    with pytest.raises( exceptions.AttributeImmutability ):
+        registry_.name = 'other'
+
+
+def test_407_pickling_hybrid_object( pickling_module ):
+    ''' Slotted and dictionary attributes are both restored. '''
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    hybrid = pickling_module.Hybrid( )
+    assert hybrid.__reduce_ex__( 4 )[ 2 ] == (
+        { 'unslotted': 3 }, ( '_Hybrid__secret', 'slotted' ), [ 2, 1 ] )
+    hybrid_ = pickle.loads( pickle.dumps( hybrid ) ) # noqa: S301
+    assert ( hybrid_.slotted, hybrid_.reveal( ), hybrid_.unslotted ) == (
+        1, 2, 3 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        hybrid_.slotted = 4
+
+
+def test_408_pickling_state_slots_mismatch( pickling_module ):
+    ''' State with values for other slots is rejected. '''
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    for state in (
+        ( None, ( 'x', ), [ 1 ] ),
+        ( None, ( 'y', 'x' ), [ 1, 2 ] ),
+        ( None, ( 'x', 'y' ), [ 1 ] ),
+        ( None, ( 'x', 'y', 'z' ), [ 1, 2, 3 ] ),
+    ):
+        point = object.__new__( pickling_module.Point )
+        with pytest.raises( exceptions.InstanceStateInvalidity ):
+            point.__setstate__( state )
+
+
+def test_500_copying_immutable_instances( ):
+    ''' Immutable instances are their own copies. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Point( module.DataclassObject ):
+        x: int
+        tags: tuple[ str, ... ] = ( )
+
+    class Registry( module.Object ):
+        def __init__( self, entries ):
+            self.entries = entries
+
+    point = Point( x = 1, tags = ( 'a', 'b' ) )
+    assert copy.copy( point ) is point
+    assert copy.deepcopy( point ) is point
+    nested = Registry( ( point, 'name' ) )
+    assert copy.copy( nested ) is nested
+    assert copy.deepcopy( nested ) is nested
+
+
+def test_501_copying_mutable_values( ):
+    ''' Immutable instances with mutable values get deep replicas. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Point( module.DataclassObject ):
+        x: int
+        tags: tuple[ list[ str ], ... ] = ( )
+
+    class Registry( module.Object ):
+        def __init__( self, entries ):
+            self.entries = entries
+
+    point = Point( x = 1, tags = ( [ 'a' ], ) )
+    assert copy.copy( point ) is point
+    point_ = copy.deepcopy( point )
+    assert point_ is not point
+    assert point_ == point
+    assert point_.tags[ 0 ] is not point.tags[ 0 ]
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point_.x = 2
+    registry = Registry( [ 1 ] )
+    registry_ = copy.deepcopy( registry )
+    assert registry_.entries == [ 1 ]
+    assert registry_.entries is not registry.entries
+    with pytest.raises( exceptions.AttributeImmutability ):
+        registry_.entries = [ ]
+
+
+def test_502_copying_partially_mutable_instances( ):
+    ''' Instances with mutability exemptions get replicas. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Node( module.DataclassObject, instances_mutables = ( 'peers', ) ):
+        name: str
+        peers: list[ object ]
+
+    node = Node( name = 'a', peers = [ ] )
+    node.peers.append( node )
+    node_ = copy.copy( node )
+    assert node_ is not node
+    assert node_.peers is node.peers
+    node_.peers = [ ]
+    assert node.peers[ 0 ] is node
+    with pytest.raises( exceptions.AttributeImmutability ):
+        node_.name = 'b'
+    node_ = copy.deepcopy( node )
+    assert node_.peers is not node.peers
+    assert node_.peers[ 0 ] is node_
+
+
+def test_503_copying_unassigned_slots( ):
+    ''' Unassigned slots and behaviors are preserved by copies. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Point( module.DataclassObject ):
+        x: int
+        y: int = 0
+
+    point = object.__new__( Point )
+    object.__setattr__( point, 'x', 1 )
+    for copier in ( copy.copy, copy.deepcopy ):
+        point_ = copier( point )
+        assert point_ is not point
+        assert point_.x == 1
+        assert not hasattr( point_, 'y' )
+        point_.y = 2 # not yet immutable
+
+
+def test_504_copying_customization( ):
+    ''' Custom copying and constructors are respected. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Custom( module.Object ):
+        def __init__( self, name ):
+            self.name = name
+        def __copy__( self ):
+            return type( self )( self.name.upper( ) )
+
+    class CustomDerivation( Custom ): pass
+
+    class Reducible( module.Object ):
+        def __init__( self, name ):
+            self.name = name
+        def __reduce__( self ):
+            return ( type( self ), ( self.name.upper( ), ) )
+
+    class Constructible( module.Object ):
+        def __new__( cls, *posargs, **nomargs ):
+            return super( ).__new__( cls )
+        def __init__( self, name ):
+            self.name = name
+
+    for cls in ( Custom, CustomDerivation ):
+        assert copy.copy( cls( 'a' ) ).name == 'A'
+    reducible = Reducible( 'a' )
+    assert copy.copy( reducible ).name == 'A'
+    assert copy.deepcopy( reducible ).name == 'A'
+    constructible = Constructible( 'a' )
+    assert copy.copy( constructible ) is not constructible
+    assert copy.copy( constructible ).name == 'a'
+
+
+def test_600_hash_cache_dataclass( ):
+    ''' Hashes of immutable dataclass instances are cached. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Currency( module.DataclassObject, instances_hash_cache = True ):
+        code: str
+        digits: int = 2
+        label: str = dataclasses.field( compare = False, default = '' )
+
+    class Region( module.DataclassObject, instances_hash_cache = True ):
+        name: str
+        currencies: tuple[ Currency, ... ] = ( )
+
+    usd = Currency( code = 'USD' )
+    assert hash( usd ) == hash( ( 'USD', 2 ) )
+    assert usd == Currency( code = 'USD', label = 'dollar' )
+    assert usd != Currency( code = 'USD', digits = 3 )
+    assert usd.__eq__( 'USD' ) is NotImplemented
+    assert usd._classcore_instance_hash_ == hash( usd )
+    assert not any( '_classcore_' in name for name in dir( usd ) )
+    assert 'label' not in repr( Region( name = 'us' ) )
+    region = Region( name = 'us', currencies = ( usd, ) )
+    assert { region: 1 }[ Region( name = 'us', currencies = ( usd, ) ) ] == 1
+    eur = Currency( code = 'EUR' )
+    assert len( { usd, Currency( code = 'USD' ), eur } ) == 2
+
+
+def test_601_hash_cache_equality_shortcuts( ):
+    ''' Equality short-circuits on identity and differing cached hashes. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Value:
+        comparisons = 0
+        def __eq__( self, other ):
+            Value.comparisons += 1
+            return True
+        def __hash__( self ): return 0
+
+    class Box( module.DataclassObject, instances_hash_cache = True ):
+        value: Value
+        tag: int
+
+    value = Value( )
+    box1, box2 = Box( value = value, tag = 1 ), Box( value = value, tag = 2 )
+    box3 = Box( value = Value( ), tag = 1 )
+    assert box1 == box1
+    assert Value.comparisons == 0
+    assert box1 == box3
+    assert Value.comparisons == 1
+    hash( box1 ), hash( box2 ), hash( box3 )
+    assert box1 != box2
+    assert box1 == box3
+    assert Value.comparisons == 2
+
+
+def test_602_hash_cache_inheritance( ):
+    ''' Hash caching is inherited and respects custom hashers. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Base( module.DataclassObject, instances_hash_cache = True ):
+        x: int
+
+    class Derivation( Base ):
+        y: int = 0
+
+    class Custom( Base ):
+        def __hash__( self ): return self.x
+
+    class Compared( Base ): # noqa: PLW1641
+        def __eq__( self, other ): return self.x == other.x
+
+    class Uncached( Base, instances_hash_cache = False ):
+        z: int = 0
+
+    derivation = Derivation( x = 1, y = 2 )
+    assert hash( derivation ) == hash( ( 1, 2 ) )
+    assert derivation._classcore_instance_hash_ == hash( ( 1, 2 ) )
+    custom = Custom( x = 5 )
+    assert hash( custom ) == 5
+    assert custom._classcore_instance_hash_ == 5
+    assert custom == Custom( x = 5 )
+    assert Compared( x = 1 ) == Compared( x = 1 )
+    with pytest.raises( TypeError ):
+        hash( Compared( x = 1 ) )
+    with pytest.raises( TypeError ):
+        hash( Uncached( x = 1 ) )
+
+
+def test_603_hash_cache_mutable_instances( ):
+    ''' Hash caching is rejected for instances with mutable attributes. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    with pytest.raises( exceptions.HashCacheInvalidity ):
+
+        class Counter(
+            module.DataclassObjectMutable, instances_hash_cache = True
+        ):
+            count: int = 0
+
+    with pytest.raises( exceptions.HashCacheInvalidity ):
+
+        class Node(
+            module.DataclassObject,
+            instances_hash_cache = True, instances_mutables = ( 'note', ),
+        ):
+            name: str
+            note: str = ''
+
+    with pytest.raises( exceptions.HashCacheInvalidity ):
+
+        class Token( module.ObjectMutable, instances_hash_cache = True ):
+            def __hash__( self ): return 0
+
+    class Deferred(
+        module.DataclassObjectMutable,
+        instances_hash_cache = True, sealing_defer = True,
+    ):
+        count: int = 0
+
+    with pytest.raises( exceptions.HashCacheInvalidity ):
+        hash( Deferred( ) )
+
+
+def test_604_hash_cache_objects( ):
+    ''' Standard objects with custom hashers have hashes cached. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Token( module.Object, instances_hash_cache = True ):
+        def __init__( self, value ):
+            self.value = value
+        def __eq__( self, other ):
+            return isinstance( other, Token ) and self.value == other.value
+        def __hash__( self ): return hash( self.value )
+
+    class Plain( module.Object, instances_hash_cache = True ): pass
+
+    token = Token( 'a' )
+    assert hash( token ) == hash( 'a' )
+    assert token.__dict__[ '_classcore_instance_hash_' ] == hash( 'a' )
+    assert { token: 1 }[ Token( 'a' ) ] == 1
+    plain = Plain( )
+    assert hash( plain ) == object.__hash__( plain )
+    assert not hasattr( plain, '_classcore_instance_hash_' )
+
+
+def test_605_hash_cache_replication( pickling_module ):
+    ''' Cached hashes are neither pickled nor deeply copied. '''
+    currency = pickling_module.Currency( code = 'USD' )
+    hash( currency )
+    assert currency.__reduce_ex__( 4 )[ 2 ] == (
+        None, ( 'code', 'digits' ), [ 'USD', 2 ] )
+    currency_ = pickle.loads( pickle.dumps( currency ) ) # noqa: S301
+    assert not hasattr( currency_, '_classcore_instance_hash_' )
+    assert currency_ == currency
+    assert hash( currency_ ) == hash( currency )
+    assert copy.deepcopy( currency ) is currency
+
+
+def test_700_interning_identity( ):
+    ''' Equal instances of interning dataclasses are identical. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Region( module.DataclassObject, instances_intern = True ):
+        name: str
+        zone: int = 0
+        label: str = dataclasses.field( compare = False, default = '' )
+
+    region = Region( name = 'us' )
+    assert Region( name = 'us', label = 'States' ) is region
+    assert Region( name = 'us', zone = 1 ) is not region
+    assert region == Region( name = 'us' )
+    assert region != Region( name = 'eu' )
+    assert hash( region ) == object.__hash__( region )
+    assert '__weakref__' in Region.__slots__
+    reference = weakref.ref( Region( name = 'eu' ) )
+    gc.collect( )
+    assert reference( ) is None
+    assert Region( name = 'eu' ) is not None
+
+
+def test_701_interning_inheritance( ):
+    ''' Interning is inherited, unless subclasses opt out. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Region( module.DataclassObject, instances_intern = True ):
+        name: str
+
+    class Territory( Region ):
+        parent: str = ''
+
+    class Zone( Region, instances_intern = False ):
+        offset: int = 0
+
+    territory = Territory( name = 'pr', parent = 'us' )
+    assert Territory( name = 'pr', parent = 'us' ) is territory
+    assert Region( name = 'pr' ) is not territory
+    zone = Zone( name = 'utc' )
+    assert Zone( name = 'utc' ) is not zone
+    assert Zone( name = 'utc' ) == zone
+
+
+def test_702_interning_invalidity( ):
+    ''' Interning requires immutable dataclasses with hashable values. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    with pytest.raises( exceptions.InterningInvalidity ):
+
+        class Counter(
+            module.DataclassObjectMutable, instances_intern = True
+        ):
+            count: int = 0
+
+    with pytest.raises( exceptions.InterningInvalidity ):
+
+        class Registry( module.Object, instances_intern = True ): pass
+
+    class Deferred(
+        module.DataclassObject,
+        instances_intern = True,
+        instances_mutables = ( 'note', ),
+        sealing_defer = True,
+    ):
+        note: str = ''
+
+    with pytest.raises( exceptions.InterningInvalidity ):
+        Deferred( )
+
+    class Tags( module.DataclassObject, instances_intern = True ):
+        values: tuple[ str, ... ]
+
+    with pytest.raises( TypeError ):
+        Tags( values = [ 'a' ] ) # pyright: ignore
+
+
+def test_703_interning_customization( ):
+    ''' Custom equality and initialization are respected. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Code( module.DataclassObject, instances_intern = True ):
+        value: str
+        def __eq__( self, other ):
+            return isinstance( other, Code ) and self.value == other.value
+        def __hash__( self ): return hash( self.value )
+
+    class Normalized( module.DataclassObject, instances_intern = True ):
+        value: str
+        def __post_init__( self ):
+            object.__setattr__( self, 'value', self.value.upper( ) )
+
+    assert Code( value = 'a' ) is Code( value = 'a' )
+    assert hash( Code( value = 'a' ) ) == hash( 'a' )
+    normalized = Normalized( value = 'a' )
+    assert Normalized( value = 'A' ) is normalized
+    assert normalized.value == 'A'
+
+
+def test_704_interning_replication( pickling_module ):
+    ''' Pickles and copies of interned instances are interned. '''
+    region = pickling_module.Region( name = 'us' )
+    assert pickle.loads( pickle.dumps( region ) ) is region # noqa: S301
+    assert copy.copy( region ) is region
+    assert copy.deepcopy( region ) is region
+    data = pickle.dumps( pickling_module.Region( name = 'eu', zone = 1 ) )
+    gc.collect( )
+    region_ = pickle.loads( data ) # noqa: S301
+    assert region_.name == 'eu'
+    assert pickling_module.Region( name = 'eu', zone = 1 ) is region_
+
+
+def test_705_interning_concurrency( ):
+    ''' Concurrent constructions agree on one interned instance. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Region( module.DataclassObject, instances_intern = True ):
+        name: str
+
+    barrier = threading.Barrier( 8 )
+    results = [ ]
+
+    def construct( ):
+        barrier.wait( )
+        results.append( Region( name = 'us' ) )
+
+    threads = [ threading.Thread( target = construct ) for _ in range( 8 ) ]
+    for thread in threads: thread.start( )
+    for thread in threads: thread.join( )
+    assert len( { id( result ) for result in results } ) == 1
+
+
+def test_706_interning_values_types( ):
+    ''' Equal values of different types are not interned together. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Price( module.DataclassObject, instances_intern = True ):
+        amount: float
+        tags: tuple[ typing.Any, ... ] = ( )
+
+    price = Price( amount = 1.0 )
+    assert Price( amount = 1.0 ) is price
+    assert Price( amount = True ) is not price
+    assert Price( amount = True ).amount is True
+    assert type( Price( amount = 1 ).amount ) is int
+    tagged = Price( amount = 1.0, tags = ( 1, ) )
+    assert Price( amount = 1.0, tags = ( 1, ) ) is tagged
+    assert Price( amount = 1.0, tags = ( True, ) ) is not tagged
+    assert Price( amount = 1.0, tags = ( ( 1, ), ) ) is not (
+        Price( amount = 1.0, tags = ( ( 1.0, ), ) ) )
+    assert Price( amount = 1.0, tags = ( frozenset( { 1 } ), ) ) is not (
+        Price( amount = 1.0, tags = ( frozenset( { 1.0 } ), ) ) )
+
+
+def test_800_replacement_immutable_dataclass( ):
+    ''' Replicas have changed fields and are immutable. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Event( module.DataclassObject ):
+        kind: str
+        sequence: int = 0
+        tags: tuple[ str, ... ] = ( )
+        version: int = dataclasses.field( default = 1, init = False )
+
+    event = Event( kind = 'opened', tags = ( 'a', ) )
+    event_ = standard.replace( event, sequence = 1 )
+    assert type( event_ ) is Event
+    assert event_ == Event( kind = 'opened', sequence = 1, tags = ( 'a', ) )
+    assert event_.tags is event.tags
+    assert event_.version == 1
+    assert event.sequence == 0
+    assert event_.__replace__( kind = 'closed' ).kind == 'closed'
+    with pytest.raises( exceptions.AttributeImmutability ):
+        event_.sequence = 2 # pyright: ignore
+    with pytest.raises( TypeError ):
+        standard.replace( event, extent = 1 )
+    with pytest.raises( ( TypeError, ValueError ) ):
+        standard.replace( event, version = 2 )
+    if sys.version_info >= ( 3, 13 ):
+        assert copy.replace( event, sequence = 3 ).sequence == 3 # pyright: ignore
+
+
+def test_801_replacement_post_initialization( ):
+    ''' Post-initialization runs on replicas of classes declaring it. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Span( module.DataclassObject ):
+        start: int
+        stop: int
+        extent: int = dataclasses.field( init = False )
+        def __post_init__( self ): self.extent = self.stop - self.start
+
+    span = standard.replace( Span( start = 1, stop = 3 ), stop = 7 )
+    assert span.extent == 6
+
+
+def test_802_replacement_mutable_dataclass( ):
+    ''' Replicas of mutable dataclasses remain mutable. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Cursor( module.DataclassObjectMutable ):
+        position: int = 0
+
+    cursor = standard.replace( Cursor( ), position = 3 )
+    cursor.position = 4
+    assert cursor.position == 4
+
+
+def test_803_replacement_composition( ):
+    ''' Replicas are interned and have hashes cached, as configured. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Region( module.DataclassObject, instances_intern = True ):
+        name: str
+
+    class Currency( module.DataclassObject, instances_hash_cache = True ):
+        code: str
+
+    assert standard.replace( Region( name = 'us' ), name = 'eu' ) is (
+        Region( name = 'eu' ) )
+    currency = Currency( code = 'USD' )
+    hash( currency )
+    currency_ = standard.replace( currency, code = 'EUR' )
+    assert hash( currency_ ) == hash( Currency( code = 'EUR' ) )
+
+
+def test_804_replacement_customization( ):
+    ''' Custom initializers, replacers, and init-only variables work. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Scaled( module.DataclassObject ):
+        value: int
+        def __init__( self, value: int ): self.value = value * 10
+
+    class Replaced( module.DataclassObject ):
+        value: int
+        def __replace__( self, **changes: int ): return 'custom'
+
+    class Seeded( module.DataclassObject ):
+        value: int = 0
+        seed: dataclasses.InitVar[ int ]
+        def __post_init__( self, seed: int ): self.value += seed
+
+    assert standard.replace( Scaled( value = 1 ), value = 2 ).value == 20
+    assert standard.replace( Replaced( value = 1 ), value = 2 ) == 'custom'
+    seeded = standard.replace( Seeded( seed = 1 ), value = 2, seed = 3 )
+    assert seeded.value == 5
+
+    @dataclasses.dataclass
+    class Plain:
+        value: int
+
+    replica = standard.replace( Plain( value = 1 ), value = 2 )
+    assert replica == Plain( value = 2 )
+
+
+def test_805_replacement_sealing_defer( ):
+    ''' Replacement seals classes with deferred sealing. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Deferred( module.DataclassObject, sealing_defer = True ):
+        value: int = 0
+
+    instance = object.__new__( Deferred )
+    object.__setattr__( instance, 'value', 1 )
+    replica = standard.replace( instance, value = 2 )
+    assert replica.value == 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        replica.value = 3 # pyright: ignore
+
+
+def test_900_packing_values( ):
+    ''' Packed fields round-trip values and remain immutable. '''
+    module = cache_import_module( MODULE_QNAME )
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Sample( module.DataclassObject, instances_packed = True ):
+        level: float
+        count: int = 0
+        valid: bool = True
+
+    sample = Sample( level = 1, count = -2 ** 63 )
+    assert sample.level == 1.0
+    assert isinstance( sample.level, float )
+    assert sample.count == -2 ** 63
+    assert sample.valid is True
+    assert sample == Sample( level = 1.0, count = -2 ** 63 )
+    assert sample != Sample( level = 1.0 )
+    assert repr( sample ).endswith(
+        'Sample(level=1.0, count=-9223372036854775808, valid=True)' )
+    assert not hasattr( sample, '__dict__' )
+    assert 'level' not in Sample.__slots__
+    with pytest.raises( exceptions.AttributeImmutability ):
+        sample.level = 2.0 # pyright: ignore
+    with pytest.raises(
+        exceptions.PackingValueInvalidity, match = "'count'"
+    ): Sample( level = 1.0, count = 2 ** 63 )
+    with pytest.raises(
+        exceptions.PackingValueInvalidity, match = "'level'"
+    ): Sample( level = 'high' )
+    with pytest.raises( ValueError, match = "'count'" ):
+        standard.replace( sample, count = 2 ** 64 )
+
+
+def test_901_packing_replication( pickling_module ):
+    ''' Packed instances pickle, copy, and replace. '''
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    reading = pickling_module.Reading( level = 0.25, count = 3 )
+    reading_ = pickle.loads( pickle.dumps( reading ) ) # noqa: S301
+    assert reading_ == reading
+    assert copy.copy( reading ) == reading
+    assert copy.deepcopy( reading ) == reading
+    replica = standard.replace( reading, valid = False )
+    assert replica.valid is False
+    assert replica.level == 0.25
+    assert reading.valid is True
+
+
+def test_902_packing_inheritance( ):
+    ''' Packing composes with inheritance and interning. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Vector( module.DataclassObject, instances_packed = True ):
+        x: float
+        y: float
+
+    class Vector3( Vector ):
+        z: float = 0.0
+
+    vector = Vector3( x = 1.0, y = 2.0, z = 3.0 )
+    assert ( vector.x, vector.y, vector.z ) == ( 1.0, 2.0, 3.0 )
+    assert Vector( x = 1.0, y = 2.0 ).y == 2.0
+
+    class Key(
+        module.DataclassObject,
+        instances_intern = True,
+        instances_packed = True,
+    ):
+        value: int
+
+    key = Key( value = 5 )
+    assert Key( value = 5 ) is key
+    assert Key( value = 6 ) is not key
+
+
+def test_903_packing_invalidity( ):
+    ''' Packing requires dataclasses with numeric fields. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    with pytest.raises( exceptions.PackingInvalidity ):
+
+        class Named( module.DataclassObject, instances_packed = True ):
+            name: str
+
+    with pytest.raises( exceptions.PackingInvalidity ):
+
+        class Registry( module.Object, instances_packed = True ): pass
+
+
+def test_910_slotting_inference( ):
+    ''' Slots are inferred from annotations and instance assignments. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Node( metaclass = module.Class, instances_slots = True ):
+        label: str
+        kind: typing.ClassVar[ str ] = 'node'
+
+        def __init__( self, label, children = ( ) ):
+            self.label = label
+            self.children = tuple( children )
+            self.__weight = 1.0
+            object.__setattr__( self, 'rank', 0 )
+
+        def weigh( self ): return self.__weight
+
+    node = Node( 'root', ( Node( 'leaf' ), ) )
+    assert not hasattr( node, '__dict__' )
+    assert { 'label', 'children', 'rank' } <= set( Node.__slots__ )
+    assert 'kind' not in Node.__slots__
+    assert node.children[ 0 ].label == 'leaf'
+    assert node.weigh( ) == 1.0
+    with pytest.raises( exceptions.AttributeImmutability ):
+        node.label = 'trunk'
+    replica = copy.deepcopy( node )
+    assert replica.children[ 0 ].label == 'leaf'
+    assert replica.weigh( ) == 1.0
+
+    class Leaf( Node ):
+        def __init__( self, label ):
+            super( ).__init__( label )
+            self.depth = 1
+
+    leaf = Leaf( 'leaf' )
+    assert not hasattr( leaf, '__dict__' )
+    assert 'depth' in Leaf.__slots__
+    assert 'label' not in Leaf.__slots__
+    assert leaf.depth == 1
+
+
+def test_911_slotting_fallbacks( ):
+    ''' Instances keep dictionaries for attributes which cannot be slotted. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Counter(
+        metaclass = module.Class,
+        instances_mutables = '*',
+        instances_slots = True,
+    ):
+        count = 0
+        def bump( self ): self.count += 1
+
+    counter = Counter( )
+    counter.bump( )
+    assert '__dict__' in Counter.__slots__
+    assert counter.count == 1
+    assert Counter.count == 0
+
+    class Declared( metaclass = module.Class, instances_slots = True ):
+        __slots__ = ( 'value', )
+
+    assert Declared.__slots__[ 0 ] == 'value'
+    namespace = { 'ccstd': cache_import_module( f"{PACKAGE_NAME}.standard" ) }
+    exec( textwrap.dedent( '''
+        class Dynamic( metaclass = ccstd.Class, instances_slots = True ):
+            value: int
+            def __init__( self ): self.other = 1
+    ''' ), namespace ) # noqa: S102
+    dynamic = namespace[ 'Dynamic' ]( )
+    assert dynamic.other == 1
+    assert '__dict__' in namespace[ 'Dynamic' ].__slots__
+
+
+def test_912_slotting_decorator( ):
+    ''' Decorator factory infers slots for plain classes. '''
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    @standard.with_standard_behaviors( slots = True )
+    class Point:
+        def __init__( self, x, y ):
+            self.x = x
+            self.y = y
+
+    point = Point( 1, 2 )
+    assert not hasattr( point, '__dict__' )
+    assert ( point.x, point.y ) == ( 1, 2 )
+
+
+def test_920_tupleclass_fields( ):
+    ''' Tuple-backed records have keyword-only fields and tuple layouts. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Point( module.TupleclassObject ):
+        x: float
+        y: float = 0.0
+        dimensions: typing.ClassVar[ int ] = 2
+
+    point = Point( x = 3.0 )
+    assert isinstance( point, tuple )
+    assert point == ( 3.0, 0.0 )
+    assert ( point.x, point.y ) == ( 3.0, 0.0 )
+    assert Point.__match_args__ == ( 'x', 'y' )
+    assert Point.dimensions == 2
+    assert repr( point ).endswith( 'Point(x=3.0, y=0.0)' )
+    assert hash( point ) == hash( Point( x = 3.0 ) )
+    assert not hasattr( point, '__dict__' )
+    with pytest.raises( TypeError ):
+        Point( 3.0, 4.0 ) # pyright: ignore
+    with pytest.raises( TypeError ):
+        Point( ) # pyright: ignore
+    with pytest.raises( AttributeError ):
+        point.x = 4.0 # pyright: ignore
+    with pytest.raises( AttributeError ):
+        point.z = 4.0 # pyright: ignore
+    with pytest.raises( exceptions.AttributeImmutability ):
+        Point.x = 4.0 # pyright: ignore
+    match point:
+        case Point( x, y ): assert ( x, y ) == ( 3.0, 0.0 )
+
+
+def test_921_tupleclass_inheritance( ):
+    ''' Subclasses of tuple-backed records append fields. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Point( module.TupleclassObject ):
+        x: float
+        y: float = 0.0
+
+    class Point3( Point ):
+        z: float = 0.0
+        y: float = 1.0
+
+    point = Point3( x = 1.0, z = 3.0 )
+    assert Point3.__match_args__ == ( 'x', 'y', 'z' )
+    assert point == ( 1.0, 1.0, 3.0 )
+    assert ( point.x, point.y, point.z ) == ( 1.0, 1.0, 3.0 )
+    assert repr( point ).endswith( 'Point3(x=1.0, y=1.0, z=3.0)' )
+    assert Point3( x = 1.0, y = 2.0 ).y == 2.0
+
+    class Labeled( Point ):
+        def __repr__( self ): return f"<{self.x}, {self.y}>"
+
+    class LabeledDerivation( Labeled ): pass
+
+    assert repr( LabeledDerivation( x = 1.0 ) ) == '<1.0, 0.0>'
+
+
+def test_922_tupleclass_concealment( ):
+    ''' Non-public attributes of tuple-backed records are concealed. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Point( module.TupleclassObject ):
+        x: float
+        _tag: str = ''
+
+    class Visible( module.TupleclassObject, instances_visibles = '*' ):
+        x: float
+        _tag: str = ''
+
+    assert 'x' in dir( Point( x = 1.0 ) )
+    assert '_tag' not in dir( Point( x = 1.0 ) )
+    assert '_tag' in dir( Visible( x = 1.0 ) )
+
+
+def test_923_tupleclass_replication( pickling_module ):
+    ''' Tuple-backed records pickle, copy, and replace. '''
+    standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    coordinate = pickling_module.Coordinate( latitude = 45.0 )
+    for protocol in range( pickle.HIGHEST_PROTOCOL + 1 ):
+        coordinate_ = pickle.loads( # noqa: S301
+            pickle.dumps( coordinate, protocol = protocol ) )
+        assert type( coordinate_ ) is pickling_module.Coordinate
+        assert coordinate_ == coordinate
+    assert copy.copy( coordinate ) is coordinate
+    assert copy.deepcopy( coordinate ) == coordinate
+    replica = standard.replace( coordinate, longitude = 90.0 )
+    assert replica == ( 45.0, 90.0 )
+    assert type( replica ) is pickling_module.Coordinate
+
+
+def test_924_tupleclass_options_rejection( ):
+    ''' Tuple-backed records reject options for other layouts. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    for option_name, option in (
+        ( 'instances_hash_cache', True ),
+        ( 'instances_ignore_init_arguments', True ),
+        ( 'instances_intern', True ),
+        ( 'instances_mutables', '*' ),
+        ( 'instances_packed', True ),
+    ):
+        with pytest.raises( exceptions.InstancesOptionsInvalidity ) as info:
+            class Point(
+                module.TupleclassObject, **{ option_name: option }
+            ):
+                x: float
+        assert option_name.removeprefix( 'instances_' ) in str( info.value )
+        assert isinstance( info.value, TypeError )
+
+
+def test_930_enum_lookup( ):
+    ''' Enumerations look up members by value as calls do. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Color( module.Enum ):
+        RED = 1
+        GREEN = 2
+        CRIMSON = 1
+
+    assert Color.lookup( 1 ) is Color.RED
+    assert Color.lookup( 2 ) is Color.GREEN
+    assert Color.CRIMSON is Color.RED
+    assert Color.lookup( Color.GREEN ) is Color.GREEN
+    with pytest.raises( ValueError ):
+        Color.lookup( 3 )
+    with pytest.raises( ValueError ):
+        Color.lookup( [ ] )
+
+    class Kind( str, module.Enum ):
+        ALPHA = 'alpha'
+
+        @classmethod
+        def _missing_( cls, value ):
+            return cls.__members__.get( str( value ).upper( ) )
+
+    assert Kind.lookup( 'alpha' ) is Kind.ALPHA
+    assert Kind.lookup( 'Alpha' ) is Kind.ALPHA
+
+    class Permission( enum.IntFlag, metaclass = module.EnumClass ):
+        READ = 4
+        WRITE = 2
+
+    assert Permission.lookup( 4 ) is Permission.READ
+    assert Permission.lookup( 6 ) == Permission.READ | Permission.WRITE
+
+
+def test_931_enum_lookup_customization( ):
+    ''' Enumerations preserve custom lookups and members named for them. '''
+    module = cache_import_module( MODULE_QNAME )
+
+    class Custom( module.Enum ):
+        ONE = 1
+
+        @classmethod
+        def lookup( cls, value ):
+            return cls.ONE
+
+    class Named( module.Enum ):
+        lookup = 1 # pyright: ignore
+
+    assert Custom.lookup( 2 ) is Custom.ONE
+    assert isinstance( Named.lookup, Named )
+
+
+def test_932_enum_protection( pickling_module ):
+    ''' Enumerations have immutable and concealed class attributes. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Color( module.Enum ):
+        RED = 1
+        GREEN = 2
+
+    with pytest.raises( exceptions.AttributeImmutability ):
+        Color.RED = 3 # pyright: ignore
+    with pytest.raises( exceptions.AttributeImmutability ):
+        Color.BLUE = 3 # pyright: ignore
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del Color.lookup
+    assert not any( name.startswith( '_' ) for name in dir( Color ) )
+    assert list( Color ) == [ Color.RED, Color.GREEN ]
+    signal = pickling_module.Signal.GO
+    for protocol in range( pickle.HIGHEST_PROTOCOL + 1 ):
+        assert pickle.loads( # noqa: S301
+            pickle.dumps( signal, protocol = protocol ) ) is signal
+    assert copy.deepcopy( signal ) is signal
+
+
+def test_933_enum_options_rejection( ):
+    ''' Enumerations reject instance options. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    for option_name, option in (
+        ( 'instances_hash_cache', True ),
+        ( 'instances_ignore_init_arguments', True ),
+        ( 'instances_intern', True ),
+        ( 'instances_mutables', '*' ),
+        ( 'instances_packed', True ),
+        ( 'instances_slots', True ),
+        ( 'instances_visibles', '*' ),
+    ):
+        with pytest.raises( exceptions.InstancesOptionsInvalidity ) as info:
+            class Color( module.Enum, **{ option_name: option } ):
+                RED = 1
+        assert option_name.removeprefix( 'instances_' ) in str( info.value )
+
+
+def test_940_protocol_concrete_initialization( ):
+    ''' Concrete subclasses of protocol classes initialize directly. '''
+    import typing_extensions as typx
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Greeter( module.Protocol, typx.Protocol ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    class Greeting( Greeter ):
+        def greet( self ) -> str: return 'hello'
+
+    class Salutation( Greeting ): pass
+
+    with pytest.raises( TypeError ):
+        Greeter( )
+    for cls in ( Greeting, Salutation ):
+        greeting = cls( )
+        assert greeting.greet( ) == 'hello'
+        assert dir( greeting ) == [ 'greet' ]
+        with pytest.raises( exceptions.AttributeImmutability ):
+            greeting.salutation = 'hi' # pyright: ignore
+
+    class Deferred( Greeter, sealing_defer = True ): pass
+
+    deferred = Deferred( )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        deferred.salutation = 'hi' # pyright: ignore
+
+
+def test_941_protocol_concrete_initialization_chains( ):
+    ''' Initializers of concrete subclasses respect MRO and arguments. '''
+    import typing_extensions as typx
+    module = cache_import_module( MODULE_QNAME )
+    calls = [ ]
+
+    class Recorder:
+        def __init__( self, *posargs ): calls.append( posargs )
+
+    class Greeter( module.ProtocolMutable, typx.Protocol ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    class Greeting( Greeter ):
+        def __init__( self, name ): self.name = name
+
+    class Recording( Recorder, Greeter ): pass
+
+    class Ignoring( Greeter, instances_ignore_init_arguments = True ): pass
+
+    greeting = Greeting( 'world' )
+    greeting.name = 'everyone'
+    assert greeting.name == 'everyone'
+    Recording( 1, 2 )
+    assert calls == [ ( 1, 2 ) ]
+    Ignoring( 1, 2 )
+
+    class Point( module.DataclassProtocol, typx.Protocol ):
+        x: int
+
+    class Location( Point ):
+        y: int = 0
+
+    assert ( Location( x = 1 ).x, Location( x = 1 ).y ) == ( 1, 0 )
+
+
+def test_950_protocol_runtime_checks( ):
+    ''' Runtime-checkable protocols check declared members only. '''
+    import typing_extensions as typx
+    module = cache_import_module( MODULE_QNAME )
+
+    @typx.runtime_checkable
+    class Greeter( module.Protocol, typx.Protocol ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    @typx.runtime_checkable
+    class Named( module.DataclassProtocol, typx.Protocol ):
+        name: str
+
+    @typx.runtime_checkable
+    class NamedGreeter( Greeter, typx.Protocol ):
+        name: str
+
+    class Greeting:
+        def greet( self ) -> str: return 'hello'
+
+    class Naming:
+        def __init__( self, name: str ): self.name = name
+
+    class Slotted:
+        __slots__ = ( 'other', )
+
+    class Concrete( Greeter ):
+        def greet( self ) -> str: return 'hi'
+
+    assert typx.get_protocol_members( Greeter ) == { 'greet' }
+    assert typx.get_protocol_members( Named ) == { 'name' }
+    assert typx.get_protocol_members( NamedGreeter ) == { 'greet', 'name' }
+    for _ in range( 2 ): # verdicts are cached after first check
+        assert isinstance( Greeting( ), Greeter )
+        assert isinstance( Concrete( ), Greeter )
+        assert not isinstance( Naming( 'x' ), Greeter )
+        assert isinstance( Naming( 'x' ), Named )
+        assert not isinstance( object( ), Named )
+        assert not isinstance( Slotted( ), Named )
+        assert not isinstance( Greeting( ), NamedGreeter )
+    greeting = Greeting( )
+    greeting.name = 'x' # pyright: ignore
+    assert isinstance( greeting, NamedGreeter )
+
+
+def test_951_protocol_runtime_checks_registration( ):
+    ''' Runtime checks notice registrations after cached verdicts. '''
+    import typing_extensions as typx
+    module = cache_import_module( MODULE_QNAME )
+
+    @typx.runtime_checkable
+    class Greeter( module.Protocol, typx.Protocol ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    class Silent: pass
+
+    assert not isinstance( Silent( ), Greeter )
+    Greeter.register( Silent )
+    assert isinstance( Silent( ), Greeter )
+
+
+def test_952_protocol_runtime_checks_unchecked( ):
+    ''' Protocols, which are not runtime-checkable, refuse checks. '''
+    import typing_extensions as typx
+    module = cache_import_module( MODULE_QNAME )
+
+    class Greeter( module.Protocol, typx.Protocol ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    with pytest.raises( TypeError ):
+        isinstance( object( ), Greeter )
@@ -18,6 +18,7 @@
 #============================================================================#
 
 
+import sys
 import types
 import warnings
 
@@ -248,3 +249,79 @@ def test_214_finalize_module_nonrecursive_without_module_targets( ):
     assert module_.__class__ is module_class
     with pytest.raises( exceptions_module.AttributeImmutability ):
         module_.foo = 1
+
+
+def test_220_finalize_module_deferred_docstrings( ):
+    ''' Defers docstring assignment until requested. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions_module = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    module_class = module.Module
+    package_module = types.ModuleType( 'fakepackage' )
+    package_module.__package__ = 'fakepackage'
+    package_module.__doc__ = ''' Fake package. '''
+    member_module = types.ModuleType( 'fakepackage.member' )
+    member_module.__package__ = 'fakepackage'
+    member_module.__doc__ = ''' Fake member. '''
+    package_module.member = member_module
+
+    def function( argument: int ) -> int:
+        ''' Does nothing useful. '''
+        return argument
+
+    function.__module__ = 'fakepackage.member'
+    function_doc = function.__doc__
+    member_module.function = function
+    module.finalize_module(
+        package_module, dynadoc_defer = True, recursive = True )
+    assert package_module.__class__ is module_class
+    assert member_module.__class__ is module_class
+    assert function.__doc__ == function_doc
+    module.assign_deferred_module_docstrings( )
+    assert ':argument argument:' in function.__doc__
+    assert package_module.__class__ is module_class
+    assert member_module.__class__ is module_class
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        package_module.foo = 1
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        member_module.foo = 1
+    assert 'member' in dir( package_module )
+    module.assign_deferred_module_docstrings( ) # idempotent
+
+
+def test_300_lazy_members_provision( ):
+    ''' Members of lazily imported submodules are provided by package. '''
+    import ast
+    import inspect
+    package = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    names = { }
+    modules_names = ( 'conversions', 'prewarming', 'records', 'registries' )
+    for module_name in modules_names:
+        module = cache_import_module(
+            f"{PACKAGE_NAME}.standard.{module_name}" )
+        tree = ast.parse( inspect.getsource( module ) )
+        for node in tree.body:
+            if not isinstance( node, ( ast.ClassDef, ast.FunctionDef ) ):
+                continue
+            if node.name.startswith( '_' ): continue
+            names[ node.name ] = module_name
+            member = getattr( module, node.name )
+            assert getattr( package, node.name ) is member
+            assert node.name in dir( package )
+    assert names == dict( package._lazy_attributes )
+
+
+def test_301_lazy_submodule_binding( ):
+    ''' Import system can bind submodules to reclassified package. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions_module = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    package_module = types.ModuleType( 'fakepackage' )
+    member_module = types.ModuleType( 'fakepackage.member' )
+    module.finalize_module( package_module )
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        package_module.member = member_module
+    sys.modules[ 'fakepackage.member' ] = member_module
+    try: package_module.member = member_module
+    finally: del sys.modules[ 'fakepackage.member' ]
+    assert package_module.member is member_module
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        package_module.other = member_module
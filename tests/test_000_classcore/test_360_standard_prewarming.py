@@ -0,0 +1,136 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of prewarming. '''
+
+
+import gc
+import types
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.standard.prewarming"
+
+
+def test_100_prewarm_materializes_state( ):
+    ''' Prewarming seals classes, computes digests, and assigns docstrings. '''
+    module = cache_import_module( MODULE_QNAME )
+    behaviors = cache_import_module( f"{PACKAGE_NAME}.standard.behaviors" )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    modules = cache_import_module( f"{PACKAGE_NAME}.standard.modules" )
+    utilities = cache_import_module( f"{PACKAGE_NAME}.utilities" )
+
+    class Base( classes.Object, sealing_defer = True ): pass
+
+    class Derivation( Base ): pass
+
+    module_ = types.ModuleType( 'fakepackage.prewarmable' )
+    module_.__package__ = 'fakepackage'
+    module_.__doc__ = 'Prewarmable module.'
+    modules.finalize_module( module_, dynadoc_defer = True )
+    assert behaviors.is_class_sealing_pending( Derivation )
+    report = module.prewarm( )
+    assert not behaviors.is_class_sealing_pending( Base )
+    assert not behaviors.is_class_sealing_pending( Derivation )
+    assert Derivation in utilities._mangled_names_digests
+    assert 'fakepackage.prewarmable' not in (
+        modules._module_docstrings_deferrals )
+    assert report.classes >= 2
+    assert report.classes_sealed >= 2
+    assert report.modules_documented >= 1
+    assert 0 == report.objects_frozen
+    report = module.prewarm( )
+    assert 0 == report.classes_sealed
+    assert 0 == report.modules_documented
+
+
+def test_110_prewarm_metaclasses_selection( ):
+    ''' Prewarming ignores classes from unselected metaclasses. '''
+    module = cache_import_module( MODULE_QNAME )
+    behaviors = cache_import_module( f"{PACKAGE_NAME}.standard.behaviors" )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+
+    class Object( classes.Object, sealing_defer = True ): pass
+
+    class DataclassObject( classes.DataclassObject, sealing_defer = True ):
+        value: int = 0
+
+    module.prewarm( metaclasses = ( classes.Dataclass, ) )
+    assert behaviors.is_class_sealing_pending( Object )
+    assert not behaviors.is_class_sealing_pending( DataclassObject )
+    module.prewarm( )
+    assert not behaviors.is_class_sealing_pending( Object )
+
+
+def test_120_prewarm_gc_freeze( ):
+    ''' Prewarming optionally freezes garbage collector. '''
+    module = cache_import_module( MODULE_QNAME )
+    try:
+        report = module.prewarm( gc_freeze = True )
+        assert report.objects_frozen > 0
+    finally: gc.unfreeze( )
+
+
+def test_130_prewarm_caches( ):
+    ''' Prewarming materializes cache entries and counts them by cache. '''
+    import typing_extensions as typx
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    conversions = cache_import_module(
+        f"{PACKAGE_NAME}.standard.conversions" )
+    protocols = cache_import_module( f"{PACKAGE_NAME}.standard.protocols" )
+    records = cache_import_module( f"{PACKAGE_NAME}.standard.records" )
+
+    class Point( classes.DataclassObject ):
+        x: int = 0
+
+    @typx.runtime_checkable
+    class Located( classes.Protocol, typx.Protocol ):
+        def locate( self ) -> int: raise NotImplementedError
+
+    records.produce_record_codec( Point )
+    assert Point not in conversions._converters
+    assert Point not in records._batch_profiles
+    assert Located not in protocols._instances_verdicts
+    report = module.prewarm( )
+    assert Point in conversions._converters
+    assert Point in records._batch_profiles
+    assert Located in protocols._instances_verdicts
+    for name in (
+        'assembly', 'conversions', 'copying', 'pickling',
+        'protocols', 'records', 'replacement',
+    ): assert report.caches[ name ] >= 1
+    point = Point( x = 1 )
+    assert conversions.astuple( point ) == ( 1, )
+    assert records.RecordBatch( Point, [ point ] )[ 0 ] == point
+
+
+def test_131_prewarm_caches_failures( ):
+    ''' Prewarming skips cache entries which cannot be materialized. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+
+    class Point( classes.DataclassObject, class_mutables = '*' ):
+        x: int = 0
+
+    del Point.x
+    report = module.prewarm( )
+    assert report.caches[ 'pickling' ] >= 1
@@ -0,0 +1,210 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of registry of dynamic classes. '''
+
+
+import dataclasses
+import gc
+import pickle
+import subprocess
+import sys
+import weakref
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.standard.registries"
+
+
+def _produce_point_class( module, **nomargs ):
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    return module.produce_class(
+        classes.Dataclass, 'Point', ( classes.DataclassObject, ),
+        { '__annotations__': { 'x': int, 'y': int }, 'y': 0 },
+        { 'instances_mutables': ( 'y', ) }, **nomargs )
+
+
+def test_100_produce_class_deduplication( ):
+    ''' Identical recipes produce same class; different ones do not. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    cls = _produce_point_class( module )
+    assert cls is _produce_point_class( module )
+    assert cls.__module__ == MODULE_QNAME
+    fingerprint = module.access_class_fingerprint( cls )
+    assert fingerprint is not None
+    assert module.restore_class( fingerprint ) is cls
+    other = module.produce_class(
+        classes.Dataclass, 'Point', ( classes.DataclassObject, ),
+        { '__annotations__': { 'x': int, 'y': int }, 'y': 1 },
+        { 'instances_mutables': ( 'y', ) } )
+    assert other is not cls
+    assert module.access_class_fingerprint( classes.DataclassObject ) is None
+    point = cls( x = 1 )
+    point.y = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point.x = 3
+
+
+def test_110_fingerprint_reproducibility( ):
+    ''' Fingerprints are reproducible across processes. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    nomina = cache_import_module( f"{PACKAGE_NAME}.nomina" )
+
+    def recipe( visibles ):
+        return (
+            classes.Dataclass, 'Plugin', ( classes.DataclassObject, ),
+            {   '__annotations__': { 'tags': frozenset[ str ] },
+                'tags': dataclasses.field( default_factory = frozenset ) },
+            { 'instances_visibles': visibles } )
+
+    fingerprint = module.calculate_class_fingerprint(
+        recipe( ( nomina.is_public_identifier, ) ) )
+    assert fingerprint == module.calculate_class_fingerprint(
+        recipe( ( nomina.is_public_identifier, ) ) )
+    script = (
+        "import dataclasses; "
+        f"import {PACKAGE_NAME}.standard as ccstd; "
+        f"from {PACKAGE_NAME}.nomina import is_public_identifier; "
+        "print( ccstd.calculate_class_fingerprint( ( "
+        "ccstd.Dataclass, 'Plugin', ( ccstd.DataclassObject, ), "
+        "{ '__annotations__': { 'tags': frozenset[ str ] }, "
+        "'tags': dataclasses.field( default_factory = frozenset ) }, "
+        "{ 'instances_visibles': ( is_public_identifier, ) } ) ) )" )
+    result = subprocess.run( # noqa: S603
+        ( sys.executable, '-c', script ),
+        capture_output = True, check = True, text = True )
+    assert result.stdout.strip( ) == fingerprint
+
+
+def test_111_fingerprint_identity_rejection( ):
+    ''' Recipes with objects only describable by identity are rejected. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Local: pass
+
+    def local( name ): return True
+
+    values = ( lambda name: True, local, Local, object( ), [ ].append )
+    for value in values:
+        recipe = (
+            classes.Class, 'Plugin', ( classes.Object, ),
+            { 'value': value }, { } )
+        with pytest.raises( exceptions.ClassRecipeInvalidity ):
+            module.calculate_class_fingerprint( recipe )
+        with pytest.raises( exceptions.ClassRecipeInvalidity ):
+            module.produce_class( *recipe )
+
+
+def test_120_registry_retention( ):
+    ''' Registry does not keep unreferenced classes alive. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    cls = module.produce_class(
+        classes.Dataclass, 'Transient', ( classes.DataclassObject, ),
+        { '__annotations__': { 'x': int } }, recipe_pickling = False )
+    fingerprint = module.access_class_fingerprint( cls )
+    reference = weakref.ref( cls )
+    del cls
+    gc.collect( )
+    assert reference( ) is None
+    with pytest.raises( exceptions.ClassRegistrationAbsence ):
+        module.restore_class( fingerprint )
+
+
+def test_200_pickling_in_process( ):
+    ''' Instances of registered classes round-trip to same class. '''
+    module = cache_import_module( MODULE_QNAME )
+    cls = _produce_point_class( module )
+    derivation = module.produce_class(
+        type( cls ), 'Point3', ( cls, ),
+        { '__annotations__': { 'z': int }, 'z': 0 } )
+    points = [ cls( x = 1 ), derivation( x = 2, z = 3 ) ]
+    points_ = pickle.loads( pickle.dumps( points ) ) # noqa: S301
+    assert points_ == points
+    assert [ type( point ) for point in points_ ] == [ cls, derivation ]
+
+
+def test_210_pickling_across_processes( ):
+    ''' Unpickling process reconstructs registered classes once. '''
+    module = cache_import_module( MODULE_QNAME )
+    cls = _produce_point_class( module )
+    data = pickle.dumps( [ cls( x = 1 ), cls( x = 2, y = 3 ) ] )
+    script = '\n'.join( (
+        'import pickle, sys',
+        'points = pickle.loads( sys.stdin.buffer.read( ) )',
+        'again = pickle.loads( pickle.dumps( points ) )',
+        'assert type( again[ 0 ] ) is type( points[ 0 ] )',
+        'points[ 0 ].y = 4',
+        'try: points[ 0 ].x = 5',
+        'except AttributeError: pass',
+        'else: raise AssertionError',
+        'print( repr( points ) )' ) )
+    result = subprocess.run( # noqa: S603
+        ( sys.executable, '-c', script ),
+        capture_output = True, check = True, input = data )
+    assert result.stdout.decode( ).strip( ) == (
+        '[Point(x=1, y=4), Point(x=2, y=3)]' )
+
+
+def test_220_pickling_compact_references( ):
+    ''' Classes without recipe pickling are referenced by fingerprint. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    cls = module.produce_class(
+        classes.Dataclass, 'Compact', ( classes.DataclassObject, ),
+        { '__annotations__': { 'x': int } }, recipe_pickling = False )
+    data = pickle.dumps( cls( x = 1 ) )
+    assert pickle.loads( data ).x == 1 # noqa: S301
+    assert b'__annotations__' not in data
+    fingerprint = module.access_class_fingerprint( cls )
+    with pytest.raises( exceptions.ClassRegistrationAbsence ):
+        module.restore_class( fingerprint[ : : -1 ] )
+
+
+def test_230_pickling_recipe_cost( ):
+    ''' Recipes are carried once per pickle rather than per instance. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    namespace = { '__annotations__': { 'x': int, 'y': int } }
+    full = module.produce_class(
+        classes.Dataclass, 'Full', ( classes.DataclassObject, ), namespace )
+    compact = module.produce_class(
+        classes.Dataclass, 'Compact', ( classes.DataclassObject, ),
+        namespace, recipe_pickling = False )
+
+    def measure( cls, count ):
+        return len( pickle.dumps( [
+            cls( x = index, y = index ) for index in range( count ) ] ) )
+
+    cost = measure( full, 1 ) - measure( compact, 1 )
+    assert 0 < cost
+    assert measure( full, 100 ) - measure( compact, 100 ) == cost
+    static = pickle.dumps( classes.DataclassObject )
+    assert pickle.loads( static ) is classes.DataclassObject # noqa: S301
@@ -0,0 +1,132 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of dataclass conversions. '''
+
+
+import collections
+import dataclasses
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.standard.conversions"
+
+
+def _produce_order_classes( ):
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+
+    class Money( classes.DataclassObject, instances_hash_cache = True ):
+        amount: int
+        currency: str = 'USD'
+
+    class Line( classes.DataclassObject ):
+        sku: str
+        price: Money
+        tags: tuple[ str, ... ] = ( )
+
+    class Order( classes.DataclassObject ):
+        ident: str
+        lines: list[ Line ]
+        totals: dict[ str, Money ]
+
+    return Money, Line, Order
+
+
+def test_100_asdict_deep( ):
+    ''' Nested dataclasses and standard containers are converted. '''
+    module = cache_import_module( MODULE_QNAME )
+    Money, Line, Order = _produce_order_classes( )
+    price = Money( amount = 5 )
+    hash( price ) # assigns cached hash slot
+    order = Order(
+        ident = 'A1',
+        lines = [ Line( sku = 'x', price = price, tags = ( 'new', ) ) ],
+        totals = { 'net': price } )
+    result = module.asdict( order )
+    assert result == {
+        'ident': 'A1',
+        'lines': [ {
+            'sku': 'x',
+            'price': { 'amount': 5, 'currency': 'USD' },
+            'tags': ( 'new', ),
+        } ],
+        'totals': { 'net': { 'amount': 5, 'currency': 'USD' } },
+    }
+    assert result[ 'lines' ] is not order.lines
+
+
+def test_110_asdict_shallow( ):
+    ''' Shallow conversion shares field values with instance. '''
+    module = cache_import_module( MODULE_QNAME )
+    Money, Line, _ = _produce_order_classes( )
+    line = Line( sku = 'x', price = Money( amount = 5 ) )
+    result = module.asdict( line, deep = False )
+    assert result == { 'sku': 'x', 'price': line.price, 'tags': ( ) }
+    assert result[ 'price' ] is line.price
+
+
+def test_200_astuple( ):
+    ''' Tuples of field values are produced in field order. '''
+    module = cache_import_module( MODULE_QNAME )
+    Money, Line, Order = _produce_order_classes( )
+    price = Money( amount = 5 )
+    order = Order(
+        ident = 'A1',
+        lines = [ Line( sku = 'x', price = price ) ],
+        totals = { 'net': price } )
+    assert module.astuple( order ) == (
+        'A1', [ ( 'x', ( 5, 'USD' ), ( ) ) ], { 'net': ( 5, 'USD' ) } )
+    assert module.astuple( price, deep = False ) == ( 5, 'USD' )
+
+
+def test_300_conversion_of_other_values( ):
+    ''' Plain dataclasses convert; other values are not copied. '''
+    module = cache_import_module( MODULE_QNAME )
+    Pair = collections.namedtuple( 'Pair', ( 'left', 'right' ) )
+
+    @dataclasses.dataclass
+    class Plain:
+        pair: Pair
+        items: set[ int ]
+        nested: tuple[ object, ... ] = ( )
+
+    items = { 1, 2 }
+    pair = Pair( left = [ 1 ], right = 2 )
+    plain = Plain(
+        pair = pair, items = items, nested = ( Plain( pair, items ), ) )
+    result = module.asdict( plain )
+    assert result[ 'pair' ] is pair
+    assert result[ 'items' ] is items
+    assert result[ 'nested' ] == (
+        { 'pair': pair, 'items': items, 'nested': ( ) }, )
+    assert result == dataclasses.asdict( plain )
+
+
+def test_400_conversion_invalidity( ):
+    ''' Conversion of instances of other classes is refused. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    with pytest.raises( exceptions.ConversionInvalidity ):
+        module.asdict( object( ) )
+    with pytest.raises( TypeError ):
+        module.astuple( 42 )
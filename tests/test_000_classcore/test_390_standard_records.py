@@ -0,0 +1,420 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of binary records, stores, and batches. '''
+
+
+import mmap
+import multiprocessing
+import pickle
+import struct
+import sys
+import textwrap
+import types
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.standard.records"
+SHARING_SOURCE = textwrap.dedent( f'''
+    import {PACKAGE_NAME}.standard as ccstd
+
+    class Trade( ccstd.DataclassObject ):
+        symbol: str
+        quantity: int
+''' )
+
+
+@pytest.fixture
+def sharing_module( ):
+    name = '_classcore_sharing_fixtures'
+    module = types.ModuleType( name )
+    sys.modules[ name ] = module
+    try:
+        exec( SHARING_SOURCE, module.__dict__ ) # noqa: S102
+        yield module
+    finally: del sys.modules[ name ]
+
+
+def _produce_record_classes( ):
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+
+    class Tick( classes.DataclassObject ):
+        sequence: int
+        price: float
+        active: bool = True
+
+    class Trade( classes.DataclassObject, instances_hash_cache = True ):
+        symbol: str
+        quantity: int
+        note: bytes = b''
+
+    return Tick, Trade
+
+
+def _summarize_shared_trades( store ):
+    try: return len( store ), sum( trade.quantity for trade in store )
+    finally: store.close( )
+
+
+def test_100_codec_production( ):
+    ''' Codecs are produced once per class with precomputed layouts. '''
+    module = cache_import_module( MODULE_QNAME )
+    Tick, Trade = _produce_record_classes( )
+    codec = module.produce_record_codec( Tick )
+    assert module.produce_record_codec( Tick ) is codec
+    assert codec.record_class is Tick
+    assert codec.record_size == struct.calcsize( '<qd?' )
+    assert module.produce_record_codec( Trade ).record_size is None
+
+
+def test_110_codec_invalidity( ):
+    ''' Classes with unsupported fields and foreign instances are refused. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, Trade = _produce_record_classes( )
+
+    class Basket( classes.DataclassObject ):
+        items: list[ int ]
+
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        module.produce_record_codec( Basket )
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        module.produce_record_codec( object )
+    codec = module.produce_record_codec( Tick )
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        codec.encode( Trade( symbol = 'X', quantity = 1 ) )
+    huge = Tick( sequence = 2 ** 64, price = 0.0 )
+    with pytest.raises(
+        exceptions.RecordValueInvalidity, match = "'sequence'"
+    ): codec.encode( huge )
+    with pytest.raises(
+        exceptions.RecordValueInvalidity, match = "'sequence'"
+    ): codec.encode_many( ( Tick( sequence = 1, price = 0.0 ), huge ) )
+    codec = module.produce_record_codec( Trade )
+    with pytest.raises(
+        exceptions.RecordValueInvalidity, match = "'quantity'"
+    ): codec.encode( Trade( symbol = 'X', quantity = -2 ** 64 ) )
+    with pytest.raises( ValueError, match = "'quantity'" ):
+        codec.encode_many( ( Trade( symbol = 'X', quantity = 2 ** 63 ), ) )
+
+
+def test_200_fixed_records( ):
+    ''' Fixed-size records round-trip to immutable instances. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, _ = _produce_record_classes( )
+    codec = module.produce_record_codec( Tick )
+    tick = Tick( sequence = 1, price = 2.5, active = False )
+    record = codec.encode( tick )
+    assert record == struct.pack( '<qd?', 1, 2.5, False )
+    tick_ = codec.decode( record )
+    assert tick_ == tick
+    with pytest.raises( exceptions.AttributeImmutability ):
+        tick_.price = 3.0
+    ticks = [ Tick( sequence = i, price = i / 2 ) for i in range( 5 ) ]
+    buffer = codec.encode_many( ticks )
+    assert isinstance( buffer, bytearray )
+    assert len( buffer ) == 5 * codec.record_size
+    assert codec.decode_many( buffer ) == ticks
+    assert codec.decode( buffer, 3 * codec.record_size ) == ticks[ 3 ]
+    assert codec.decode_many( buffer, 3 * codec.record_size ) == ticks[ 3 : ]
+
+
+def test_210_variable_records( ):
+    ''' Records with strings and bytes round-trip. '''
+    module = cache_import_module( MODULE_QNAME )
+    _, Trade = _produce_record_classes( )
+    codec = module.produce_record_codec( Trade )
+    trade = Trade( symbol = 'ÄBC', quantity = 3, note = b'xy' )
+    hash( trade ) # assigns cached hash slot
+    record = codec.encode( trade )
+    assert len( record ) == struct.calcsize( '<IqI' ) + 4 + 2
+    trade_ = codec.decode( record )
+    assert trade_ == trade
+    assert hash( trade_ ) == hash( trade )
+    trades = [ trade, Trade( symbol = 'Z', quantity = 9 ) ]
+    buffer = codec.encode_many( iter( trades ) )
+    assert bytes( buffer ) == b''.join( map( codec.encode, trades ) )
+    assert codec.decode_many( buffer ) == trades
+
+
+def test_220_records_in_mapped_files( tmp_path ):
+    ''' Records decode in place from memory-mapped files. '''
+    module = cache_import_module( MODULE_QNAME )
+    _, Trade = _produce_record_classes( )
+    codec = module.produce_record_codec( Trade )
+    trades = [ Trade( symbol = str( i ), quantity = i ) for i in range( 3 ) ]
+    path = tmp_path / 'trades.bin'
+    path.write_bytes( codec.encode_many( trades ) )
+    with path.open( 'rb' ) as file:
+        mapping = mmap.mmap( file.fileno( ), 0, access = mmap.ACCESS_READ )
+        assert codec.decode( mapping ) == trades[ 0 ]
+        assert codec.decode_many( mapping ) == trades
+        mapping.close( ) # no lingering exports
+
+
+def test_230_interned_records( ):
+    ''' Decoded instances of interning classes are interned. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+
+    class Region( classes.DataclassObject, instances_intern = True ):
+        name: str
+        zone: int = 0
+
+    codec = module.produce_record_codec( Region )
+    region = Region( name = 'us' )
+    assert codec.decode( codec.encode( region ) ) is region
+
+
+def test_300_fixed_record_stores( tmp_path ):
+    ''' Stores of fixed-size records decode instances on access. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, _ = _produce_record_classes( )
+    ticks = [ Tick( sequence = i, price = i / 2 ) for i in range( 2500 ) ]
+    path = tmp_path / 'ticks.bin'
+    assert module.write_record_store( path, Tick, iter( ticks ) ) == 2500
+    with module.open_record_store( path, Tick ) as store:
+        assert store.record_class is Tick
+        assert len( store ) == 2500
+        assert store[ 0 ] == ticks[ 0 ]
+        assert store[ -1 ] == ticks[ -1 ]
+        assert store[ 1000 : 1003 ] == ticks[ 1000 : 1003 ]
+        assert store[ 3 : 1 ] == [ ]
+        assert store[ : : 1000 ] == ticks[ : : 1000 ]
+        assert list( store ) == ticks
+        assert next( reversed( store ) ) == ticks[ -1 ]
+        with pytest.raises( exceptions.RecordAbsence ):
+            store[ 2500 ]
+        with pytest.raises( IndexError ):
+            store[ -2501 ]
+        with pytest.raises( exceptions.AttributeImmutability ):
+            store[ 0 ].price = 1.0
+        tick = store[ 7 ]
+    assert tick == ticks[ 7 ]
+    with pytest.raises( ValueError ):
+        store[ 7 ]
+
+
+def test_310_variable_record_stores( tmp_path ):
+    ''' Stores of variable-size records index their offsets. '''
+    module = cache_import_module( MODULE_QNAME )
+    _, Trade = _produce_record_classes( )
+    trades = [
+        Trade( symbol = 'X' * ( i % 7 ), quantity = i, note = b'n' * i )
+        for i in range( 1500 ) ]
+    path = tmp_path / 'trades.bin'
+    assert module.write_record_store( str( path ), Trade, trades ) == 1500
+    with module.open_record_store( path, Trade ) as store:
+        assert len( store ) == 1500
+        assert store[ 1234 ] == trades[ 1234 ]
+        assert store[ -2 : ] == trades[ -2 : ]
+        assert list( store ) == trades
+        with module.open_record_store( path, Trade ) as store_:
+            assert store_[ 5 ] == store[ 5 ]
+    path = tmp_path / 'empty.bin'
+    assert module.write_record_store( path, Trade, ( ) ) == 0
+    with module.open_record_store( path, Trade ) as store:
+        assert len( store ) == 0
+        assert list( store ) == [ ]
+
+
+def test_320_record_store_invalidity( tmp_path ):
+    ''' Foreign, truncated, and mismatched stores are refused. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, Trade = _produce_record_classes( )
+    path = tmp_path / 'ticks.bin'
+    module.write_record_store(
+        path, Tick, [ Tick( sequence = i, price = 0.0 ) for i in range( 3 ) ] )
+    with pytest.raises( exceptions.RecordStoreInvalidity ):
+        module.open_record_store( path, Trade )
+    content = path.read_bytes( )
+    path_ = tmp_path / 'truncated.bin'
+    path_.write_bytes( content[ : -1 ] )
+    with pytest.raises( exceptions.RecordStoreInvalidity ):
+        module.open_record_store( path_, Tick )
+    path_.write_bytes( content[ : 4 ] )
+    with pytest.raises( exceptions.RecordStoreInvalidity ):
+        module.open_record_store( path_, Tick )
+    path_.write_bytes( b'\0' * len( content ) )
+    with pytest.raises( exceptions.RecordStoreInvalidity ):
+        module.open_record_store( path_, Tick )
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        module.write_record_store(
+            tmp_path / 'mixed.bin', Tick,
+            [ Trade( symbol = 'X', quantity = 1 ) ] )
+
+
+def test_330_shared_record_stores( sharing_module ):
+    ''' Shared stores are pickled as handles to same memory block. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Trade = sharing_module.Trade
+    trades = [ Trade( symbol = str( i ), quantity = i ) for i in range( 100 ) ]
+    store = module.share_records( Trade, iter( trades ) )
+    try:
+        assert isinstance( store, module.RecordStore )
+        assert store.record_class is Trade
+        assert list( store ) == trades
+        payload = pickle.dumps( store )
+        assert len( payload ) < 200
+        store_ = pickle.loads( payload ) # noqa: S301
+        assert store_.name == store.name
+        assert store_[ 42 ] == trades[ 42 ]
+        store_.close( )
+        with pytest.raises( exceptions.AttributeImmutability ):
+            store[ 0 ].quantity = 1
+        Tick, _ = _produce_record_classes( )
+        with pytest.raises( exceptions.RecordStoreInvalidity ):
+            module.SharedRecordStore( store.name, Tick )
+    finally:
+        store.unlink( )
+        store.close( )
+    with pytest.raises( FileNotFoundError ):
+        module.SharedRecordStore( store.name, Trade )
+
+
+@pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods( ),
+    reason = "Worker processes inherit fixture module only when forked." )
+def test_340_shared_record_stores_in_workers( sharing_module ):
+    ''' Worker processes read records from shared memory block. '''
+    module = cache_import_module( MODULE_QNAME )
+    Trade = sharing_module.Trade
+    store = module.share_records(
+        Trade, ( Trade( symbol = 'X', quantity = i ) for i in range( 1000 ) ) )
+    context = multiprocessing.get_context( 'fork' )
+    try:
+        with ProcessPoolExecutor( 2, mp_context = context ) as executor:
+            results = list( executor.map(
+                _summarize_shared_trades, ( store, store ) ) )
+    finally:
+        store.unlink( )
+        store.close( )
+    assert results == [ ( 1000, 499500 ) ] * 2
+
+
+def test_400_record_batches( ):
+    ''' Batches store fields in columns and assemble instances on access. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, Trade = _produce_record_classes( )
+    ticks = [
+        Tick( sequence = i, price = i / 2, active = i % 2 == 0 )
+        for i in range( 10 ) ]
+    batch = module.RecordBatch( Tick, iter( ticks ) )
+    assert batch.record_class is Tick
+    assert len( batch ) == 10
+    assert batch[ 3 ] == ticks[ 3 ]
+    assert batch[ -1 ] == ticks[ -1 ]
+    assert batch[ 0 ].active is True
+    assert list( batch ) == ticks
+    assert list( batch[ 2 : 5 ] ) == ticks[ 2 : 5 ]
+    assert list( batch[ : : -3 ] ) == ticks[ : : -3 ]
+    assert len( batch[ 5 : 2 ] ) == 0
+    with pytest.raises( exceptions.RecordAbsence ):
+        batch[ 10 ]
+    with pytest.raises( exceptions.AttributeImmutability ):
+        batch[ 0 ].price = 1.0
+    batch.append( Tick( sequence = 10, price = 5.0 ) )
+    assert len( batch ) == 11
+    assert batch[ 10 ].sequence == 10
+    trades = [
+        Trade( symbol = 'ÄB' * i, quantity = i, note = bytes( i ) )
+        for i in range( 5 ) ]
+    batch = module.RecordBatch( Trade )
+    batch.extend( trades )
+    assert list( batch ) == trades
+    assert list( batch[ 1 : 3 ] ) == trades[ 1 : 3 ]
+    assert list( batch[ 1 : 3 ][ 1 : ] ) == trades[ 2 : 3 ]
+
+
+def test_410_record_batch_columns( ):
+    ''' Batches support operations over whole columns. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, Trade = _produce_record_classes( )
+    ticks = [
+        Tick( sequence = i, price = i / 2, active = i % 3 == 0 )
+        for i in range( 9 ) ]
+    batch = module.RecordBatch( Tick, ticks )
+    prices = batch.column( 'price' )
+    assert prices.typecode == 'd'
+    assert sum( prices ) == sum( tick.price for tick in ticks )
+    prices[ 0 ] = 100.0 # copy
+    assert batch[ 0 ].price == 0.0
+    assert list( batch.filter( 'active', lambda active: active is True ) ) == (
+        ticks[ : : 3 ] )
+    doubled = batch.transform( 'price', lambda price: price * 2 )
+    assert [ tick.price for tick in doubled ] == [ i for i in range( 9 ) ]
+    assert list( batch.take( ( 8, 0, -2 ) ) ) == (
+        [ ticks[ 8 ], ticks[ 0 ], ticks[ 7 ] ] )
+    with pytest.raises( exceptions.RecordAbsence ):
+        batch.take( ( 9, ) )
+    with pytest.raises( exceptions.RecordFieldAbsence ):
+        batch.column( 'volume' )
+    trades = module.RecordBatch( Trade, (
+        Trade( symbol = str( i ), quantity = i ) for i in range( 3 ) ) )
+    assert trades.column( 'symbol' ) == [ '0', '1', '2' ]
+    assert trades.filter( 'symbol', '1'.__eq__ )[ 0 ].quantity == 1
+
+
+def test_420_record_batch_invalidity( ):
+    ''' Batches refuse foreign instances and are unchanged by them. '''
+    module = cache_import_module( MODULE_QNAME )
+    classes = cache_import_module( f"{PACKAGE_NAME}.standard.classes" )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    Tick, Trade = _produce_record_classes( )
+
+    class Empty( classes.DataclassObject ): pass
+
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        module.RecordBatch( Empty )
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        module.RecordBatch( object )
+    trade = Trade( symbol = 'A', quantity = 1, note = b'n' )
+    batch = module.RecordBatch( Trade, [ trade ] )
+    with pytest.raises( exceptions.RecordSchemaInvalidity ):
+        batch.append( Tick( sequence = 1, price = 0.0 ) )
+    with pytest.raises( OverflowError ):
+        batch.extend( (
+            Trade( symbol = 'B', quantity = 2 ),
+            Trade( symbol = 'C', quantity = 2 ** 64 ) ) )
+    assert list( batch ) == [ trade ]
+    batch.append( Trade( symbol = 'D', quantity = 4 ) )
+    assert batch[ 1 ].symbol == 'D'
+
+
+def test_430_record_batch_pickling( sharing_module ):
+    ''' Batches are pickled as columns. '''
+    module = cache_import_module( MODULE_QNAME )
+    Trade = sharing_module.Trade
+    trades = [ Trade( symbol = str( i ), quantity = i ) for i in range( 50 ) ]
+    batch = pickle.loads( pickle.dumps( # noqa: S301
+        module.RecordBatch( Trade, trades ) ) )
+    assert list( batch ) == trades
@@ -0,0 +1,111 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert isolation of package across subinterpreters. '''
+
+
+import threading
+
+from textwrap import dedent
+
+import pytest
+
+from .__ import PACKAGE_NAME
+
+
+INTERPRETERS_COUNT = 3
+
+
+WORKLOAD = dedent( f'''
+    import types
+    import {PACKAGE_NAME}.exceptions as exceptions
+    import {PACKAGE_NAME}.standard as standard
+
+    class Point( standard.DataclassObject ):
+        x: float
+        y: float
+
+    class Registry( standard.Object ):
+        def __init__( self ) -> None:
+            self.entries = ( )
+
+    class Sized( standard.Protocol ):
+        def size( self ) -> int: ...
+
+    point = Point( x = 1.0, y = 2.0 )
+    try: point.x = 3.0
+    except exceptions.AttributeImmutability: pass
+    else: raise AssertionError( 'Mutable dataclass instance.' )
+    try: Registry( ).entries = ( 1, )
+    except exceptions.AttributeImmutability: pass
+    else: raise AssertionError( 'Mutable instance.' )
+    deferrals = standard.modules._module_docstrings_deferrals
+    if 'workload' in deferrals: raise AssertionError( 'Leaked deferral.' )
+    names = set( deferrals )
+    module = types.ModuleType( 'workload' )
+    standard.finalize_module( module, dynadoc_defer = True )
+    if set( deferrals ) - names != {{ 'workload' }}:
+        raise AssertionError( 'Unexpected deferrals.' )
+''' )
+
+
+def _produce_interpreter_runner( ):
+    ''' Returns function which runs code in fresh isolated interpreter. '''
+    try: from concurrent import interpreters # Python 3.14+
+    except ImportError: pass
+    else:
+
+        def run( code ):
+            interpreter = interpreters.create( )
+            try: interpreter.exec( code )
+            finally: interpreter.close( )
+
+        return run
+    try: import _interpreters # Python 3.13
+    except ImportError: pytest.skip( "Subinterpreters not available." )
+
+    def run_( code ):
+        interpreter = _interpreters.create( 'isolated' )
+        try: failure = _interpreters.exec( interpreter, code )
+        finally: _interpreters.destroy( interpreter )
+        if failure is not None: raise RuntimeError( failure )
+
+    return run_
+
+
+def test_100_workloads_in_parallel_interpreters( ):
+    ''' Standard workloads run in parallel isolated interpreters. '''
+    from importlib import import_module
+    run = _produce_interpreter_runner( )
+    modules = import_module( f"{PACKAGE_NAME}.standard.modules" )
+    deferrals = dict( modules._module_docstrings_deferrals )
+    failures = [ ]
+
+    def work( ):
+        try: run( WORKLOAD )
+        except Exception as exc: failures.append( exc )
+
+    threads = tuple(
+        threading.Thread( target = work )
+        for _ in range( INTERPRETERS_COUNT ) )
+    for thread in threads: thread.start( )
+    for thread in threads: thread.join( )
+    assert not failures
+    assert modules._module_docstrings_deferrals == deferrals
@@ -0,0 +1,961 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert performance budgets and report benchmarks. '''
+
+
+import copy
+import dataclasses
+import enum
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import tracemalloc
+import types
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+pytestmark = pytest.mark.slow
+
+
+BATCH_COUNT = 100_000
+CONVERSION_COUNT = 2_000
+CONVERSION_TRIALS = 5
+ENUM_LOOKUP_COUNT = 200_000
+ENUM_LOOKUP_TRIALS = 5
+COPYING_COUNT = 2_000
+COPYING_TRIALS = 5
+HASHING_COUNT = 20_000
+HASHING_TRIALS = 5
+IMPORT_BUDGET_MICROSECONDS = 75_000
+IMPORT_FORBIDDENS = ( 'array', 'asyncio', 'mmap', 'platform' )
+IMPORT_TRIALS = 5
+INTERNING_COUNT = 50_000
+INTERNING_DISTINCTS = 100
+MODELS_COUNT = 200
+MODELS_RATIO_MAXIMUM = 1.1 # relative to Dynadoc evaluation of annotations
+MODELS_TRIALS = 5
+PACKING_COUNT = 100_000
+PACKING_SAVINGS_MINIMUM = 96 # bytes per instance
+PICKLING_COUNT = 10_000
+PICKLING_RATIO_MAXIMUM = 1.5 # relative to frozen slotted dataclasses
+PICKLING_TRIALS = 5
+PROTOCOLS_CHECKS_COUNT = 20_000
+PROTOCOLS_CHECKS_SPEEDUP_MINIMUM = 1.5 # relative to uncached checks
+PROTOCOLS_CHECKS_TRIALS = 5
+PROTOCOLS_COUNT = 50_000
+PROTOCOLS_RATIO_MAXIMUM = 1.25 # relative to non-protocol standard classes
+PROTOCOLS_TRIALS = 5
+RECORDS_COUNT = 10_000
+RECORDS_TRIALS = 5
+RECORD_STORE_COUNT = 100_000
+RECORD_STORE_PROBES = 1_000
+REPLACEMENT_COUNT = 20_000
+REPLACEMENT_TRIALS = 5
+SCALING_EFFICIENCY_MINIMUM = 0.5 # only asserted without GIL
+SCALING_ITERATIONS = 10_000
+SCALING_THREADS_MAXIMUM = 4
+SHARING_COUNT = 50_000
+SLOTTING_COUNT = 100_000
+SLOTTING_SAVINGS_MINIMUM = 32 # bytes per instance
+TUPLECLASS_COUNT = 50_000
+TUPLECLASS_TRIALS = 5
+
+
+def _measure_copying( items ):
+    ''' Returns best time to deeply copy items. '''
+    times = [ ]
+    for _ in range( COPYING_TRIALS ):
+        then = time.perf_counter( )
+        copy.deepcopy( items )
+        times.append( time.perf_counter( ) - then )
+    return min( times )
+
+
+def _measure_construction( greeting_class, label_class, location_class ):
+    times = [ ]
+    for _ in range( PROTOCOLS_TRIALS ):
+        then = time.perf_counter( )
+        for i in range( PROTOCOLS_COUNT ):
+            greeting_class( )
+            label_class( 'label' )
+            location_class( x = i )
+        times.append( time.perf_counter( ) - then )
+    return min( times )
+
+
+def _measure_models_import( path, preparation = '' ):
+    ''' Returns best time to import models after preparation, if any. '''
+    script = (
+        "import time; import sys; "
+        f"sys.path.insert( 0, {str( path )!r} ); "
+        f"import {PACKAGE_NAME}; {preparation}"
+        "then = time.perf_counter_ns( ); import models; "
+        "print( ( time.perf_counter_ns( ) - then ) // 1000 )" )
+    return min(
+        int( subprocess.run( # noqa: S603
+            ( sys.executable, '-W', 'ignore', '-c', script ),
+            capture_output = True, check = True, text = True ).stdout )
+        for _ in range( MODELS_TRIALS ) )
+
+
+def _measure_protocol_checks( protocols ):
+
+    class Greeting:
+        def greet( self ) -> str: return 'hello'
+
+    class Label:
+        def __init__( self ): self.text = 'label'
+
+    class Sizing:
+        def size( self ) -> int: return 0
+
+    class Plain: pass
+
+    plugins = ( Greeting( ), Label( ), Sizing( ), Plain( ) )
+    times = [ ]
+    for _ in range( PROTOCOLS_CHECKS_TRIALS ):
+        then = time.perf_counter( )
+        for _ in range( PROTOCOLS_CHECKS_COUNT ):
+            for plugin in plugins:
+                for protocol in protocols: isinstance( plugin, protocol )
+        times.append( time.perf_counter( ) - then )
+    return min( times )
+
+
+def _measure_pickling( items ):
+    ''' Returns best times to pickle and to unpickle items. '''
+    dumps_times = [ ]
+    loads_times = [ ]
+    for _ in range( PICKLING_TRIALS ):
+        then = time.perf_counter( )
+        data = pickle.dumps( items )
+        dumps_times.append( time.perf_counter( ) - then )
+        then = time.perf_counter( )
+        pickle.loads( data ) # noqa: S301
+        loads_times.append( time.perf_counter( ) - then )
+    return min( dumps_times ), min( loads_times )
+
+
+def _produce_construction_classes( base, base_mutable, base_data, *mixins ):
+
+    class Greeter( base, *mixins ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    class Labeler( base_mutable, *mixins ):
+        def label( self ) -> str: raise NotImplementedError
+
+    class Point( base_data, *mixins ):
+        x: int
+
+    class Greeting( Greeter ):
+        def greet( self ) -> str: return 'hello'
+
+    class Label( Labeler ):
+        def __init__( self, text: str ): self.text = text
+        def label( self ) -> str: return self.text
+
+    class Location( Point ):
+        y: int = 0
+
+    return Greeting, Label, Location
+
+
+def _produce_runtime_protocols( *bases ):
+    import typing_extensions as typx
+
+    @typx.runtime_checkable
+    class Greeter( *bases ):
+        def greet( self ) -> str: raise NotImplementedError
+
+    @typx.runtime_checkable
+    class Labeler( *bases ):
+        text: str
+
+    @typx.runtime_checkable
+    class Sizer( *bases ):
+        def size( self ) -> int: raise NotImplementedError
+
+    return Greeter, Labeler, Sizer
+
+
+def _produce_models_source( count ):
+    ''' Returns source of module with forward-referencing dataclasses. '''
+    lines = [ f"from {PACKAGE_NAME}.standard import DataclassObject" ]
+    for i in range( count ):
+        lines.extend( (
+            f"class Model{i}( DataclassObject ):",
+            f"    successor: Model{i + 1} | None = None",
+            f"    siblings: tuple[ Model{( i + 7 ) % count}, ... ] = ( )", ) )
+    lines.append( f"class Model{count}( DataclassObject ): pass" )
+    return '\n'.join( lines )
+
+
+def _exercise_instances( cls, count ):
+    ''' Creates and mutates standard instances. '''
+    for i in range( count ):
+        record = cls( identifier = i )
+        record.note = 'mutated'
+        dir( record )
+
+
+def _measure_records( instances, dumps = None, loads = None ):
+    if dumps is None or loads is None:
+        module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+        codec = module.produce_record_codec( type( instances[ 0 ] ) )
+        assert codec.decode_many( codec.encode_many( instances ) ) == (
+            instances )
+        dumps, loads = codec.encode_many, codec.decode_many
+    times_d: list[ float ] = [ ]
+    times_l: list[ float ] = [ ]
+    for _ in range( RECORDS_TRIALS ):
+        then = time.perf_counter( )
+        data = dumps( instances )
+        times_d.append( time.perf_counter( ) - then )
+        then = time.perf_counter( )
+        loads( data )
+        times_l.append( time.perf_counter( ) - then )
+    return min( times_d ), min( times_l ), len( data )
+
+
+def _measure_record_store_access( load, probes ):
+    tracemalloc.start( )
+    try:
+        then = time.perf_counter( )
+        records = load( )
+        probed = [ records[ probe ] for probe in probes ]
+        elapsed = time.perf_counter( ) - then
+        _, peak = tracemalloc.get_traced_memory( )
+    finally: tracemalloc.stop( )
+    if hasattr( records, 'close' ): records.close( )
+    return elapsed, peak, probed
+
+
+def _measure_threads_throughput( cls, threads_count ):
+    ''' Returns instances workload throughput for number of threads. '''
+    barrier = threading.Barrier( threads_count + 1 )
+
+    def work( ):
+        barrier.wait( )
+        _exercise_instances( cls, SCALING_ITERATIONS )
+
+    threads = tuple(
+        threading.Thread( target = work ) for _ in range( threads_count ) )
+    for thread in threads: thread.start( )
+    barrier.wait( )
+    then = time.perf_counter( )
+    for thread in threads: thread.join( )
+    elapsed = time.perf_counter( ) - then
+    return threads_count * SCALING_ITERATIONS / elapsed
+
+
+def _survey_import_times( module_name ):
+    ''' Returns self and cumulative import times by module name. '''
+    result = subprocess.run( # noqa: S603
+        ( sys.executable, '-X', 'importtime', '-c', f"import {module_name}" ),
+        capture_output = True, check = True, text = True )
+    times = { }
+    for line in result.stderr.splitlines( ):
+        if not line.startswith( 'import time:' ): continue
+        self_, cumulative, name = line[ 12 : ].split( '|' )
+        try: times[ name.strip( ) ] = ( int( self_ ), int( cumulative ) )
+        except ValueError: continue # header
+    return times
+
+
+@pytest.mark.skipif(
+    'cpython' != sys.implementation.name,
+    reason = "Import time report is specific to CPython." )
+def test_100_import_budget( ):
+    ''' Package import stays within budget and avoids heavy modules. '''
+    surveys = tuple(
+        _survey_import_times( PACKAGE_NAME )
+        for _ in range( IMPORT_TRIALS ) )
+    for name in IMPORT_FORBIDDENS:
+        assert name not in surveys[ 0 ], f"Eager import of {name!r}."
+    prefix = f"{PACKAGE_NAME}."
+    totals = tuple(
+        sum(
+            self_ for name, ( self_, _ ) in survey.items( )
+            if name == PACKAGE_NAME or name.startswith( prefix ) )
+        for survey in surveys )
+    total = min( totals )
+    print(
+        f"\nImport time of {PACKAGE_NAME!r} modules: {total} us "
+        f"(budget: {IMPORT_BUDGET_MICROSECONDS} us)" )
+    assert total <= IMPORT_BUDGET_MICROSECONDS
+
+
+@pytest.mark.skipif(
+    sys.version_info < ( 3, 14 ), reason = "Requires deferred annotations." )
+def test_200_forward_references_construction( tmp_path ):
+    ''' Presenting forward references to Dynadoc costs no time. '''
+    source = _produce_models_source( MODELS_COUNT )
+    ( tmp_path / 'models.py' ).write_text( source )
+    # Without presentation, Dynadoc evaluates annotations and reports
+    # unresolvable forward references.
+    presentation_disabled = (
+        f"import {PACKAGE_NAME}.standard.dynadoc as dynadoc; "
+        "dynadoc._detect_annotations_cache_override = lambda: False; " )
+    presented = _measure_models_import( tmp_path )
+    evaluated = _measure_models_import(
+        tmp_path, preparation = presentation_disabled )
+    print(
+        f"\nConstruction time of {MODELS_COUNT} forward-referencing "
+        "dataclasses (deferred annotations):" )
+    print( f"  presented to Dynadoc: {presented} us" )
+    print( f"  evaluated by Dynadoc: {evaluated} us" )
+    assert presented <= evaluated * MODELS_RATIO_MAXIMUM
+
+
+def test_300_threads_scaling( ):
+    ''' Reports scaling efficiency of instances workload across threads. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Record( module.DataclassObject, instances_mutables = ( 'note', ) ):
+        identifier: int
+        note: str = ''
+
+    threads_maximum = min( SCALING_THREADS_MAXIMUM, os.cpu_count( ) or 1 )
+    _exercise_instances( Record, 100 ) # warmup
+    baseline = _measure_threads_throughput( Record, 1 )
+    gil_enabled = getattr( sys, '_is_gil_enabled', lambda: True )( )
+    print( f"\nInstances workload scaling (GIL enabled: {gil_enabled}):" )
+    print( f"  1 thread: {baseline:.0f} ops/s" )
+    efficiency = 1.0
+    for threads_count in range( 2, threads_maximum + 1 ):
+        throughput = _measure_threads_throughput( Record, threads_count )
+        efficiency = throughput / ( baseline * threads_count )
+        print(
+            f"  {threads_count} threads: {throughput:.0f} ops/s, "
+            f"efficiency {efficiency:.0%}" )
+    if not gil_enabled:
+        assert efficiency >= SCALING_EFFICIENCY_MINIMUM
+
+
+def test_400_pickling_throughput( ):
+    ''' Pickling of immutable dataclasses is on par with standard library. '''
+    name = '_classcore_pickling_benchmark'
+    module = types.ModuleType( name )
+    sys.modules[ name ] = module
+    source = textwrap.dedent( f'''
+        import dataclasses
+        import {PACKAGE_NAME}.standard as ccstd
+
+        class Record( ccstd.DataclassObject ):
+            identifier: int
+            weight: float
+            label: str
+
+        @dataclasses.dataclass( frozen = True, slots = True )
+        class RecordReference:
+            identifier: int
+            weight: float
+            label: str
+    ''' )
+    try:
+        exec( source, module.__dict__ ) # noqa: S102
+        times = {
+            cls.__name__: _measure_pickling( [
+                cls( identifier = i, weight = i / 2, label = str( i ) )
+                for i in range( PICKLING_COUNT ) ] )
+            for cls in ( module.Record, module.RecordReference ) }
+    finally: del sys.modules[ name ]
+    print( f"\nPickling of {PICKLING_COUNT} instances (dumps, loads):" )
+    for name_, ( dumps_time, loads_time ) in times.items( ):
+        print( f"  {name_}: {dumps_time:.4f} s, {loads_time:.4f} s" )
+    for ours, theirs in zip( times[ 'Record' ], times[ 'RecordReference' ] ):
+        assert ours <= theirs * PICKLING_RATIO_MAXIMUM
+
+
+def test_410_copying_throughput( ):
+    ''' Deep copies of immutable configurations are cheap. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Endpoint( module.DataclassObject ):
+        host: str
+        port: int
+        options: tuple[ str, ... ] = ( )
+
+    class Configuration( module.DataclassObject ):
+        name: str
+        endpoints: tuple[ Endpoint, ... ]
+
+    @dataclasses.dataclass( frozen = True, slots = True )
+    class EndpointReference:
+        host: str
+        port: int
+        options: tuple[ str, ... ] = ( )
+
+    @dataclasses.dataclass( frozen = True, slots = True )
+    class ConfigurationReference:
+        name: str
+        endpoints: tuple[ EndpointReference, ... ]
+
+    def produce( configuration_class, endpoint_class ):
+        return [
+            configuration_class(
+                name = str( i ),
+                endpoints = tuple(
+                    endpoint_class(
+                        host = f"h{j}", port = j, options = ( 'tls', ) )
+                    for j in range( 3 ) ) )
+            for i in range( COPYING_COUNT ) ]
+
+    configurations = produce( Configuration, Endpoint )
+    replicas = copy.deepcopy( configurations )
+    assert all(
+        replica is original for replica, original
+        in zip( replicas, configurations ) )
+    ours = _measure_copying( configurations )
+    theirs = _measure_copying(
+        produce( ConfigurationReference, EndpointReference ) )
+    print( f"\nDeep copying of {COPYING_COUNT} configurations:" )
+    print( f"  Configuration: {ours:.4f} s" )
+    print( f"  ConfigurationReference: {theirs:.4f} s" )
+    assert ours <= theirs
+
+
+def test_420_hashing_throughput( ):
+    ''' Lookups of composite keys with cached hashes are fast. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Region( module.DataclassObject, instances_hash_cache = True ):
+        name: str
+        zone: int
+
+    class Key( module.DataclassObject, instances_hash_cache = True ):
+        currency: str
+        region: Region
+        code: int
+
+    @dataclasses.dataclass( frozen = True, slots = True )
+    class RegionReference:
+        name: str
+        zone: int
+
+    @dataclasses.dataclass( frozen = True, slots = True )
+    class KeyReference:
+        currency: str
+        region: RegionReference
+        code: int
+
+    def measure( key_class, region_class ):
+        regions = [
+            region_class( name = str( i ), zone = i ) for i in range( 50 ) ]
+        keys = [
+            key_class( currency = 'USD', region = regions[ i % 50 ], code = i )
+            for i in range( HASHING_COUNT ) ]
+        table = { key: i for i, key in enumerate( keys ) }
+        members = set( keys )
+        times = [ ]
+        for _ in range( HASHING_TRIALS ):
+            then = time.perf_counter( )
+            for key in keys:
+                assert key in members
+                table[ key ]
+            times.append( time.perf_counter( ) - then )
+        return min( times )
+
+    ours = measure( Key, Region )
+    theirs = measure( KeyReference, RegionReference )
+    print( f"\nLookups of {HASHING_COUNT} composite keys:" )
+    print( f"  Key: {ours:.4f} s" )
+    print( f"  KeyReference: {theirs:.4f} s" )
+    assert ours <= theirs
+
+
+def test_430_interning_memory( ):
+    ''' Interning collapses duplicate values to canonical instances. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Region( module.DataclassObject, instances_intern = True ):
+        name: str
+        zone: int
+
+    class RegionReference( module.DataclassObject ):
+        name: str
+        zone: int
+
+    def measure( cls ):
+        tracemalloc.start( )
+        try:
+            regions = [
+                cls( name = 'region', zone = i % INTERNING_DISTINCTS )
+                for i in range( INTERNING_COUNT ) ]
+            size, _ = tracemalloc.get_traced_memory( )
+        finally: tracemalloc.stop( )
+        assert len( regions ) == INTERNING_COUNT
+        return size
+
+    ours = measure( Region )
+    theirs = measure( RegionReference )
+    print( f"\nMemory for {INTERNING_COUNT} regions:" )
+    print( f"  Region: {ours // 1024} KiB" )
+    print( f"  RegionReference: {theirs // 1024} KiB" )
+    assert ours * 4 <= theirs
+
+
+def test_440_replacement_throughput( ):
+    ''' Replacement of fields is faster than via dataclasses module. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Event( module.DataclassObject ):
+        stream: str
+        kind: str
+        sequence: int
+        payload: tuple[ int, ... ] = ( )
+
+    event = Event( stream = 'orders', kind = 'opened', sequence = 0 )
+
+    def measure( replace ):
+        times = [ ]
+        for _ in range( REPLACEMENT_TRIALS ):
+            then = time.perf_counter( )
+            for i in range( REPLACEMENT_COUNT ):
+                replace( event, sequence = i )
+            times.append( time.perf_counter( ) - then )
+        return min( times )
+
+    ours = measure( module.replace )
+    theirs = measure( dataclasses.replace )
+    print( f"\nReplacements of {REPLACEMENT_COUNT} event sequences:" )
+    print( f"  standard replace: {ours:.4f} s" )
+    print( f"  dataclasses.replace: {theirs:.4f} s" )
+    assert ours * 2 <= theirs
+
+
+def test_450_conversion_throughput( ):
+    ''' Conversion to dictionaries is faster than via dataclasses module. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Money( module.DataclassObject ):
+        amount: int
+        currency: str
+
+    class Line( module.DataclassObject ):
+        sku: str
+        price: Money
+        tags: tuple[ str, ... ] = ( )
+
+    class Order( module.DataclassObject ):
+        ident: str
+        lines: list[ Line ]
+
+    orders = [
+        Order(
+            ident = str( i ),
+            lines = [
+                Line(
+                    sku = str( j ),
+                    price = Money( amount = j, currency = 'USD' ),
+                    tags = ( 'a', 'b' ) )
+                for j in range( 3 ) ] )
+        for i in range( CONVERSION_COUNT ) ]
+
+    def measure( asdict ):
+        times = [ ]
+        for _ in range( CONVERSION_TRIALS ):
+            then = time.perf_counter( )
+            for order in orders: asdict( order )
+            times.append( time.perf_counter( ) - then )
+        return min( times )
+
+    assert module.asdict( orders[ 0 ] )[ 'lines' ][ 0 ][ 'price' ] == (
+        { 'amount': 0, 'currency': 'USD' } )
+    ours = measure( module.asdict )
+    theirs = measure( dataclasses.asdict )
+    print( f"\nConversions of {CONVERSION_COUNT} orders to dictionaries:" )
+    print( f"  standard asdict: {ours:.4f} s" )
+    print( f"  dataclasses.asdict: {theirs:.4f} s" )
+    assert ours * 2 <= theirs
+
+
+def test_460_records_throughput( ):
+    ''' Binary records are faster and smaller than pickles. '''
+    name = '_classcore_records_benchmark'
+    module = types.ModuleType( name )
+    sys.modules[ name ] = module
+    source = textwrap.dedent( f'''
+        import {PACKAGE_NAME}.standard as ccstd
+
+        class Tick( ccstd.DataclassObject ):
+            sequence: int
+            price: float
+            active: bool = True
+
+        class Quote( ccstd.DataclassObject ):
+            sequence: int
+            price: float
+            symbol: str
+    ''' )
+    try:
+        exec( source, module.__dict__ ) # noqa: S102
+        ticks = [
+            module.Tick( sequence = i, price = i / 4 )
+            for i in range( RECORDS_COUNT ) ]
+        quotes = [
+            module.Quote( sequence = i, price = i / 4, symbol = 'ABC' )
+            for i in range( RECORDS_COUNT ) ]
+        results = {
+            label: ( _measure_records( instances ), _measure_records(
+                instances, pickle.dumps, pickle.loads ) )
+            for label, instances in (
+                ( 'Tick', ticks ), ( 'Quote', quotes ) ) }
+    finally: del sys.modules[ name ]
+    print( f"\nRecords for {RECORDS_COUNT} instances (encode, decode, size):" )
+    for label, ( ours, theirs ) in results.items( ):
+        for label_, ( encoding, decoding, size ) in (
+            ( 'RecordCodec', ours ), ( 'pickle', theirs )
+        ): print(
+            f"  {label} {label_}: "
+            f"{encoding:.4f} s, {decoding:.4f} s, {size} B" )
+    # Fixed-size records are the common case; others are only reported.
+    ours, theirs = results[ 'Tick' ]
+    for ours_, theirs_ in zip( ours, theirs ): assert ours_ <= theirs_
+    ours, theirs = results[ 'Quote' ]
+    assert ours[ 2 ] <= theirs[ 2 ]
+
+
+def test_470_record_store_access( tmp_path ):
+    ''' Sparse access to mapped record stores avoids loading datasets. '''
+    name = '_classcore_record_store_benchmark'
+    module = types.ModuleType( name )
+    sys.modules[ name ] = module
+    source = textwrap.dedent( f'''
+        import {PACKAGE_NAME}.standard as ccstd
+
+        class Tick( ccstd.DataclassObject ):
+            sequence: int
+            price: float
+            active: bool = True
+    ''' )
+    store_path = tmp_path / 'ticks.records'
+    pickle_path = tmp_path / 'ticks.pickle'
+    probes = [
+        i * 7919 % RECORD_STORE_COUNT for i in range( RECORD_STORE_PROBES ) ]
+    try:
+        exec( source, module.__dict__ ) # noqa: S102
+        standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+        Tick = module.Tick
+        ticks = [
+            Tick( sequence = i, price = i / 4 )
+            for i in range( RECORD_STORE_COUNT ) ]
+        standard.write_record_store( store_path, Tick, ticks )
+        pickle_path.write_bytes( pickle.dumps( ticks ) )
+        del ticks
+
+        def load_pickle( ):
+            return pickle.loads( pickle_path.read_bytes( ) ) # noqa: S301
+
+        ours = _measure_record_store_access(
+            lambda: standard.open_record_store( store_path, Tick ), probes )
+        theirs = _measure_record_store_access( load_pickle, probes )
+    finally: del sys.modules[ name ]
+    assert ours[ 2 ] == theirs[ 2 ]
+    print(
+        f"\nAccess to {RECORD_STORE_PROBES} of {RECORD_STORE_COUNT} "
+        "records (time, peak memory):" )
+    for label, ( elapsed, peak, _ ) in (
+        ( 'RecordStore', ours ), ( 'pickle', theirs )
+    ): print( f"  {label}: {elapsed:.4f} s, {peak // 1024} KiB" )
+    assert ours[ 0 ] <= theirs[ 0 ]
+    assert ours[ 1 ] * 10 <= theirs[ 1 ]
+
+
+def test_480_shared_records_memory( ):
+    ''' Workers attach to shared records instead of copying instances. '''
+    name = '_classcore_sharing_benchmark'
+    module = types.ModuleType( name )
+    sys.modules[ name ] = module
+    source = textwrap.dedent( f'''
+        import {PACKAGE_NAME}.standard as ccstd
+
+        class Quote( ccstd.DataclassObject ):
+            sequence: int
+            price: float
+            symbol: str
+    ''' )
+
+    def measure( payload ):
+        # Unpickling is what each worker of a process pool does.
+        tracemalloc.start( )
+        try:
+            value = pickle.loads( payload ) # noqa: S301
+            _, peak = tracemalloc.get_traced_memory( )
+        finally: tracemalloc.stop( )
+        return value, peak
+
+    try:
+        exec( source, module.__dict__ ) # noqa: S102
+        standard = cache_import_module( f"{PACKAGE_NAME}.standard" )
+        quotes = [
+            module.Quote( sequence = i, price = i / 4, symbol = 'ABC' )
+            for i in range( SHARING_COUNT ) ]
+        store = standard.share_records( module.Quote, quotes )
+        try:
+            handle, ours = measure( pickle.dumps( store ) )
+            assert handle[ -1 ] == quotes[ -1 ]
+            handle.close( )
+        finally:
+            store.unlink( )
+            store.close( )
+        _, theirs = measure( pickle.dumps( quotes ) )
+    finally: del sys.modules[ name ]
+    print( f"\nMemory per worker for {SHARING_COUNT} quotes:" )
+    print( f"  SharedRecordStore: {ours // 1024} KiB" )
+    print( f"  pickled instances: {theirs // 1024} KiB" )
+    assert ours * 100 <= theirs
+
+
+def test_490_record_batch_memory( ):
+    ''' Columnar batches hold instances in fraction of their memory. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Quote( module.DataclassObject ):
+        sequence: int
+        price: float
+        symbol: str
+
+    def measure( produce ):
+        tracemalloc.start( )
+        try:
+            value = produce( )
+            size, _ = tracemalloc.get_traced_memory( )
+        finally: tracemalloc.stop( )
+        return value, size
+
+    def produce_quotes( ):
+        return (
+            Quote( sequence = i, price = i / 4, symbol = f"S{i % 500}" )
+            for i in range( BATCH_COUNT ) )
+
+    batch, ours = measure(
+        lambda: module.RecordBatch( Quote, produce_quotes( ) ) )
+    quotes, theirs = measure( lambda: list( produce_quotes( ) ) )
+    assert list( batch[ -3 : ] ) == quotes[ -3 : ]
+    then = time.perf_counter( )
+    total = sum( batch.column( 'price' ) )
+    column_time = time.perf_counter( ) - then
+    then = time.perf_counter( )
+    assert total == sum( quote.price for quote in quotes )
+    attribute_time = time.perf_counter( ) - then
+    print( f"\nMemory for {BATCH_COUNT} quotes:" )
+    print( f"  RecordBatch: {ours // 1024} KiB" )
+    print( f"  instances: {theirs // 1024} KiB" )
+    print(
+        f"Sum of prices: column {column_time:.4f} s, "
+        f"attributes {attribute_time:.4f} s" )
+    assert ours * 4 <= theirs
+
+
+def test_500_packing_memory( ):
+    ''' Packed numeric fields take less memory than slotted values. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Bar( module.DataclassObject, instances_packed = True ):
+        timestamp: int
+        volume: int
+        opening: float
+        closing: float
+        low: float
+        high: float
+
+    class BarReference( module.DataclassObject ):
+        timestamp: int
+        volume: int
+        opening: float
+        closing: float
+        low: float
+        high: float
+
+    def measure( cls ):
+        tracemalloc.start( )
+        try:
+            bars = [
+                cls(
+                    timestamp = 1_700_000_000_000 + i, volume = 2 ** 40 + i,
+                    opening = i / 3, closing = i / 5,
+                    low = i / 7, high = i / 2 )
+                for i in range( PACKING_COUNT ) ]
+            size, _ = tracemalloc.get_traced_memory( )
+        finally: tracemalloc.stop( )
+        then = time.perf_counter( )
+        total = sum( bar.closing for bar in bars )
+        return bars, total, size, time.perf_counter( ) - then
+
+    bars, total, ours, our_time = measure( Bar )
+    bars_, total_, theirs, their_time = measure( BarReference )
+    assert total == total_
+    assert dataclasses.astuple( bars[ -1 ] ) == (
+        dataclasses.astuple( bars_[ -1 ] ) )
+    print( f"\nMemory for {PACKING_COUNT} bars:" )
+    print( f"  Bar: {ours // 1024} KiB" )
+    print( f"  BarReference: {theirs // 1024} KiB" )
+    print(
+        f"Sum of closings: packed {our_time:.4f} s, "
+        f"slotted {their_time:.4f} s" )
+    assert theirs - ours >= PACKING_COUNT * PACKING_SAVINGS_MINIMUM
+
+
+def test_510_slotting_memory( ):
+    ''' Inferred slots take less memory than instance dictionaries. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    def produce_class( slots ):
+
+        class Edge( metaclass = module.Class, instances_slots = slots ):
+            def __init__( self, i ):
+                self.source = i
+                self.target = i + 1
+                self.weight = i / 2
+                self.label = 'edge'
+
+        return Edge
+
+    def measure( cls ):
+        tracemalloc.start( )
+        try:
+            edges = [ cls( i ) for i in range( SLOTTING_COUNT ) ]
+            size, _ = tracemalloc.get_traced_memory( )
+        finally: tracemalloc.stop( )
+        assert edges[ -1 ].target == SLOTTING_COUNT
+        return size
+
+    ours = measure( produce_class( True ) )
+    theirs = measure( produce_class( False ) )
+    print( f"\nMemory for {SLOTTING_COUNT} edges:" )
+    print( f"  slotted: {ours // 1024} KiB" )
+    print( f"  unslotted: {theirs // 1024} KiB" )
+    assert theirs - ours >= SLOTTING_COUNT * SLOTTING_SAVINGS_MINIMUM
+
+
+def test_520_tupleclass_throughput( ):
+    ''' Tuple-backed records construct faster and smaller than dataclasses. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+
+    class Point( module.TupleclassObject ):
+        x: float
+        y: float
+        label: str = ''
+
+    class PointReference( module.DataclassObject ):
+        x: float
+        y: float
+        label: str = ''
+
+    def measure( cls ):
+        construction_times = [ ]
+        access_times = [ ]
+        for _ in range( TUPLECLASS_TRIALS ):
+            then = time.perf_counter( )
+            points = [
+                cls( x = i, y = i, label = 'p' )
+                for i in range( TUPLECLASS_COUNT ) ]
+            construction_times.append( time.perf_counter( ) - then )
+            then = time.perf_counter( )
+            for point in points: point.x + point.y
+            access_times.append( time.perf_counter( ) - then )
+        tracemalloc.start( )
+        try:
+            points = [
+                cls( x = i / 2, y = i / 3 )
+                for i in range( TUPLECLASS_COUNT ) ]
+            size, _ = tracemalloc.get_traced_memory( )
+        finally: tracemalloc.stop( )
+        return min( construction_times ), min( access_times ), size
+
+    ours = measure( Point )
+    theirs = measure( PointReference )
+    print(
+        "\nConstruction, access, and memory "
+        f"for {TUPLECLASS_COUNT} points:" )
+    print(
+        f"  Point: {ours[ 0 ]:.4f} s, {ours[ 1 ]:.4f} s, "
+        f"{ours[ 2 ] // 1024} KiB" )
+    print(
+        f"  PointReference: {theirs[ 0 ]:.4f} s, {theirs[ 1 ]:.4f} s, "
+        f"{theirs[ 2 ] // 1024} KiB" )
+    assert ours[ 0 ] * 2 <= theirs[ 0 ]
+    assert ours[ 2 ] * 2 <= theirs[ 2 ]
+
+
+def test_530_enum_lookup_throughput( ):
+    ''' Lookups of enumeration members by value outpace calls. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    names = tuple( f"CODE{i}" for i in range( 32 ) )
+    values = [ i % len( names ) for i in range( ENUM_LOOKUP_COUNT ) ]
+    Code = module.Enum( 'Code', { name: i for i, name in enumerate( names ) } )
+    CodeReference = enum.Enum(
+        'CodeReference', { name: i for i, name in enumerate( names ) } )
+
+    def measure( lookup ):
+        times = [ ]
+        for _ in range( ENUM_LOOKUP_TRIALS ):
+            then = time.perf_counter( )
+            for value in values: lookup( value )
+            times.append( time.perf_counter( ) - then )
+        return min( times )
+
+    ours = measure( Code.lookup )
+    theirs = measure( CodeReference )
+    print( f"\nLookups of {ENUM_LOOKUP_COUNT} members by value:" )
+    print( f"  Code.lookup: {ours:.4f} s" )
+    print( f"  CodeReference: {theirs:.4f} s" )
+    assert ours * 2 <= theirs
+
+
+def test_540_protocol_construction_throughput( ):
+    ''' Concrete subclasses of protocols construct as fast as others. '''
+    import typing_extensions as typx
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    ours = _measure_construction( *_produce_construction_classes(
+        module.Protocol, module.ProtocolMutable, module.DataclassProtocol,
+        typx.Protocol ) )
+    theirs = _measure_construction( *_produce_construction_classes(
+        module.Object, module.ObjectMutable, module.DataclassObject ) )
+    print( f"\nConstruction of {PROTOCOLS_COUNT} instances of three classes:" )
+    print( f"  protocol subclasses: {ours:.4f} s" )
+    print( f"  reference subclasses: {theirs:.4f} s" )
+    assert ours <= theirs * PROTOCOLS_RATIO_MAXIMUM
+
+
+def test_550_protocol_checks_throughput( ):
+    ''' Runtime checks against protocols outpace uncached checks. '''
+    import typing_extensions as typx
+    module = cache_import_module( f"{PACKAGE_NAME}.standard" )
+    ours = _measure_protocol_checks( _produce_runtime_protocols(
+        module.Protocol, typx.Protocol ) )
+    theirs = _measure_protocol_checks( _produce_runtime_protocols(
+        typx.Protocol ) )
+    print(
+        f"\nDispatch of {PROTOCOLS_CHECKS_COUNT} rounds "
+        "of runtime protocol checks:" )
+    print( f"  standard protocols: {ours:.4f} s" )
+    print( f"  typing_extensions protocols: {theirs:.4f} s" )
+    assert ours * PROTOCOLS_CHECKS_SPEEDUP_MINIMUM <= theirs